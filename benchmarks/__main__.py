@@ -0,0 +1,104 @@
+"""Benchmark the projection pipeline on synthetic data.
+
+Usage:
+    python -m benchmarks run [--rows 1000 10000] [--sources 8] [--league leagues/thedoo.yaml] [-o results.json]
+    python -m benchmarks compare BASELINE.json CURRENT.json [--threshold 0.25]
+    python -m benchmarks run --compare BASELINE.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from .pipeline import benchmark_case, compare, load_leagues
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the projection pipeline.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Run benchmarks and optionally save them as a baseline")
+    run.add_argument("-r", "--rows", type=int, nargs="+", default=[1000, 10000], help="Rows per stat category")
+    run.add_argument("-s", "--sources", type=int, nargs="+", default=[8], help="Projection source counts")
+    run.add_argument("-l", "--league", nargs="+", default=None, help="League YAML files (default: leagues/*.yaml)")
+    run.add_argument("-n", "--repeat", type=int, default=3)
+    run.add_argument("--no-memory", action="store_true", help="Skip the traced run used for peak memory")
+    run.add_argument("--compact", action="store_true", help="Also benchmark with compact dtypes")
+    run.add_argument("-o", "--output", default=None, help="Write results to this JSON file")
+    run.add_argument("--compare", default=None, help="Compare against this baseline JSON file")
+    run.add_argument("--threshold", type=float, default=0.25)
+
+    comp = subparsers.add_parser("compare", help="Compare two benchmark result files")
+    comp.add_argument("baseline")
+    comp.add_argument("current")
+    comp.add_argument("--threshold", type=float, default=0.25)
+
+    return parser.parse_args()
+
+
+def run_benchmarks(args):
+    results = list()
+    with tempfile.TemporaryDirectory() as workdir:
+        for league in load_leagues(args.league):
+            for sources in args.sources:
+                for rows in args.rows:
+                    for compact in [False, True] if args.compact else [False]:
+                        for result in benchmark_case(
+                            league, rows, sources, workdir, args.repeat, not args.no_memory, compact=compact
+                        ):
+                            peak = result.peak_bytes
+                            peak = f"{peak / 1024 / 1024:10.1f} MB" if peak is not None else ""
+                            print(f"{result.key:<60} {result.seconds * 1000:10.1f} ms {peak}", flush=True)
+                            results.append(result.to_dict())
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "results": results,
+    }
+
+
+def print_comparison(rows, threshold):
+    print(f"\n{'benchmark':<60} {'baseline':>10} {'current':>10} {'time':>7} {'memory':>7}")
+    regressions = 0
+    for key, base, result, time_ratio, memory_ratio, regressed in rows:
+        memory = f"{memory_ratio:6.2f}x" if memory_ratio is not None else ""
+        flag = "  REGRESSION" if regressed else ""
+        print(
+            f"{key:<60} {base.seconds * 1000:8.1f}ms {result.seconds * 1000:8.1f}ms "
+            f"{time_ratio:6.2f}x {memory:>7}{flag}"
+        )
+        regressions += regressed
+    print(f"\n{regressions} regression(s) beyond {threshold:.0%}")
+    return regressions
+
+
+def main():
+    args = parse_args()
+    if args.command == "run":
+        current = run_benchmarks(args)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(current, f, indent=2)
+        if not args.compare:
+            return 0
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+
+    regressions = print_comparison(compare(baseline["results"], current["results"], args.threshold), args.threshold)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
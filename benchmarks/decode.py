@@ -0,0 +1,81 @@
+"""Benchmark FanGraphs payload decoding against the previous DataFrame-of-dicts approach.
+
+Usage:
+    python -m benchmarks.decode [PAYLOAD.json] [--stat-category bat|pit]
+
+Without a payload path, the largest payload in the response cache is used.
+"""
+
+import argparse
+import json
+import pathlib
+import time
+import tracemalloc
+
+import pandas as pd
+
+from fantasybaseball.cache import default_cache_dir
+from fantasybaseball.fangraphs import decode_projections
+from fantasybaseball.model import ProjectionSource, ProjectionSourceName, StatCategory
+
+
+def legacy_decode(body, stat_category, projection_source):
+    """The decoding used before the schema-driven decoder, kept for comparison."""
+    projections = pd.DataFrame(json.loads(body))
+    if not projections.empty:
+        projections["ProjectionSource"] = projection_source.value
+        projections["Name"] = projections["PlayerName"]
+        projections.rename(
+            columns={"minpos": "Position", "teamid": "TeamId", "playerids": "FangraphsId", "xMLBAMID": "MlbamId"},
+            inplace=True,
+        )
+        projections["MlbamId"] = pd.to_numeric(projections["MlbamId"], errors="coerce").astype("Int64")
+        projections["FangraphsId"] = pd.to_numeric(projections["FangraphsId"], errors="coerce").astype("Int64")
+        projections.drop(["PlayerName", "TeamId", "."], axis=1, inplace=True, errors="ignore")
+    return projections.infer_objects()
+
+
+def measure(func, *args, repeat=5):
+    """Return (best wall time in seconds, peak traced memory in bytes) for ``func(*args)``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def find_recorded_payload():
+    payloads = [p for p in (default_cache_dir() / "responses").glob("*.json") if not p.name.endswith(".meta.json")]
+    if not payloads:
+        return None
+    return max(payloads, key=lambda p: p.stat().st_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("payload", nargs="?", default=None, help="Path to a recorded FanGraphs payload")
+    parser.add_argument("-s", "--stat-category", default=None, choices=[s.value for s in StatCategory])
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    path = pathlib.Path(args.payload) if args.payload else find_recorded_payload()
+    if path is None:
+        parser.error("no payload given and none found in the response cache")
+    stat_category = StatCategory(args.stat_category or path.name.split("-")[0])
+    projection_source = ProjectionSource(ProjectionSourceName.STEAMER)
+    body = path.read_bytes()
+
+    print(f"Payload: {path} ({len(body) / 1024 / 1024:.1f} MB)")
+    for name, func in [("legacy", legacy_decode), ("schema", decode_projections)]:
+        seconds, peak = measure(func, body, stat_category, projection_source, repeat=args.repeat)
+        print(f"{name:>8}: {seconds * 1000:8.1f} ms  peak {peak / 1024 / 1024:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark merge_with_league_export against the previous merge-then-loop implementation.
+
+Usage:
+    python -m benchmarks.merge [--rows 100000] [--export-players 1000]
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from fantasybaseball.model import StatCategory
+from fantasybaseball.playerids import merge_with_league_export
+
+from .synthetic import generate_league_export, generate_player_id_map, generate_projections
+
+
+def legacy_merge_with_league_export(projections, league_export):
+    """The merge used before the vectorized coalescing join, kept for comparison."""
+    league_export = league_export.copy()
+    league_export["FangraphsId"] = pd.to_numeric(league_export["FangraphsId"], errors="coerce").astype("Int64")
+    league_data = league_export[["Status", "Age", "Salary", "Contract", "MlbamId", "FangraphsId", "FantraxId"]].copy()
+    league_data_mlbam = league_data[league_data["MlbamId"].notna()]
+    merged = projections.merge(league_data_mlbam, on="MlbamId", how="left", suffixes=("_proj", "_league"))
+    unmatched_mask = merged["Status"].isna()
+    if unmatched_mask.any():
+        unmatched_projections = projections[projections.index.isin(merged[unmatched_mask].index)]
+        league_data_fangraphs = league_data[league_data["FangraphsId"].notna()]
+        fangraphs_matches = unmatched_projections.merge(
+            league_data_fangraphs[["Status", "Age", "Salary", "Contract", "FangraphsId", "FantraxId"]],
+            on="FangraphsId",
+            how="inner",
+            suffixes=("", "_fg"),
+        )
+        if not fangraphs_matches.empty:
+            for idx in fangraphs_matches.index:
+                if idx in merged.index:
+                    merged.loc[idx, "Status"] = fangraphs_matches.loc[idx, "Status"]
+                    merged.loc[idx, "Age"] = fangraphs_matches.loc[idx, "Age"]
+                    merged.loc[idx, "Salary"] = fangraphs_matches.loc[idx, "Salary"]
+                    merged.loc[idx, "Contract"] = fangraphs_matches.loc[idx, "Contract"]
+                    merged.loc[idx, "FantraxId"] = fangraphs_matches.loc[idx, "FantraxId"]
+                    if "FangraphsId_league" in merged.columns:
+                        merged.loc[idx, "FangraphsId_league"] = fangraphs_matches.loc[idx, "FangraphsId"]
+    if "FangraphsId_proj" in merged.columns and "FangraphsId_league" in merged.columns:
+        merged["FangraphsId"] = merged["FangraphsId_proj"].fillna(merged["FangraphsId_league"])
+        merged.drop(["FangraphsId_proj", "FangraphsId_league"], axis=1, inplace=True)
+    return merged
+
+
+def generate_inputs(rows, export_players, seed=0):
+    """Synthetic batting projections and a league export already joined to the player ID map."""
+    bat = generate_projections(StatCategory.BATTING, rows, seed=seed)
+    pit = generate_projections(StatCategory.PITCHING, 0, seed=seed)
+    player_id_map = generate_player_id_map(bat, pit)
+    league_export = generate_league_export(bat, pit, export_players=export_players, seed=seed).merge(
+        player_id_map.rename(columns={"MLBID": "MlbamId", "IDFANGRAPHS": "FangraphsId", "FANTRAXID": "FantraxId"})[
+            ["MlbamId", "FangraphsId", "FantraxId"]
+        ],
+        left_on="ID",
+        right_on="FantraxId",
+        how="left",
+    )
+    return bat, league_export
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--export-players", type=int, default=1000)
+    args = parser.parse_args()
+
+    projections, league_export = generate_inputs(args.rows, args.export_players)
+    print(f"{len(projections):,} projection rows, {len(league_export):,} export players")
+    for name, func in [("legacy", legacy_merge_with_league_export), ("vectorized", merge_with_league_export)]:
+        start = time.perf_counter()
+        merged = func(projections, league_export)
+        seconds = time.perf_counter() - start
+        print(f"{name:>10}: {seconds * 1000:10.1f} ms  matched {merged['Status'].notna().sum():,} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Per-stage timings and peak memory of the projection pipeline on synthetic inputs."""
+
+import gc
+import pathlib
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+import yaml
+
+from fantasybaseball.config import load_league_config
+from fantasybaseball.dtypes import compact_projections
+from fantasybaseball.model import StatCategory
+from fantasybaseball.playerids import load_player_id_map, merge_with_league_export
+from fantasybaseball.points import calculate_points
+from fantasybaseball.positions import replace_pitcher_position
+from fantasybaseball.projections import augment_projections
+from fantasybaseball.replacement import calculate_points_above_replacement
+from fantasybaseball.valuation import calculate_auction_values
+
+from .synthetic import generate_league_export, generate_player_id_map, generate_projections
+
+LEAGUES_DIR = pathlib.Path(__file__).resolve().parent.parent / "leagues"
+
+
+@dataclass
+class BenchmarkResult:
+    league: str
+    stage: str
+    rows: int
+    sources: int
+    seconds: float
+    peak_bytes: int = None
+
+    @property
+    def key(self):
+        return f"{self.league}/{self.stage}/{self.rows}x{self.sources}"
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def measure(func, setup=None, repeat=1, memory=True):
+    """Return (result, best wall seconds, peak traced bytes) for ``func(*setup())``.
+
+    Peak memory is taken from a separate traced run so tracemalloc overhead doesn't skew the timings.
+    """
+    result, best = None, float("inf")
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        gc.collect()
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        args = setup() if setup else ()
+        gc.collect()
+        tracemalloc.start()
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return result, best, peak
+
+
+def load_leagues(paths=None):
+    """Load league configs from ``paths``, defaulting to every YAML file in ``leagues/``."""
+    paths = [pathlib.Path(p) for p in paths] if paths else sorted(LEAGUES_DIR.glob("*.yaml"))
+    leagues = list()
+    for path in paths:
+        with open(path) as f:
+            leagues.append(load_league_config(yaml.safe_load(f)))
+    return leagues
+
+
+def benchmark_case(league, rows, sources, workdir, repeat=1, memory=True, seed=0, compact=False):
+    """Benchmark each pipeline stage the league config supports at one (rows, sources) size.
+
+    With ``compact`` the projections use compact dtypes and results are labelled ``<league>+compact``.
+    """
+    workdir = pathlib.Path(workdir)
+    bat = generate_projections(StatCategory.BATTING, rows, sources, seed)
+    pit = generate_projections(StatCategory.PITCHING, rows, sources, seed)
+    if compact:
+        bat, pit = compact_projections(bat), compact_projections(pit)
+    label = f"{league.name}+compact" if compact else league.name
+    roster = league.roster if "roster" in league else None
+    league_export = generate_league_export(bat, pit, roster, seed=seed)
+    player_id_map_path = workdir / f"player_id_map_{rows}x{sources}.csv"
+    generate_player_id_map(bat, pit).to_csv(player_id_map_path, index=False)
+
+    results = list()
+
+    def record(stage, func, setup=None):
+        result, seconds, peak = measure(func, setup, repeat, memory)
+        results.append(BenchmarkResult(label, stage, rows, sources, seconds, peak))
+        return result
+
+    record(
+        "augment_projections",
+        lambda b, p: augment_projections(
+            b, p, league, league_export, player_id_map_path=player_id_map_path, cache_dir=workdir
+        ),
+        lambda: (bat.copy(), pit.copy()),
+    )
+
+    player_id_map = load_player_id_map(player_id_map_path, cache_dir=workdir)
+    export = league_export.merge(
+        player_id_map[["MlbamId", "FangraphsId", "FantraxId"]], left_on="ID", right_on="FantraxId", how="left"
+    )
+    bat, pit = record(
+        "merge_with_league_export",
+        lambda: (merge_with_league_export(bat, export), merge_with_league_export(pit, export)),
+    )
+
+    bat["Points"], pit["Points"] = record(
+        "calculate_points",
+        lambda: (
+            calculate_points(bat, StatCategory.BATTING, league.scoring, use_stat_proxies=True),
+            calculate_points(pit, StatCategory.PITCHING, league.scoring, use_stat_proxies=True),
+        ),
+    )
+    if roster is None:
+        return results
+
+    pit = replace_pitcher_position(pit, roster)
+    bat["PAR"], pit["PAR"] = record(
+        "calculate_points_above_replacement",
+        lambda: (calculate_points_above_replacement(bat, roster), calculate_points_above_replacement(pit, roster)),
+    )
+    if "salary" not in league:
+        return results
+
+    record("calculate_auction_values", lambda: calculate_auction_values(bat, pit, roster, league.salary))
+
+    return results
+
+
+def compare(baseline, current, threshold=0.25):
+    """Pair up results by key and flag any whose time or peak memory grew by more than ``threshold``."""
+    baseline = {BenchmarkResult(**r).key: BenchmarkResult(**r) for r in baseline}
+    rows = list()
+    for result in (BenchmarkResult(**r) for r in current):
+        base = baseline.get(result.key)
+        if base is None:
+            continue
+        time_ratio = result.seconds / base.seconds if base.seconds else float("inf")
+        memory_ratio = None
+        if result.peak_bytes is not None and base.peak_bytes:
+            memory_ratio = result.peak_bytes / base.peak_bytes
+        regressed = time_ratio > 1 + threshold or (memory_ratio is not None and memory_ratio > 1 + threshold)
+        rows.append((result.key, base, result, time_ratio, memory_ratio, regressed))
+    return rows
@@ -0,0 +1,177 @@
+"""Synthetic projection frames, player ID maps and Fantrax-style league exports for benchmarking.
+
+Frames mimic the output of ``fangraphs.get_projections``: one row per (player, projection source) with
+ID, name, team and position columns followed by stat columns. Each source perturbs a shared per-player
+baseline so the consensus and replacement math behaves like it does on real data.
+"""
+
+import numpy as np
+import pandas as pd
+
+from fantasybaseball.model import ProjectionSourceName, StatCategory
+
+TEAMS = ["LAA", "BAL", "BOS", "CHW", "CLE", "DET", "KC", "MIN", "NYY", "OAK", "SEA", "TB", "TEX", "TOR", "ARI",
+         "ATL", "CHC", "CIN", "COL", "MIA", "HOU", "LAD", "MIL", "WAS", "NYM", "PHI", "PIT", "STL", "SD", "SF"]
+BAT_POSITIONS = ["C", "1B", "2B", "3B", "SS", "OF", "OF", "OF", "DH", "1B/3B", "2B/SS", "1B/OF", "2B/3B/SS"]
+PIT_POSITIONS = ["SP", "RP"]
+
+BAT_RATES = {
+    "1B": 0.14, "2B": 0.045, "3B": 0.004, "HR": 0.03, "R": 0.12, "RBI": 0.115, "BB": 0.085, "IBB": 0.005,
+    "SO": 0.22, "HBP": 0.011, "SF": 0.007, "SH": 0.002, "SB": 0.015, "CS": 0.005,
+}
+PIT_RATES = {
+    "H": 0.92, "R": 0.47, "ER": 0.44, "HR": 0.13, "SO": 1.0, "BB": 0.35, "HBP": 0.04,
+}
+
+# Player ID ranges, far apart so batters and pitchers never collide
+BAT_ID_OFFSET = 100_000
+PIT_ID_OFFSET = 500_000
+
+
+def projection_source_names(sources):
+    """The first ``sources`` projection source names, padded with synthetic names past the real ones."""
+    # Consensus sources first so add_mean_projection has something to average
+    names = ["oopsy", "steamer", "thebatx", "thebat", "zipsdc"]
+    names += [p.value for p in ProjectionSourceName if p.value not in names]
+    names += [f"source{i:02d}" for i in range(len(names), sources)]
+    return names[:sources]
+
+
+def _player_ids(players, offset, rng):
+    ids = np.arange(players) + offset
+    # Roughly one in ten players (prospects, recent call-ups) has no MLBAM ID
+    mlbam = np.where(rng.random(players) < 0.1, np.nan, ids + 600_000)
+    return ids, pd.array(mlbam, dtype="Int64"), pd.array(ids + 1, dtype="Int64")
+
+
+def _noisy(baseline, rng, scale=0.08):
+    return np.clip(baseline * rng.normal(1.0, scale, baseline.shape), 0.0, None)
+
+
+def generate_projections(stat_category, rows, sources=8, seed=0):
+    """Return about ``rows`` synthetic projection rows spread over ``sources`` projection sources."""
+    rng = np.random.default_rng(seed + (0 if stat_category == StatCategory.BATTING else 1))
+    source_names = projection_source_names(sources)
+    players = max(rows // len(source_names), 1)
+    batting = stat_category == StatCategory.BATTING
+
+    ids, mlbam, fangraphs = _player_ids(players, BAT_ID_OFFSET if batting else PIT_ID_OFFSET, rng)
+    team = rng.integers(0, len(TEAMS), players)
+    positions = BAT_POSITIONS if batting else PIT_POSITIONS
+    attributes = {
+        "Name": [f"{'Batter' if batting else 'Pitcher'} {i}" for i in ids],
+        "MlbamId": mlbam,
+        "FangraphsId": fangraphs,
+        "Position": np.asarray(positions, dtype=object)[rng.integers(0, len(positions), players)],
+        "Team": np.asarray(TEAMS, dtype=object)[team],
+        "League": np.where(team < 15, "AL", "NL").astype(object),
+        "ShortName": np.asarray(TEAMS, dtype=object)[team],
+    }
+
+    # Skewed playing time so a small pool of regulars sits above many fringe players
+    if batting:
+        volume = 650 * rng.beta(1.2, 2.0, players)
+    else:
+        starter = attributes["Position"] == "SP"
+        volume = np.where(starter, 190, 70) * rng.beta(1.2, 2.0, players)
+
+    adp = (-volume).argsort().argsort() + 1.0
+
+    frames = list()
+    for source in source_names:
+        frame = pd.DataFrame({"ProjectionSource": source, **attributes})
+        if batting:
+            pa = _noisy(volume, rng)
+            stats = {"G": pa / 4.2, "PA": pa, "AB": pa * 0.89}
+            for stat, rate in BAT_RATES.items():
+                stats[stat] = _noisy(pa * rate, rng)
+            stats["H"] = stats["1B"] + stats["2B"] + stats["3B"] + stats["HR"]
+            ab = np.maximum(stats["AB"], 1.0)
+            stats["AVG"] = stats["H"] / ab
+            stats["OBP"] = (stats["H"] + stats["BB"] + stats["HBP"]) / np.maximum(pa, 1.0)
+            stats["SLG"] = (stats["1B"] + 2 * stats["2B"] + 3 * stats["3B"] + 4 * stats["HR"]) / ab
+            stats["OPS"] = stats["OBP"] + stats["SLG"]
+            stats["WAR"] = _noisy(pa / 200, rng)
+        else:
+            ip = _noisy(volume, rng)
+            starter = attributes["Position"] == "SP"
+            stats = {
+                "W": _noisy(ip * 0.06, rng),
+                "L": _noisy(ip * 0.05, rng),
+                "GS": np.where(starter, ip / 5.5, 0.0),
+                "G": np.where(starter, ip / 5.5, ip),
+                "SV": np.where(starter, 0.0, _noisy(ip * 0.15 * rng.random(players), rng)),
+                "HLD": np.where(starter, 0.0, _noisy(ip * 0.2 * rng.random(players), rng)),
+                "IP": ip,
+                "TBF": ip * 4.3,
+            }
+            for stat, rate in PIT_RATES.items():
+                stats[stat] = _noisy(ip * rate, rng)
+            safe_ip = np.maximum(ip, 1.0)
+            stats["ERA"] = stats["ER"] * 9 / safe_ip
+            stats["WHIP"] = (stats["H"] + stats["BB"]) / safe_ip
+            stats["K/9"] = stats["SO"] * 9 / safe_ip
+            stats["BB/9"] = stats["BB"] * 9 / safe_ip
+        stats["ADP"] = _noisy(adp, rng, scale=0.15)
+        frames.append(pd.concat([frame, pd.DataFrame(stats)], axis=1))
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def fantrax_ids(ids):
+    return [f"*{i:05x}*" for i in ids]
+
+
+def generate_player_id_map(bat_projections, pit_projections):
+    """Return an SFBB-style player ID map covering every synthetic player."""
+    players = pd.concat(
+        [bat_projections[["Name", "MlbamId", "FangraphsId"]], pit_projections[["Name", "MlbamId", "FangraphsId"]]]
+    ).drop_duplicates("FangraphsId")
+    return pd.DataFrame(
+        {
+            "PLAYERNAME": players["Name"].to_numpy(),
+            "MLBID": players["MlbamId"].to_numpy(),
+            "IDFANGRAPHS": players["FangraphsId"].to_numpy(),
+            "FANTRAXID": fantrax_ids(players["FangraphsId"].to_numpy(dtype="int64")),
+            "ESPNID": players["FangraphsId"].to_numpy(),
+            "YAHOOID": players["FangraphsId"].to_numpy(),
+        }
+    )
+
+
+def generate_league_export(bat_projections, pit_projections, league_roster=None, export_players=None, seed=0):
+    """Return a Fantrax-style league export.
+
+    Rostered players are drawn from the top of the player pool; the rest of the export is free agents.
+    """
+    rng = np.random.default_rng(seed)
+    teams, roster_spots = 12, 40
+    if league_roster:
+        minors = league_roster.get("minors", 0) if hasattr(league_roster, "get") else league_roster["minors"]
+        teams = league_roster["teams"]
+        roster_spots = sum(league_roster["positions"].values()) + minors
+
+    players = pd.concat(
+        [bat_projections[["FangraphsId", "Position", "ADP"]], pit_projections[["FangraphsId", "Position", "ADP"]]]
+    ).drop_duplicates("FangraphsId")
+    export_players = min(export_players or 2 * teams * roster_spots, len(players))
+    players = players.nsmallest(export_players, "ADP")
+
+    signed = min(teams * roster_spots, export_players)
+    status = np.asarray(["FA"] * export_players, dtype=object)
+    status[:signed] = [f"Team {t + 1}" for t in rng.integers(0, teams, signed)]
+    salary = np.zeros(export_players)
+    salary[:signed] = rng.integers(1, 60, signed)
+
+    fangraphs_ids = players["FangraphsId"].to_numpy(dtype="int64")
+    return pd.DataFrame(
+        {
+            "ID": fantrax_ids(fangraphs_ids),
+            "Player": [f"Player {i}" for i in fangraphs_ids],
+            "Position": players["Position"].str.replace("/", ",").to_numpy(),
+            "Status": status,
+            "Age": rng.integers(20, 40, export_players),
+            "Salary": salary,
+            "Contract": rng.integers(2025, 2030, export_players),
+        }
+    )
@@ -1,5 +1,10 @@
+import numpy as np
 import pandas as pd
 
+from .dtypes import ID_COLUMNS, concat_projections, fill_missing
+
+PLAYER_ATTRIBUTE_COLUMNS = ["Name", "MlbamId", "FangraphsId", "Position", "League", "Team", "ShortName"]
+
 
 def standardize_name_format(name):
     """Converts 'Last, First' name format to 'First Last'."""
@@ -10,35 +15,94 @@ def standardize_name_format(name):
     return name
 
 
-def add_mean_projection(projections, projection_sources=None, name="mean"):
+def player_keys(projections):
+    """Dense integer key per player, shared by all of that player's rows across sources.
+
+    Players are identified by MLBAM ID, by Fangraphs ID (mapped to the MLBAM ID another row pairs it
+    with, when there is one), and finally by name. Non-positive IDs (the -1 that ``add_mean_projection``
+    fills in) and "--" names count as missing; a row with no ID and no name is a player of its own.
+    """
+    mlbam_ids = _positive_ids(projections["MlbamId"])
+    fangraphs_ids = _positive_ids(projections["FangraphsId"])
+    paired = mlbam_ids.notna() & fangraphs_ids.notna()
+    fangraphs_to_mlbam = pd.Series(mlbam_ids[paired].to_numpy(), index=fangraphs_ids[paired].to_numpy())
+    fangraphs_to_mlbam = fangraphs_to_mlbam[~fangraphs_to_mlbam.index.duplicated()]
+    mlbam_ids = mlbam_ids.fillna(fangraphs_ids.map(fangraphs_to_mlbam)).to_numpy()
+    fangraphs_ids = fangraphs_ids.to_numpy()
+
+    has_mlbam = ~np.isnan(mlbam_ids)
+    has_fangraphs = ~has_mlbam & ~np.isnan(fangraphs_ids)
+    by_name = ~has_mlbam & ~has_fangraphs
+
+    # Separate code ranges per kind of key, then renumber densely in order of first appearance
+    keys = np.zeros(len(projections), dtype=np.int64)
+    mlbam_codes, mlbam_uniques = pd.factorize(mlbam_ids[has_mlbam])
+    fangraphs_codes, fangraphs_uniques = pd.factorize(fangraphs_ids[has_fangraphs])
+    names = pd.Series(np.asarray(projections["Name"], dtype=object)[by_name])
+    name_codes, name_uniques = pd.factorize(names.where(names != "--"))
+    # Rows without a name (code -1) can't be matched to any other row
+    unnamed = name_codes < 0
+    name_codes[unnamed] = len(name_uniques) + np.arange(unnamed.sum())
+    keys[has_mlbam] = mlbam_codes
+    keys[has_fangraphs] = fangraphs_codes + len(mlbam_uniques)
+    keys[by_name] = name_codes + len(mlbam_uniques) + len(fangraphs_uniques)
+
+    return pd.factorize(keys)[0]
+
+
+def _positive_ids(ids):
+    ids = pd.to_numeric(ids, errors="coerce").astype("float64")
+    return ids.where(ids > 0)
+
+
+def add_mean_projection(projections, projection_sources=None, name="mean", weights=None):
+    """Append one consensus row per player averaging ``projection_sources`` (all sources by default).
+
+    Rows are grouped by ``player_keys``, so sources that disagree on a player's team or position
+    strings still average into one row; those attributes come from the player's first non-null value.
+    ``weights`` maps projection sources to weights for a weighted mean (unlisted sources weigh 1).
+    The caller's frame isn't modified.
+    """
     if projection_sources is None:
         projection_sources = projections["ProjectionSource"].unique()
     else:
         projection_sources = [p.value for p in projection_sources]
 
-    group_by = ["Name", "MlbamId", "FangraphsId", "Position", "League", "Team", "ShortName"]
-    if "Position" not in projections:
-        group_by.remove("Position")
+    attribute_cols = [c for c in PLAYER_ATTRIBUTE_COLUMNS if c in projections]
+    stat_cols = [c for c in projections.select_dtypes(include=["number"]) if c not in attribute_cols]
+
+    selected = projections[projections["ProjectionSource"].isin(projection_sources)]
+    keys = player_keys(selected)
+
+    source_weights = {getattr(source, "value", source): weight for source, weight in (weights or {}).items()}
+    row_weights = selected["ProjectionSource"].map(source_weights).astype("float64").fillna(1.0).to_numpy()
 
-    # Fill missing values so free agents can be grouped
+    # Weighted mean skipping missing stats: sum(w * x) / sum(w) over each player's non-null values.
+    # Keys are dense, so sorting by key lines players up for one reduceat per sum.
+    order = np.argsort(keys, kind="stable")
+    group_starts = np.flatnonzero(np.diff(keys[order], prepend=-1))
+    stats = selected[stat_cols].to_numpy(dtype="float64", na_value=np.nan)[order]
+    has_stat = ~np.isnan(stats)
+    row_weights = row_weights[order, None]
+    weighted_sums = np.add.reduceat(np.where(has_stat, stats * row_weights, 0.0), group_starts, axis=0)
+    weight_sums = np.add.reduceat(has_stat * row_weights, group_starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = pd.DataFrame(weighted_sums / weight_sums, columns=stat_cols)
+    # Float stats keep their precision (float32 in compact mode)
+    means = means.astype({c: projections[c].dtype for c in stat_cols if projections[c].dtype.kind == "f"})
+
+    attributes = selected[attribute_cols].reset_index(drop=True).groupby(keys).first().reset_index(drop=True)
+    mean_projections = pd.concat([attributes, means], axis=1)
+    mean_projections.insert(0, "ProjectionSource", name)
+
+    combined = concat_projections([projections, mean_projections])
+
+    # Fill missing values in player attributes so free agents read consistently downstream
     # String columns get "--", integer ID columns get -1
-    string_cols = ["Name", "Position", "League", "Team", "ShortName"]
-    int_cols = ["MlbamId", "FangraphsId"]
-
-    for col in string_cols:
-        if col in group_by and col in projections.columns:
-            projections[col] = projections[col].fillna("--")
-
-    for col in int_cols:
-        if col in group_by and col in projections.columns:
-            projections[col] = projections[col].fillna(-1)
-
-    mean_projections = (
-        projections[projections["ProjectionSource"].isin(projection_sources)]
-        .groupby(by=group_by)
-        .mean(numeric_only=True)
-    )
-    mean_projections["ProjectionSource"] = name
-    mean_projections.reset_index(inplace=True)
-
-    return pd.concat([projections, mean_projections], ignore_index=True)
+    for col in attribute_cols:
+        if col in ID_COLUMNS:
+            combined[col] = combined[col].fillna(-1)
+        else:
+            combined[col] = fill_missing(combined[col], "--")
+
+    return combined
@@ -0,0 +1,295 @@
+import json
+import math
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+from .aggregation import player_keys
+from .dtypes import map_strings
+from .valuation import calculate_available_budget
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+PLAYER_COLUMNS = ["ProjectionSource", "Name", "Position", "Team", "MlbamId", "FantraxId", "Status", "Salary", "PAR"]
+ID_LOOKUP_COLUMNS = ["MlbamId", "FangraphsId", "FantraxId"]
+CONSENSUS_SOURCES = ["zobs", "rzobs"]  # See projections.add_consensus_projections
+
+
+def _is_signed(status):
+    return status.notna() & (status != "FA")
+
+
+@dataclass
+class Signing:
+    player: str
+    team: str
+    salary: float
+    bat_rows: np.ndarray
+    pit_rows: np.ndarray
+
+
+class AuctionState:
+    """Inflation-adjusted auction values kept current while a draft is running.
+
+    Built once from augmented projections (with ``PAR``). Each source's value per unit of PAR^pf is the
+    available budget over the total PAR^pf of that source's unsigned players, so a signing only has to
+    update the budget and subtract the player's rows from their sources' totals; ``AuctionValue`` is then
+    read off on demand as ``par_value[source] * PAR^pf + minimum``. Nothing is recomputed from the frames.
+
+    Values match ``add_auction_values`` up to the rounding of ``PAR`` in formatted projections.
+    """
+
+    def __init__(
+        self,
+        bat_projections,
+        pit_projections,
+        league_roster,
+        league_salary,
+        league_export=None,
+        power_factor=None,
+    ):
+        self.bat_projections = bat_projections.reset_index(drop=True)
+        self.pit_projections = pit_projections.reset_index(drop=True)
+        self.minimum_salary = league_salary["minimum"]
+        self.power_factor = power_factor or 1.0
+
+        if league_export is None:
+            league_export = pd.DataFrame({"Status": pd.Series(dtype=object), "Salary": pd.Series(dtype="float64")})
+        self.available_budget = float(calculate_available_budget(league_roster, league_salary, league_export))
+
+        projections = [self.bat_projections, self.pit_projections]
+        par = np.concatenate([p["PAR"].to_numpy(dtype="float64", na_value=np.nan) for p in projections])
+        self.source_codes, self.sources = pd.factorize(
+            np.concatenate([np.asarray(p["ProjectionSource"], dtype=object) for p in projections])
+        )
+        self.scaled = np.where(par > 0.0, par, 0.0) ** self.power_factor
+        self.scaled[np.isnan(par)] = np.nan
+        self.signed = np.concatenate(
+            [_is_signed(p["Status"]).to_numpy() if "Status" in p else np.zeros(len(p), dtype=bool) for p in projections]
+        )
+        in_pool = ~self.signed & (par > 0.0)
+        self.total_par = np.bincount(
+            self.source_codes, weights=np.where(in_pool, self.scaled, 0.0), minlength=len(self.sources)
+        )
+        self.signings = list()
+        self._teams = np.full(len(par), None, dtype=object)
+        self._salaries = np.full(len(par), np.nan)
+
+        # Rows of each source by descending PAR^pf, which is also descending AuctionValue
+        order = np.lexsort((-np.nan_to_num(self.scaled, nan=-np.inf), self.source_codes))
+        boundaries = np.cumsum(np.bincount(self.source_codes, minlength=len(self.sources)))[:-1]
+        self._ranked = dict(zip(self.sources, np.split(order, boundaries)))
+        consensus = [source for source in CONSENSUS_SOURCES if source in self._ranked]
+        self.default_source = consensus[0] if consensus else (self.sources[0] if len(self.sources) else None)
+        self._keys = [player_keys(p) for p in projections]
+        self._lookups = [self._lookup(p) for p in projections]
+
+    @staticmethod
+    def _lookup(projections):
+        """Rows of each ID and name, as strings."""
+        lookup = dict()
+        for column in ID_LOOKUP_COLUMNS + ["Name"]:
+            if column in projections:
+                values = projections[column].reset_index(drop=True)
+                keys = map_strings(values[values.notna() & ~values.isin(["--", -1])], _lookup_key)
+                for key, rows in keys.groupby(keys, observed=True).indices.items():
+                    lookup[key] = np.union1d(lookup.get(key, []), keys.index[rows]).astype(np.int64)
+        return lookup
+
+    @property
+    def par_value(self):
+        """Dollars per unit of PAR^pf for each source."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.available_budget / self.total_par
+
+    def find(self, player):
+        """``(bat_rows, pit_rows)`` for a player given by MLBAM, Fangraphs or Fantrax ID, or by name."""
+        player = str(player)
+        found = list()
+        offsets = [0, len(self.bat_projections)]
+        for keys, lookup, offset in zip(self._keys, self._lookups, offsets):
+            rows = lookup.get(player, np.array([], dtype=np.int64))
+            # Players without IDs share a key by name, but a source lists each player only once
+            sources = self.source_codes[rows + offset]
+            if len(np.unique(keys[rows])) > 1 or len(np.unique(sources)) < len(sources):
+                raise ValueError(f"'{player}' matches more than one player; use an ID instead.")
+            found.append(rows)
+        if not any(len(rows) for rows in found):
+            raise KeyError(f"Unknown player '{player}'.")
+        return tuple(found)
+
+    def _stacked(self, bat_rows, pit_rows):
+        return np.concatenate([bat_rows, pit_rows + len(self.bat_projections)])
+
+    def sign(self, player, team, salary):
+        """Record ``player`` signed by ``team`` for ``salary``; returns the player's updated rows."""
+        bat_rows, pit_rows = self.find(player)
+        rows = self._stacked(bat_rows, pit_rows)
+        if self.signed[rows].any():
+            raise ValueError(f"'{player}' is already signed.")
+
+        salary = float(salary)
+        self._update_pool(rows, sign=-1.0)
+        self.signed[rows] = True
+        self._teams[rows], self._salaries[rows] = team, salary
+        # One roster spot fewer left to fill at the minimum salary
+        self.available_budget -= salary - self.minimum_salary
+        self.signings.append(Signing(str(player), team, salary, bat_rows, pit_rows))
+        return self.players(rows)
+
+    def undo(self):
+        """Reverse the last signing made through ``sign``; returns the player's updated rows."""
+        if not self.signings:
+            raise ValueError("No signings to undo.")
+        signing = self.signings.pop()
+        rows = self._stacked(signing.bat_rows, signing.pit_rows)
+        self.signed[rows] = False
+        self._teams[rows], self._salaries[rows] = None, np.nan
+        self._update_pool(rows, sign=1.0)
+        self.available_budget += signing.salary - self.minimum_salary
+        return self.players(rows)
+
+    def _update_pool(self, rows, sign):
+        in_pool = rows[self.scaled[rows] > 0.0]
+        np.add.at(self.total_par, self.source_codes[in_pool], sign * self.scaled[in_pool])
+
+    def auction_values(self, rows=None):
+        """Current ``AuctionValue`` for ``rows`` of the stacked batters and pitchers (all by default)."""
+        rows = np.arange(len(self.scaled)) if rows is None else np.asarray(rows)
+        return self.par_value[self.source_codes[rows]] * self.scaled[rows] + self.minimum_salary
+
+    def players(self, rows):
+        """Records with the player columns and current ``AuctionValue`` for stacked ``rows``."""
+        records = list()
+        for row, value in zip(rows, self.auction_values(rows)):
+            if row < len(self.bat_projections):
+                projections, i = self.bat_projections, row
+            else:
+                projections, i = self.pit_projections, row - len(self.bat_projections)
+            record = {c: _json_value(projections.at[i, c]) for c in PLAYER_COLUMNS if c in projections}
+            if self._teams[row] is not None:
+                record["Status"], record["Salary"] = self._teams[row], float(self._salaries[row])
+            record["AuctionValue"] = _json_value(round(value, 2))
+            records.append(record)
+        return records
+
+    def top(self, source=None, limit=25, available=True):
+        """The ``limit`` most valuable players for ``source``, optionally only unsigned ones.
+
+        ``source`` defaults to the consensus projections, or the first source when there are none.
+        """
+        source = source or self.default_source
+        if source not in self._ranked:
+            raise KeyError(f"Unknown projection source '{source}'.")
+        rows = self._ranked[source]
+        if available:
+            rows = rows[~self.signed[rows]]
+        return self.players(rows[:limit])
+
+    def summary(self):
+        return {
+            "available_budget": round(self.available_budget, 2),
+            "signings": len(self.signings),
+            "par_value": {source: _json_value(value) for source, value in zip(self.sources, self.par_value)},
+        }
+
+
+def _lookup_key(value):
+    # IDs read back from CSVs with missing values come as floats
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        value = int(value)
+    return str(value)
+
+
+def _json_value(value):
+    if isinstance(value, (np.integer,)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return None if math.isnan(value) or math.isinf(value) else float(value)
+    if value is pd.NA or value is None:
+        return None
+    return value
+
+
+def _handler(state):
+    class AuctionRequestHandler(BaseHTTPRequestHandler):
+        """JSON API over an ``AuctionState``.
+
+        GET /state, GET /players?source=zobs&limit=25&available=true, GET /player?id=<ID or name>,
+        POST /sign {"player": ..., "team": ..., "salary": ...}, POST /undo.
+        """
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            if url.path == "/state":
+                self._respond(state.summary)
+            elif url.path == "/players":
+                self._respond(
+                    lambda: state.top(
+                        query.get("source"),
+                        int(query.get("limit", 25)),
+                        query.get("available", "true").lower() != "false",
+                    )
+                )
+            elif url.path == "/player":
+                self._respond(lambda: state.players(state._stacked(*state.find(query.get("id", "")))))
+            else:
+                self._send(404, {"error": f"Unknown path '{url.path}'."})
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            if url.path == "/sign":
+                body = self._body()
+                if body is not None:
+                    self._respond(lambda: state.sign(body["player"], body["team"], body["salary"]))
+            elif url.path == "/undo":
+                self._respond(state.undo)
+            else:
+                self._send(404, {"error": f"Unknown path '{url.path}'."})
+
+        def _body(self):
+            try:
+                return json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            except json.JSONDecodeError as e:
+                self._send(400, {"error": f"Invalid JSON: {e}"})
+
+        def _respond(self, action):
+            try:
+                self._send(200, action())
+            except KeyError as e:
+                self._send(404, {"error": str(e.args[0]) if e.args else str(e)})
+            except (ValueError, TypeError) as e:
+                self._send(400, {"error": str(e)})
+
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return AuctionRequestHandler
+
+
+def create_auction_server(state, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """HTTP server for ``state``; requests are handled one at a time, so no locking is needed."""
+    return HTTPServer((host, port), _handler(state))
+
+
+def serve_auction(state, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    server = create_auction_server(state, host, port)
+    print(f"Serving auction values on http://{host}:{server.server_port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
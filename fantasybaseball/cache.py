@@ -0,0 +1,237 @@
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+import pickle
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from importlib import metadata
+
+import pandas as pd
+
+DEFAULT_CACHE_TTL = 6 * 60 * 60  # seconds
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+STAGE_CACHE_VERSION = 1  # Bump when a cached stage's logic changes
+
+
+def default_cache_dir():
+    """Locate the per-user cache directory, honoring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    return pathlib.Path(base) / "fantasybaseball"
+
+
+def _atomic_write(path, data):
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class CacheMissError(LookupError):
+    """Raised when a response is required from the cache (offline mode) but is not there."""
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    fetched_at: float
+    etag: str = None
+    last_modified: str = None
+
+    def is_fresh(self, ttl):
+        return time.time() - self.fetched_at < ttl
+
+    def validators(self):
+        """Headers for a conditional request that revalidates this entry."""
+        headers = dict()
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """On-disk cache of raw FanGraphs projection payloads.
+
+    Entries are keyed by (stats, type, ros, day) so each day of the season keeps its own snapshot. Entries
+    older than ``ttl`` seconds are revalidated before use, and the least recently used entries are evicted
+    once the cache grows beyond ``max_bytes``.
+    """
+
+    def __init__(self, directory=None, ttl=DEFAULT_CACHE_TTL, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.directory = pathlib.Path(directory or default_cache_dir()) / "responses"
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(stats, type, ros, day=None):
+        day = day or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        return stats, type, bool(ros), day
+
+    def _paths(self, key):
+        stats, type, ros, day = key
+        stem = f"{stats}-{type}-{'ros' if ros else 'pre'}-{day}"
+        return self.directory / f"{stem}.json", self.directory / f"{stem}.meta.json"
+
+    def get(self, key):
+        body_path, meta_path = self._paths(key)
+        try:
+            body = body_path.read_bytes()
+            meta = json.loads(meta_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+        os.utime(body_path)  # Record access for LRU eviction
+        return CacheEntry(body=body, **meta)
+
+    def latest(self, key):
+        """Return the newest entry for (stats, type, ros) on or before the key's day."""
+        stats, type, ros, day = key
+        prefix = f"{stats}-{type}-{'ros' if ros else 'pre'}-"
+        days = sorted(p.name[len(prefix) : -len(".meta.json")] for p in self.directory.glob(f"{prefix}*.meta.json"))
+        for candidate in reversed(days):
+            if candidate <= day:
+                entry = self.get((stats, type, ros, candidate))
+                if entry is not None:
+                    return entry
+        return None
+
+    def put(self, key, body, etag=None, last_modified=None):
+        body_path, meta_path = self._paths(key)
+        entry = CacheEntry(body=body, fetched_at=time.time(), etag=etag, last_modified=last_modified)
+        _atomic_write(body_path, body)
+        self._write_meta(meta_path, entry)
+        self.evict()
+        return entry
+
+    def touch(self, key, entry):
+        """Mark a revalidated entry as freshly fetched."""
+        entry.fetched_at = time.time()
+        self._write_meta(self._paths(key)[1], entry)
+        return entry
+
+    @staticmethod
+    def _write_meta(meta_path, entry):
+        meta = {"fetched_at": entry.fetched_at, "etag": entry.etag, "last_modified": entry.last_modified}
+        _atomic_write(meta_path, json.dumps(meta).encode())
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in ``max_bytes``."""
+        entries = list()
+        total_bytes = 0
+        for body_path in self.directory.glob("*.json"):
+            if body_path.name.endswith(".meta.json"):
+                continue
+            meta_path = body_path.with_name(body_path.name[: -len(".json")] + ".meta.json")
+            try:
+                stat = body_path.stat()
+                size = stat.st_size + (meta_path.stat().st_size if meta_path.exists() else 0)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, size, body_path, meta_path))
+            total_bytes += size
+
+        for _, size, body_path, meta_path in sorted(entries, key=lambda e: e[0]):
+            if total_bytes <= self.max_bytes:
+                break
+            for path in (body_path, meta_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            total_bytes -= size
+
+
+def fingerprint(value):
+    """Return a stable content hash of a stage input.
+
+    DataFrames and Series are hashed by content, paths by the bytes of the file they point to, and
+    dataclasses, dicts and scalars by their JSON representation.
+    """
+    digest = hashlib.sha256()
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        if isinstance(value, pd.DataFrame):
+            digest.update(json.dumps([(str(c), str(t)) for c, t in value.dtypes.items()]).encode())
+        else:
+            digest.update(str(value.dtype).encode())
+    elif isinstance(value, pathlib.Path):
+        digest.update(value.read_bytes())
+    else:
+        if dataclasses.is_dataclass(value):
+            value = dataclasses.asdict(value)
+        digest.update(json.dumps(value, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def _package_version():
+    try:
+        return metadata.version("fantasybaseball")
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+class StageCache:
+    """On-disk cache of pipeline stage outputs keyed by a hash of their inputs.
+
+    Each stage's key folds in the key of the stage before it, so a changed input only invalidates the
+    stage that reads it and everything downstream. The first stage's key also folds in
+    ``STAGE_CACHE_VERSION`` and the installed package version, so an upgrade invalidates every stage.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.directory = pathlib.Path(directory or default_cache_dir()) / "stages"
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(name, upstream_key, inputs):
+        if not upstream_key:
+            upstream_key = f"v{STAGE_CACHE_VERSION}:{_package_version()}"
+        digest = hashlib.sha256(f"{name}:{upstream_key}".encode())
+        for value in inputs:
+            digest.update(fingerprint(value).encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return self.directory / f"{key}.pkl"
+
+    def __contains__(self, key):
+        return self._path(key).exists()
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        os.utime(path)  # Record access for LRU eviction
+        return value
+
+    def put(self, key, value):
+        _atomic_write(self._path(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used stage outputs until the cache fits in ``max_bytes``."""
+        entries = list()
+        for path in self.directory.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
@@ -2,17 +2,30 @@ import argparse
 import pathlib
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import pandas as pd
 import progressbar
 import requests
 import yaml
 
+from fantasybaseball.auction import DEFAULT_PORT, AuctionState, serve_auction
+from fantasybaseball.cache import DEFAULT_CACHE_MAX_BYTES, DEFAULT_CACHE_TTL, ResponseCache, StageCache
 from fantasybaseball.config import load_league_config
-from fantasybaseball.fangraphs import get_projections
+from fantasybaseball.dtypes import compact_projections, concat_projections
+from fantasybaseball.fangraphs import create_session, get_projections
+from fantasybaseball.history import RAW, HistoryStore
 from fantasybaseball.model import ProjectionSource, ProjectionSourceName, StatCategory
 from fantasybaseball.playerids import default_player_id_map_path
-from fantasybaseball.projections import augment_projections, write_projections_file
+from fantasybaseball.profiling import NULL_PROFILER, Profiler
+from fantasybaseball.projections import (
+    augment_league_projections,
+    augment_projections,
+    write_league_projections,
+    write_projections_file,
+)
+from fantasybaseball.replacement import REPLACEMENT_MODES
+from fantasybaseball.simulation import VARIANCE_MODES, simulate_projections
 
 
 def load_config_defaults():
@@ -29,17 +42,94 @@ def get_args():
     parser.add_argument("-s", "--stat-category", nargs="+", default=[s.value for s in StatCategory])
     parser.add_argument("-x", "--exclude-bench", action="store_true", default=False)
     parser.add_argument("-r", "--rest-of-season", action="store_true")
-    parser.add_argument("-l", "--league-file", default=None)
-    parser.add_argument("-e", "--league-export", default=None)
+    parser.add_argument("-l", "--league-file", nargs="+", default=None)
+    parser.add_argument("-e", "--league-export", nargs="+", default=None)
+    parser.add_argument("--league-dir", default=None)
+    parser.add_argument("--league-workers", type=int, default=None)
     parser.add_argument("-o", "--output-dir", default="projections/")
+    parser.add_argument("--history-dir", default=None)
     parser.add_argument("--player-id-map", default=default_player_id_map_path())
     parser.add_argument("--power-factor", type=float, default=None)
+    parser.add_argument("--replacement-mode", choices=REPLACEMENT_MODES, default="proportional")
+    parser.add_argument("--max-workers", type=int, default=8)
+    parser.add_argument("--offline", action="store_true", default=False)
+    parser.add_argument("--no-cache", action="store_true", default=False)
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_CACHE_TTL)
+    parser.add_argument("--cache-max-size", type=int, default=DEFAULT_CACHE_MAX_BYTES // (1024 * 1024))
+    parser.add_argument("--profile", nargs="?", const="", default=None, metavar="TRACE_FILE")
+    parser.add_argument("--incremental", action="store_true", default=False)
+    parser.add_argument("--compact", action="store_true", default=False)
+    parser.add_argument("--simulate", type=int, default=None, metavar="SAMPLES")
+    parser.add_argument("--simulation-variance", choices=VARIANCE_MODES, default="source")
+    parser.add_argument("--simulation-workers", type=int, default=None)
+    parser.add_argument("--serve", type=int, nargs="?", const=DEFAULT_PORT, default=None, metavar="PORT")
 
     config = load_config_defaults()
     if config:
         parser.set_defaults(**config)
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.offline and args.no_cache:
+        parser.error("--offline requires the response cache")
+    if args.simulate and args.replacement_mode != "proportional":
+        parser.error("--simulate only supports --replacement-mode proportional")
+
+    # config.yaml may name a single league as a plain string
+    args.league_file = _as_list(args.league_file)
+    args.league_export = _as_list(args.league_export)
+    if len(args.league_export) < len(args.league_file) and args.league_export:
+        parser.error("--league-export needs one export per --league-file")
+    # Exports without a league file are merged without league scoring
+    args.league_file += [None] * (len(args.league_export) - len(args.league_file))
+    if args.league_dir:
+        league_files, league_exports = find_league_files(args.league_dir)
+        if not league_files:
+            parser.error(f"--league-dir has no league files: {args.league_dir}")
+        if args.league_export or any(league_exports):
+            args.league_export = (args.league_export or [None] * len(args.league_file)) + league_exports
+        args.league_file += league_files
+    if args.serve is not None:
+        if len(args.league_file) != 1 or args.league_file[0] is None:
+            parser.error("--serve needs exactly one --league-file")
+        with open(pathlib.Path(args.league_file[0]).resolve()) as f:
+            league = load_league_config(yaml.safe_load(f))
+        if "roster" not in league or "salary" not in league:
+            parser.error("--serve needs a league file with roster and salary settings")
+
+    return args
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, (str, pathlib.Path)):
+        return [value]
+    return list(value)
+
+
+def find_league_files(league_dir):
+    """League YAML files in ``league_dir`` and each one's export, ``<name>.csv`` next to it (or None)."""
+    league_files = sorted(pathlib.Path(league_dir).glob("*.yaml"))
+    league_exports = [f.with_suffix(".csv") if f.with_suffix(".csv").exists() else None for f in league_files]
+    return league_files, league_exports
+
+
+def load_leagues(league_files, league_exports):
+    """Load ``(league_config, league_export)`` pairs; exports are matched to league files by position.
+
+    A ``None`` league file pairs its export with no league config.
+    """
+    leagues = list()
+    for i, league_file in enumerate(league_files):
+        league = None
+        if league_file is not None:
+            with open(pathlib.Path(league_file).resolve()) as f:
+                league = load_league_config(yaml.safe_load(f))
+        league_export = pd.read_csv(league_exports[i]) if league_exports and league_exports[i] else None
+        leagues.append((league, league_export))
+
+    return leagues or [(None, None)]
 
 
 def create_projection_requests(stat_categories, projection_sources):
@@ -56,70 +146,263 @@ def create_projection_requests(stat_categories, projection_sources):
     return jobs
 
 
-def run_projection_requests(projection_requests, retries=3):
-    bat_projections = list()
-    pit_projections = list()
+def _is_retryable(error):
+    """Connection errors, timeouts and server errors are retried; other HTTP errors are not."""
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and error.response.status_code >= 500
+    return True
+
+
+def _run_projection_request(
+    projection_request, session, retries, backoff, cache=None, offline=False, compact=False
+):
+    for attempt in range(retries + 1):
+        try:
+            projections = get_projections(session=session, cache=cache, offline=offline, **projection_request)
+            return compact_projections(projections) if compact else projections
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.HTTPError) as e:
+            if attempt == retries or not _is_retryable(e):
+                raise
+            time.sleep(backoff * 2**attempt)
+
+
+def run_projection_requests(
+    projection_requests,
+    retries=3,
+    max_workers=8,
+    backoff=2.0,
+    cache=None,
+    offline=False,
+    profiler=None,
+    compact=False,
+):
+    """Fetch all projection requests concurrently over a shared keep-alive session.
+
+    Each request is retried independently with exponential backoff. Results are returned in the
+    order of ``projection_requests`` regardless of completion order. When a ``cache`` is given, fresh
+    responses are served from disk; with ``offline`` no network requests are made at all. With ``compact``
+    each frame is shrunk to compact dtypes as it arrives (see ``dtypes.compact_projections``).
+    """
+    profiler = profiler or NULL_PROFILER
+    with profiler.stage("fetch") as stage:
+        bat_projections, pit_projections = _run_projection_requests(
+            projection_requests, retries, max_workers, backoff, cache, offline, compact
+        )
+        stage.rows = len(bat_projections) + len(pit_projections)
+
+    return bat_projections, pit_projections
+
+
+def _run_projection_requests(projection_requests, retries, max_workers, backoff, cache, offline, compact):
     bar = progressbar.ProgressBar(max_value=len(projection_requests)).start()
-    for projection_request in projection_requests:
-        while True:
-            try:
-                projections = get_projections(**projection_request)
-                if projections.empty:
-                    break
-                if projection_request["stat_category"] == StatCategory.BATTING:
-                    bat_projections.append(projections)
-                else:
-                    pit_projections.append(projections)
-
-                break
-            except requests.exceptions.ConnectionError:
-                retries -= 1
-                if retries >= 0:
-                    time.sleep(5)
-                else:
-                    raise
-        bar.update(bar.value + 1)
+    with create_session(pool_size=max_workers) as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _run_projection_request, projection_request, session, retries, backoff, cache, offline, compact
+            )
+            for projection_request in projection_requests
+        ]
+        for future in as_completed(futures):
+            future.result()
+            bar.update(bar.value + 1)
     bar.finish()
 
+    bat_projections = list()
+    pit_projections = list()
+    for projection_request, future in zip(projection_requests, futures):
+        projections = future.result()
+        if projections.empty:
+            continue
+        if projection_request["stat_category"] == StatCategory.BATTING:
+            bat_projections.append(projections)
+        else:
+            pit_projections.append(projections)
+
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", category=FutureWarning)
         return (
-            pd.concat(bat_projections, ignore_index=True),
-            pd.concat(pit_projections, ignore_index=True),
+            concat_projections(bat_projections),
+            concat_projections(pit_projections),
         )
 
 
+def write_league_files(leagues, augmented, output_dir, profiler=None):
+    file_paths = list()
+    with (profiler or NULL_PROFILER).stage("writing") as stage:
+        stage.rows = 0
+        for (league, _), (bat_projections, pit_projections) in zip(leagues, augmented):
+            league_name = league.name if league else None
+            file_paths.append(write_projections_file(bat_projections, StatCategory.BATTING, output_dir, league_name))
+            file_paths.append(write_projections_file(pit_projections, StatCategory.PITCHING, output_dir, league_name))
+            stage.rows += len(bat_projections) + len(pit_projections)
+
+    return file_paths
+
+
+def history_datasets(leagues, league_exports=None):
+    """History dataset of each league: its name, else its export's file stem, else ``augmented``.
+
+    Raises ``ValueError`` when two leagues would share a dataset, since each append would replace the other's.
+    """
+    datasets = list()
+    for i, (league, _) in enumerate(leagues):
+        if league and league.name:
+            datasets.append(league.name)
+        elif league_exports and i < len(league_exports) and league_exports[i]:
+            datasets.append(pathlib.Path(league_exports[i]).stem)
+        else:
+            datasets.append("augmented")
+    duplicates = sorted({d for d in datasets if datasets.count(d) > 1})
+    if duplicates:
+        raise ValueError(f"Several leagues would write history dataset(s) {duplicates}; name each league.")
+    return datasets
+
+
+def append_history(
+    history_dir, bat_projections, pit_projections, leagues, augmented, profiler=None, league_exports=None
+):
+    """Append today's fetched projections and each league's augmented projections to the history store.
+
+    Each league's dataset comes from ``history_datasets``.
+    """
+    datasets = history_datasets(leagues, league_exports)
+    store = HistoryStore(history_dir)
+    with (profiler or NULL_PROFILER).stage("history") as stage:
+        stage.rows = len(bat_projections) + len(pit_projections)
+        store.append(bat_projections, StatCategory.BATTING, RAW)
+        store.append(pit_projections, StatCategory.PITCHING, RAW)
+        for dataset, (league_bat, league_pit) in zip(datasets, augmented):
+            store.append(league_bat, StatCategory.BATTING, dataset)
+            store.append(league_pit, StatCategory.PITCHING, dataset)
+            stage.rows += len(league_bat) + len(league_pit)
+
+
 def main():
     args = get_args()
 
-    league, league_export = None, None
-    if args.league_file:
-        with open(pathlib.Path(args.league_file).resolve()) as f:
-            league = load_league_config(yaml.safe_load(f))
-    if args.league_export:
-        league_export = pd.read_csv(args.league_export)
+    leagues = load_leagues(args.league_file, args.league_export)
+    if args.history_dir:
+        history_datasets(leagues, args.league_export)  # Fail before fetching if leagues share a dataset
 
     stat_categories = [StatCategory(st) for st in args.stat_category]
     projection_sources = [ProjectionSource(pt, ros=args.rest_of_season) for pt in args.projection_source]
     include_bench = not args.exclude_bench
     output_dir = pathlib.Path(args.output_dir).resolve()
 
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(args.cache_dir, ttl=args.cache_ttl, max_bytes=args.cache_max_size * 1024 * 1024)
+
+    profiler = Profiler() if args.profile is not None else None
+    stage_cache = None
+    if args.incremental:
+        stage_cache = StageCache(args.cache_dir, max_bytes=args.cache_max_size * 1024 * 1024)
+
     projection_requests = create_projection_requests(stat_categories, projection_sources)
-    bat_projections, pit_projections = run_projection_requests(projection_requests)
-    bat_projections, pit_projections = augment_projections(
-        bat_projections,
-        pit_projections,
-        league,
-        league_export,
-        include_bench,
-        args.rest_of_season,
-        player_id_map_path=args.player_id_map,
-        power_factor=args.power_factor,
+    bat_projections, pit_projections = run_projection_requests(
+        projection_requests,
+        max_workers=args.max_workers,
+        cache=cache,
+        offline=args.offline,
+        profiler=profiler,
+        compact=args.compact,
     )
+    file_paths = None
+    if len(leagues) == 1:
+        league, league_export = leagues[0]
+        augmented = [
+            augment_projections(
+                bat_projections,
+                pit_projections,
+                league,
+                league_export,
+                include_bench,
+                args.rest_of_season,
+                player_id_map_path=args.player_id_map,
+                power_factor=args.power_factor,
+                cache_dir=args.cache_dir,
+                profiler=profiler,
+                stage_cache=stage_cache,
+                replacement_mode=args.replacement_mode,
+            )
+        ]
+    elif args.league_workers:
+        # League stages and writing run in worker processes
+        augmented, file_paths = write_league_projections(
+            bat_projections,
+            pit_projections,
+            leagues,
+            output_dir,
+            include_bench,
+            args.rest_of_season,
+            player_id_map_path=args.player_id_map,
+            power_factor=args.power_factor,
+            cache_dir=args.cache_dir,
+            profiler=profiler,
+            stage_cache=stage_cache,
+            replacement_mode=args.replacement_mode,
+            max_workers=args.league_workers,
+        )
+    else:
+        augmented = augment_league_projections(
+            bat_projections,
+            pit_projections,
+            leagues,
+            include_bench,
+            args.rest_of_season,
+            player_id_map_path=args.player_id_map,
+            power_factor=args.power_factor,
+            cache_dir=args.cache_dir,
+            profiler=profiler,
+            stage_cache=stage_cache,
+            replacement_mode=args.replacement_mode,
+        )
 
-    league_name = league.name if league else None
-    bat_file_path = write_projections_file(bat_projections, StatCategory.BATTING, output_dir, league_name)
-    pit_file_path = write_projections_file(pit_projections, StatCategory.PITCHING, output_dir, league_name)
+    if file_paths is None:
+        file_paths = write_league_files(leagues, augmented, output_dir, profiler)
+    if args.history_dir:
+        append_history(
+            args.history_dir, bat_projections, pit_projections, leagues, augmented, profiler, args.league_export
+        )
+
+    if args.simulate:
+        sources = [projection_source.value for projection_source in projection_sources]
+        for (league, _), (bat_projections, pit_projections) in zip(leagues, augmented):
+            if not (league and "scoring" in league and "roster" in league and "salary" in league):
+                continue
+            with (profiler or NULL_PROFILER).stage("simulation") as stage:
+                bat_simulation, pit_simulation = simulate_projections(
+                    bat_projections,
+                    pit_projections,
+                    league,
+                    samples=args.simulate,
+                    variance=args.simulation_variance,
+                    sources=sources,
+                    power_factor=args.power_factor,
+                    include_bench=include_bench,
+                    max_workers=args.simulation_workers,
+                )
+                stage.rows = len(bat_simulation) + len(pit_simulation)
+            for simulation, stat_category in [
+                (bat_simulation, StatCategory.BATTING),
+                (pit_simulation, StatCategory.PITCHING),
+            ]:
+                file_paths.append(
+                    write_projections_file(simulation, stat_category, output_dir, league.name, custom="simulation")
+                )
+
+    if profiler is not None:
+        profiler.close()
+        profiler.print_table()
+        if args.profile:
+            profiler.write_trace(args.profile)
     print("New projection files:")
-    print(bat_file_path)
-    print(pit_file_path)
+    for file_path in file_paths:
+        print(file_path)
+
+    if args.serve is not None:
+        (league, league_export), (bat_projections, pit_projections) = leagues[0], augmented[0]
+        state = AuctionState(
+            bat_projections, pit_projections, league["roster"], league["salary"], league_export, args.power_factor
+        )
+        serve_auction(state, port=args.serve)
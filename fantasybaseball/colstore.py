@@ -0,0 +1,110 @@
+"""Memory-mappable column storage for DataFrames.
+
+Each column is written as one or more ``.npy`` files next to a JSON manifest. Numeric columns are stored
+as-is, nullable integer columns as values plus a null mask, and string columns dictionary-encoded as
+integer codes plus a fixed-width unicode dictionary, so every file can be opened with ``mmap_mode``.
+"""
+
+import json
+import os
+import pathlib
+import shutil
+import uuid
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_extension_array_dtype, is_numeric_dtype
+
+MANIFEST = "manifest.json"
+
+
+def _write_column(directory, stem, series):
+    if isinstance(series.dtype, pd.CategoricalDtype) or not is_numeric_dtype(series.dtype):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Keep the categories (and their order) as they are
+            codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+        else:
+            codes, uniques = pd.factorize(series)
+        np.save(directory / f"{stem}.codes.npy", codes.astype("int32"))
+        np.save(directory / f"{stem}.dict.npy", np.asarray([str(u) for u in uniques], dtype="U"))
+        return {"kind": "dictionary", "categorical": isinstance(series.dtype, pd.CategoricalDtype)}
+
+    if is_extension_array_dtype(series.dtype):
+        array = series.array
+        np.save(directory / f"{stem}.values.npy", array.to_numpy(dtype=array.dtype.numpy_dtype, na_value=0))
+        np.save(directory / f"{stem}.mask.npy", array.isna())
+        return {"kind": "masked", "dtype": str(series.dtype)}
+
+    np.save(directory / f"{stem}.values.npy", series.to_numpy())
+    return {"kind": "bool" if is_bool_dtype(series.dtype) else "numpy"}
+
+
+def _load(path, mmap_mode):
+    # View memory-mapped files as plain ndarrays so the np.memmap subclass doesn't leak into pandas
+    return np.load(path, mmap_mode=mmap_mode).view(np.ndarray)
+
+
+def _read_column(directory, stem, spec, mmap_mode, rows=None):
+    rows = slice(None) if rows is None else rows
+    if spec["kind"] == "dictionary":
+        codes = _load(directory / f"{stem}.codes.npy", mmap_mode)[rows]
+        categories = np.load(directory / f"{stem}.dict.npy").astype(object)
+        values = pd.Categorical.from_codes(codes, categories=categories, validate=False)
+        return values if spec["categorical"] else np.asarray(values, dtype=object)
+
+    values = _load(directory / f"{stem}.values.npy", mmap_mode)[rows]
+    if spec["kind"] == "masked":
+        mask = _load(directory / f"{stem}.mask.npy", mmap_mode)[rows]
+        if spec["dtype"].startswith(("Int", "UInt")):
+            return pd.arrays.IntegerArray(values, mask)
+        if spec["dtype"] == "boolean":
+            return pd.arrays.BooleanArray(values, mask)
+        return pd.arrays.FloatingArray(values, mask)
+    return values
+
+
+def write_frame(frame, directory, metadata=None):
+    """Write ``frame`` to ``directory``, replacing it atomically once every column is on disk."""
+    directory = pathlib.Path(directory)
+    directory.parent.mkdir(parents=True, exist_ok=True)
+    tmp_directory = directory.with_name(f".{directory.name}.{uuid.uuid4().hex}.tmp")
+    tmp_directory.mkdir()
+    try:
+        columns = list()
+        for i, column in enumerate(frame.columns):
+            spec = _write_column(tmp_directory, f"c{i}", frame[column])
+            columns.append({"name": column, **spec})
+        manifest = {"length": len(frame), "columns": columns, "metadata": metadata or {}}
+        (tmp_directory / MANIFEST).write_text(json.dumps(manifest))
+
+        if directory.exists():
+            shutil.rmtree(directory, ignore_errors=True)
+        os.replace(tmp_directory, directory)
+    finally:
+        shutil.rmtree(tmp_directory, ignore_errors=True)
+
+
+def read_metadata(directory):
+    return json.loads((pathlib.Path(directory) / MANIFEST).read_text())["metadata"]
+
+
+def read_columns(directory):
+    """Column names of a frame written by ``write_frame``, without reading any column."""
+    return [spec["name"] for spec in json.loads((pathlib.Path(directory) / MANIFEST).read_text())["columns"]]
+
+
+def read_frame(directory, columns=None, mmap_mode="r", rows=None):
+    """Read a frame written by ``write_frame``, memory-mapping numeric buffers by default.
+
+    With ``rows`` (positions or a slice) only those rows are read, so a few rows of a large frame cost
+    about as much as the rows themselves.
+    """
+    directory = pathlib.Path(directory)
+    manifest = json.loads((directory / MANIFEST).read_text())
+    data = dict()
+    for i, spec in enumerate(manifest["columns"]):
+        if columns is None or spec["name"] in columns:
+            data[spec["name"]] = _read_column(directory, f"c{i}", spec, mmap_mode, rows)
+
+    index = pd.RangeIndex(manifest["length"])
+    return pd.DataFrame(data, index=index if rows is None else index[rows], copy=False)
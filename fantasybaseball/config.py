@@ -41,15 +41,22 @@ class LeagueConfig:
         return getattr(self, key)
 
     def __contains__(self, key):
-        return hasattr(self, key) and bool(getattr(self, key))
+        return hasattr(self, key) and self._is_configured(getattr(self, key))
 
     def get(self, key, default=None):
         try:
             val = getattr(self, key)
-            return val if val else default
+            return val if self._is_configured(val) else default
         except AttributeError:
             return default
 
+    @staticmethod
+    def _is_configured(value):
+        if isinstance(value, RosterConfig):
+            # A roster without positions wasn't configured
+            return bool(value.positions)
+        return bool(value)
+
 
 def _normalize_scoring_keys(scoring_dict):
     """Accept both 'bat'/'pit' and 'batting'/'pitching' as scoring keys."""
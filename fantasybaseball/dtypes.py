@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+CATEGORY_COLUMNS = ["ProjectionSource", "Name", "Position", "League", "Team", "ShortName"]
+ID_COLUMNS = ["MlbamId", "FangraphsId"]
+ID_DTYPE = "Int32"
+
+
+def is_categorical(series):
+    return isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def compact_projections(projections):
+    """Shrink a projections frame: categorical strings, nullable Int32 IDs and float32 stats.
+
+    Values are unchanged apart from float32 rounding, so every later step gives the same results to within
+    display precision.
+    """
+    projections = projections.copy()
+    for column in projections.columns:
+        if column in CATEGORY_COLUMNS:
+            projections[column] = projections[column].astype("category")
+        elif column in ID_COLUMNS:
+            projections[column] = projections[column].astype(ID_DTYPE)
+        elif projections[column].dtype == np.float64:
+            projections[column] = projections[column].astype(np.float32)
+
+    return projections
+
+
+def _categories(frames, column):
+    values = [
+        frame[column].cat.categories if is_categorical(frame[column]) else frame[column].dropna().unique()
+        for frame in frames
+        if column in frame
+    ]
+    return pd.Index(sorted(set().union(*values)))
+
+
+def concat_projections(frames):
+    """Concatenate projection frames, keeping categorical columns categorical.
+
+    ``pd.concat`` falls back to object dtype when categoricals have different categories, so the
+    categories are unioned (and sorted, so categorical ordering matches string ordering) first.
+    """
+    frames = list(frames)
+    categorical = {c for frame in frames for c in frame.columns if is_categorical(frame[c])}
+    dtypes = {column: pd.CategoricalDtype(_categories(frames, column)) for column in categorical}
+    frames = [frame.astype({c: dtype for c, dtype in dtypes.items() if c in frame}) for frame in frames]
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def fill_missing(series, value):
+    """``fillna`` that adds ``value`` as a category first when ``series`` is categorical."""
+    if is_categorical(series) and value not in series.cat.categories:
+        series = series.cat.add_categories([value])
+    return series.fillna(value)
+
+
+def map_strings(series, func):
+    """Apply a string function once per distinct value, keeping categoricals categorical."""
+    if not is_categorical(series):
+        values = series.dropna().unique()
+        return series.map(dict(zip(values, map(func, values))))
+
+    categories = pd.Index([func(c) for c in series.cat.categories])
+    codes, uniques = pd.factorize(categories)
+    new_codes = np.where(series.cat.codes >= 0, codes[series.cat.codes], -1)
+    return pd.Series(
+        pd.Categorical.from_codes(new_codes, categories=uniques), index=series.index, name=series.name
+    )
+
+
+def like(series, template):
+    """Cast ``series`` back to categorical when ``template`` is, so replacements keep compact dtypes.
+
+    ``template`` may be None for a column that doesn't exist yet.
+    """
+    if template is not None and is_categorical(template) and not is_categorical(series):
+        return series.astype("category")
+    return series
+
+
+def as_strings(series):
+    """``astype(str)`` that stays categorical, stringifying each category once."""
+    if not is_categorical(series):
+        return series.astype(str)
+    if series.isna().any():
+        series = fill_missing(series, "nan")
+    return series.cat.rename_categories([str(c) for c in series.cat.categories])
@@ -1,41 +1,136 @@
+import json
+
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import CacheMissError
+from .columns import BAT_START_COLUMNS, PIT_START_COLUMNS
+from .model import Stat, StatCategory
 
 PROJECTIONS_URL = "https://www.fangraphs.com/api/projections"
+REQUEST_TIMEOUT = (10, 60)  # connect, read seconds
+
+# FanGraphs field name -> projection column name
+FIELD_COLUMNS = {
+    "PlayerName": "Name",
+    "minpos": "Position",
+    "playerids": "FangraphsId",  # Explicit: this is Fangraphs ID
+    "xMLBAMID": "MlbamId",  # Universal identifier
+}
+ID_COLUMNS = ["MlbamId", "FangraphsId"]
 
 
-def get_projections(stat_category, projection_source):
+def create_session(pool_size=8):
+    """Create a keep-alive HTTP session that can be shared across projection requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_projections(stat_category, projection_source, session=None, cache=None, offline=False):
     payload = {
         "stats": stat_category.value,
         "type": projection_source.value,
     }
-    response = requests.get(PROJECTIONS_URL, params=payload)
-    response.raise_for_status()
+    body = _get_projections_payload(payload, projection_source.ros, session, cache, offline)
 
-    projections = pd.DataFrame(response.json())
-    if not projections.empty:
-        _sanitize_projections(projections, projection_source)
+    return decode_projections(body, stat_category, projection_source)
 
-    return projections.infer_objects()
 
+def _get_projections_payload(payload, ros, session=None, cache=None, offline=False):
+    """Return the raw projections payload, serving from and refreshing the response cache when given one."""
+    if cache is None:
+        if offline:
+            raise CacheMissError("Offline mode requires a response cache.")
+        response = (session or requests).get(PROJECTIONS_URL, params=payload, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.content
 
-def _sanitize_projections(projections, projection_source):
-    projections["ProjectionSource"] = projection_source.value
-    projections["Name"] = projections["PlayerName"]
+    key = cache.key(payload["stats"], payload["type"], ros)
+    entry = cache.get(key)
+    if offline:
+        entry = entry or cache.latest(key)
+        if entry is None:
+            raise CacheMissError(f"No cached projections for stats={payload['stats']} type={payload['type']}.")
+        return entry.body
+    if entry is not None and entry.is_fresh(cache.ttl):
+        return entry.body
 
-    # Preserve both Fangraphs and MLBAM IDs
-    projections.rename(
-        columns={
-            "minpos": "Position",
-            "teamid": "TeamId",
-            "playerids": "FangraphsId",  # Explicit: this is Fangraphs ID
-            "xMLBAMID": "MlbamId",  # Universal identifier
-        },
-        inplace=True,
+    headers = entry.validators() if entry is not None else {}
+    response = (session or requests).get(
+        PROJECTIONS_URL, params=payload, headers=headers, timeout=REQUEST_TIMEOUT
     )
+    if entry is not None and response.status_code == 304:
+        return cache.touch(key, entry).body
+    response.raise_for_status()
+
+    entry = cache.put(
+        key,
+        response.content,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    return entry.body
+
+
+def _projection_schema(stat_category):
+    """Map each FanGraphs field we keep to its projection column name and dtype.
+
+    Kept fields are the output columns in ``columns.py`` plus any stat that scoring can use.
+    """
+    columns = BAT_START_COLUMNS if stat_category == StatCategory.BATTING else PIT_START_COLUMNS
+    fields = {column: field for field, column in FIELD_COLUMNS.items()}
+
+    schema = dict()
+    for column, col_type, *_ in columns:
+        if column in ID_COLUMNS:
+            dtype = "Int64"
+        elif col_type == "string":
+            dtype = "object"
+        else:
+            dtype = "float64"
+        schema[fields.get(column, column)] = (column, dtype)
+    for stat in Stat:
+        schema.setdefault(stat.value, (stat.value, "float64"))
+
+    return schema
+
+
+def _decode_column(values, dtype):
+    if dtype == "object":
+        return np.array(values, dtype=object)
+
+    try:
+        array = np.fromiter((np.nan if v is None else v for v in values), dtype="float64", count=len(values))
+    except (TypeError, ValueError):
+        # Non-numeric values (e.g. "sa123456" prospect IDs) become nulls
+        array = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype="float64")
+
+    if dtype == "Int64":
+        return pd.array(array, dtype="Int64")
+    return array
+
+
+def decode_projections(body, stat_category, projection_source):
+    """Decode a FanGraphs projections payload into a typed DataFrame.
+
+    Unused fields are dropped while the JSON is parsed and every kept column is built directly into a
+    typed array, so the payload is never materialized as an object-dtype frame.
+    """
+    schema = _projection_schema(stat_category)
+    records = json.loads(body, object_pairs_hook=lambda pairs: {k: v for k, v in pairs if k in schema})
+    if not records:
+        return pd.DataFrame()
 
-    # Convert IDs to nullable integers (handles nulls for recent call-ups)
-    projections["MlbamId"] = pd.to_numeric(projections["MlbamId"], errors="coerce").astype("Int64")
-    projections["FangraphsId"] = pd.to_numeric(projections["FangraphsId"], errors="coerce").astype("Int64")
+    present = set().union(*records)
+    count = len(records)
+    columns = {"ProjectionSource": np.full(count, projection_source.value, dtype=object)}
+    for field, (column, dtype) in schema.items():
+        if field in present:
+            columns[column] = _decode_column([r.get(field) for r in records], dtype)
 
-    projections.drop(["PlayerName", "TeamId", "."], axis=1, inplace=True, errors="ignore")
+    return pd.DataFrame(columns, copy=False)
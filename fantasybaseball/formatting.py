@@ -1,9 +1,12 @@
+import numpy as np
 import pandas as pd
 
+from .dtypes import as_strings
+
 
 def order_and_rank_rows(projections, order_by, asc=True):
     projections = projections.sort_values(["ProjectionSource", order_by], ascending=[True, asc])
-    rank = projections.groupby("ProjectionSource")[order_by].rank(ascending=asc).astype(int)
+    rank = projections.groupby("ProjectionSource", observed=True)[order_by].rank(ascending=asc).astype(int)
     if "Rank" in projections:
         projections.pop("Rank")
     projections.insert(1, "Rank", rank)
@@ -34,9 +37,11 @@ def format_stats(projections, columns):
         if col_type == "float" and decimals:
             projections[column] = projections[column].round(decimals[0])
         elif col_type == "int":
-            projections[column] = pd.to_numeric(projections[column], errors="coerce").fillna(0).astype(int)
+            values = pd.to_numeric(projections[column], errors="coerce")
+            # Compact (float32) stats stay 32-bit
+            projections[column] = values.fillna(0).astype(np.int32 if values.dtype == np.float32 else int)
         elif col_type == "string":
-            projections[column] = projections[column].astype(str)
+            projections[column] = as_strings(projections[column])
         elif col_type == "currency" and decimals:
             projections[column] = pd.to_numeric(projections[column], errors="coerce").round(decimals[0])
     return projections
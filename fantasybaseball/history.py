@@ -0,0 +1,444 @@
+"""Append-only history of projection snapshots.
+
+Every run's projections are stored as ``<root>/snapshots/<season>/<date>/<source>/<dataset>_<bat|pit>/``,
+where ``dataset`` is ``raw`` for fetched projections or a league name for augmented ones. Each partition
+is a column store (see ``colstore``), so repeated strings are dictionary-encoded, with rows sorted by
+``PlayerId`` so a player is found by binary search over a memory-mapped key column. Comparing two
+snapshots (``movers``) only opens those dates' partitions.
+
+Each append also adds a small segment of the history columns (``Points``, ``PAR`` and values) to the
+season's series under ``<root>/series/<season>/<dataset>_<bat|pit>/``, likewise sorted by ``PlayerId``.
+Segments are merged once there are more than ``max_segments``, so a player's history across the season
+takes a handful of binary searches instead of one per snapshot partition.
+"""
+
+import argparse
+import os
+import pathlib
+import shutil
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+from .colstore import read_columns, read_frame, read_metadata, write_frame
+from .model import StatCategory
+
+HISTORY_KEY = "PlayerId"
+HISTORY_COLUMNS = ["Points", "PAR", "PlayerValue", "AuctionValue", "ContractValue"]
+PLAYER_COLUMNS = ["Name", "Team", "Position"]
+DEFAULT_COLUMNS = ["Points", "PAR", "AuctionValue"]
+# Raw snapshots have no league columns; default to playing time, which moves the most between them
+RAW_COLUMNS = {StatCategory.BATTING.value: "PA", StatCategory.PITCHING.value: "IP"}
+RAW = "raw"
+MISSING_KEY = np.iinfo(np.int64).max
+MAX_SEGMENTS = 8
+SEGMENT_COLUMNS = [HISTORY_KEY, "Date", "ProjectionSource", "Name"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Query the projection history store.")
+    parser.add_argument("-d", "--history-dir", required=True, help="History store directory")
+    parser.add_argument("--dataset", default=RAW, help="'raw' or a league name (default: raw)")
+    parser.add_argument("-s", "--stat-category", default=None, choices=[s.value for s in StatCategory])
+    parser.add_argument("-p", "--projection-source", nargs="+", default=None, help="Sources (default: all)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    player = subparsers.add_parser("player", help="One player's projections across every snapshot")
+    player.add_argument("player", help="MLBAM ID, negated Fangraphs ID, or name")
+    player.add_argument(
+        "-c", "--columns", nargs="+", default=None, help="Columns (default: Points, PAR and AuctionValue, or PA/IP)"
+    )
+
+    movers = subparsers.add_parser("movers", help="Players whose projections changed the most")
+    movers.add_argument("-c", "--column", default=None, help="Column to compare (default: Points, or PA/IP for raw)")
+    movers.add_argument("--days", type=int, default=7, help="Compare with the snapshot this many days earlier")
+    movers.add_argument("--end", default=None, help="Latest snapshot date to use (default: the latest)")
+    movers.add_argument("--limit", type=int, default=25)
+
+    return parser.parse_args()
+
+
+def history_keys(projections):
+    """Player key that is stable across snapshots: the MLBAM ID, else the negated Fangraphs ID.
+
+    Non-positive IDs (the -1 that ``add_mean_projection`` fills in) count as missing. Players with neither
+    get ``MISSING_KEY``; they are stored but can't be queried.
+    """
+    keys = np.full(len(projections), MISSING_KEY, dtype=np.int64)
+    for column, sign in [("FangraphsId", -1), ("MlbamId", 1)]:
+        if column in projections:
+            ids = pd.to_numeric(projections[column], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+            has_id = ids > 0
+            keys[has_id] = sign * ids[has_id].astype(np.int64)
+    return keys
+
+
+@dataclass(frozen=True)
+class Partition:
+    season: int
+    date: str
+    source: str
+    dataset: str
+    stat_category: str
+    path: pathlib.Path
+
+
+class HistoryStore:
+    """Projection snapshots on disk under ``root``; see the module docstring for the layout."""
+
+    def __init__(self, root, max_segments=MAX_SEGMENTS):
+        self.root = pathlib.Path(root)
+        self.max_segments = max_segments
+        # Memory-mapped PlayerId column and metadata of each partition or segment read so far
+        self._keys = dict()
+        self._metadata = dict()
+
+    def append(self, projections, stat_category, dataset=RAW, date=None):
+        """Store ``projections`` (any number of sources) as the ``date`` snapshot; returns the partitions.
+
+        ``date`` defaults to today (UTC). Appending the same date, source and dataset again replaces
+        that snapshot.
+        """
+        date = date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        stat_category = StatCategory(stat_category).value
+        keys = history_keys(projections)
+        frame = projections.reset_index(drop=True)
+        frame.insert(0, HISTORY_KEY, keys)
+
+        partitions = list()
+        sources = frame.groupby("ProjectionSource", observed=True, sort=True).indices
+        for source, rows in sources.items():
+            rows = rows[np.argsort(keys[rows], kind="stable")]
+            partition = Partition(
+                int(date[:4]),
+                date,
+                str(source),
+                dataset,
+                stat_category,
+                self.root / "snapshots" / date[:4] / date / str(source) / f"{dataset}_{stat_category}",
+            )
+            write_frame(frame.iloc[rows].drop(columns="ProjectionSource").reset_index(drop=True), partition.path)
+            self._keys.pop(partition.path, None)
+            partitions.append(partition)
+
+        columns = [c for c in HISTORY_COLUMNS if c in frame]
+        if columns and sources:
+            self._append_segment(frame, date, dataset, stat_category, columns, sources)
+        return partitions
+
+    def partitions(self, dataset=RAW, stat_category=None, sources=None, start=None, end=None):
+        """Stored partitions of ``dataset`` with dates in ``[start, end]``, oldest first."""
+        found = list()
+        for season_dir in self._season_dirs("snapshots", start, end):
+            for date_dir in _subdirectories(season_dir):
+                if (start and date_dir.name < start) or (end and date_dir.name > end):
+                    continue
+                for source_dir in _subdirectories(date_dir):
+                    if sources is not None and source_dir.name not in sources:
+                        continue
+                    for category in _categories(stat_category):
+                        path = source_dir / f"{dataset}_{category}"
+                        if path.is_dir():
+                            partition = Partition(
+                                int(season_dir.name), date_dir.name, source_dir.name, dataset, category, path
+                            )
+                            found.append(partition)
+        return found
+
+    def dates(self, dataset=RAW):
+        """Snapshot dates of ``dataset``, oldest first."""
+        names = [f"{dataset}_{category}" for category in _categories(None)]
+        return [
+            date_dir.name
+            for season_dir in self._season_dirs("snapshots")
+            for date_dir in _subdirectories(season_dir)
+            if any((source_dir / name).is_dir() for source_dir in _subdirectories(date_dir) for name in names)
+        ]
+
+    def columns(self, dataset=RAW, stat_category=None):
+        """Columns stored in the latest snapshot of ``dataset``; raises ``ValueError`` when it has none."""
+        dates = self.dates(dataset)
+        if not dates:
+            raise ValueError(f"No snapshots of dataset '{dataset}'.")
+        columns = dict()
+        for partition in self.partitions(dataset, stat_category, start=dates[-1]):
+            columns.update(dict.fromkeys(read_columns(partition.path)))
+        return list(columns)
+
+    def _season_dirs(self, kind, start=None, end=None):
+        return [
+            d
+            for d in _subdirectories(self.root / kind)
+            if not (start and d.name < start[:4]) and not (end and d.name > end[:4])
+        ]
+
+    def _sorted_keys(self, path):
+        if path not in self._keys:
+            self._keys[path] = read_frame(path, columns=[HISTORY_KEY])[HISTORY_KEY].to_numpy()
+        return self._keys[path]
+
+    def _segment_metadata(self, path):
+        if path not in self._metadata:
+            self._metadata[path] = read_metadata(path)
+        return self._metadata[path]
+
+    def _append_segment(self, frame, date, dataset, stat_category, columns, sources):
+        """Add the snapshot's history ``columns`` for ``sources`` (source to rows) to the season series."""
+        series_dir = self.root / "series" / date[:4] / f"{dataset}_{stat_category}"
+        segments = _subdirectories(series_dir)
+        rows = np.sort(np.concatenate(list(sources.values())))
+        rows = rows[np.argsort(frame[HISTORY_KEY].to_numpy()[rows], kind="stable")]
+        segment = frame.iloc[rows][[HISTORY_KEY, "ProjectionSource", "Name", *columns]].reset_index(drop=True)
+        segment.insert(1, "Date", date)
+        segment["ProjectionSource"] = segment["ProjectionSource"].astype(str)
+        snapshots = [[date, str(source)] for source in sources]
+        number = int(segments[-1].name) + 1 if segments else 0
+        write_frame(segment, series_dir / f"{number:06d}", metadata={"snapshots": snapshots})
+
+        if len(segments) + 1 > self.max_segments:
+            self._merge_segments(series_dir)
+
+    def _live_snapshots(self, segments):
+        """For each segment, the ``(date, source)`` snapshots no later segment replaced."""
+        live, replaced = dict(), set()
+        for segment in reversed(segments):
+            snapshots = {tuple(snapshot) for snapshot in self._segment_metadata(segment)["snapshots"]}
+            live[segment] = snapshots - replaced
+            replaced |= snapshots
+        return live
+
+    def _merge_segments(self, series_dir):
+        segments = _subdirectories(series_dir)
+        live = self._live_snapshots(segments)
+        frames = list()
+        for segment in segments:
+            frame = read_frame(segment, mmap_mode=None)
+            frames.append(frame[_is_live(frame, live[segment])])
+        merged = pd.concat(frames, ignore_index=True)
+        merged = merged.iloc[np.argsort(merged[HISTORY_KEY].to_numpy(), kind="stable")].reset_index(drop=True)
+
+        snapshots = sorted(set().union(*live.values()))
+        write_frame(merged, series_dir / f"{int(segments[-1].name) + 1:06d}", metadata={"snapshots": snapshots})
+        for segment in segments:
+            shutil.rmtree(segment, ignore_errors=True)
+            self._keys.pop(segment, None)
+            self._metadata.pop(segment, None)
+
+    def find(self, player, dataset=RAW):
+        """``PlayerId`` of a player given by ID or by name (matched in the latest snapshot)."""
+        try:
+            return int(player)
+        except ValueError:
+            pass
+
+        dates = self.dates(dataset)
+        keys = set()
+        for partition in self.partitions(dataset, start=dates[-1] if dates else None):
+            frame = read_frame(partition.path, columns=[HISTORY_KEY, "Name"])
+            keys.update(frame.loc[frame["Name"] == player, HISTORY_KEY].tolist())
+        if not keys:
+            raise KeyError(f"Unknown player '{player}'.")
+        if len(keys) > 1:
+            raise ValueError(f"'{player}' matches more than one player; use an ID instead.")
+        if MISSING_KEY in keys:
+            raise ValueError(f"'{player}' has no MLBAM or Fangraphs ID, so their history can't be queried.")
+        return keys.pop()
+
+    def player_history(
+        self,
+        player,
+        dataset=RAW,
+        columns=None,
+        stat_category=None,
+        sources=None,
+        start=None,
+        end=None,
+    ):
+        """One player's ``columns`` in every matching snapshot, one row per date, source and stat category.
+
+        ``columns`` default to ``DEFAULT_COLUMNS``, or ``RAW_COLUMNS`` for datasets without them. History
+        columns are read from the season series; any other column from each snapshot partition.
+        """
+        key = self.find(player, dataset)
+        stored = self.columns(dataset, stat_category)
+        columns = list(columns) if columns else _default_columns(stored, stat_category)
+        missing = [c for c in columns if c not in stored]
+        if missing:
+            raise ValueError(f"Columns {missing} are not stored in dataset '{dataset}'.")
+        if all(c in HISTORY_COLUMNS for c in columns):
+            frames = self._series_rows(key, dataset, columns, stat_category, start, end)
+        else:
+            frames = self._partition_rows(key, dataset, columns, stat_category, sources, start, end)
+
+        leading = ["Date", "ProjectionSource", "StatCategory", HISTORY_KEY, "Name"]
+        if not frames:
+            return pd.DataFrame(columns=leading + columns)
+        history = pd.concat(frames, ignore_index=True)
+        keep = np.ones(len(history), dtype=bool)
+        if start:
+            keep &= (history["Date"] >= start).to_numpy()
+        if end:
+            keep &= (history["Date"] <= end).to_numpy()
+        if sources is not None:
+            keep &= history["ProjectionSource"].isin(sources).to_numpy()
+        history = history[keep].sort_values(["Date", "StatCategory", "ProjectionSource"], ignore_index=True)
+        return history[leading + [c for c in columns if c in history]]
+
+    def _series_rows(self, key, dataset, columns, stat_category, start, end):
+        frames = list()
+        for season_dir in self._season_dirs("series", start, end):
+            for category in _categories(stat_category):
+                segments = _subdirectories(season_dir / f"{dataset}_{category}")
+                live = self._live_snapshots(segments)
+                for segment in segments:
+                    keys = self._sorted_keys(segment)
+                    rows = slice(np.searchsorted(keys, key, "left"), np.searchsorted(keys, key, "right"))
+                    if rows.stop > rows.start:
+                        frame = read_frame(segment, columns=[*SEGMENT_COLUMNS, *columns], rows=rows)
+                        frames.append(frame[_is_live(frame, live[segment])].assign(StatCategory=category))
+        return frames
+
+    def _partition_rows(self, key, dataset, columns, stat_category, sources, start, end):
+        frames = list()
+        for partition in self.partitions(dataset, stat_category, sources, start, end):
+            keys = self._sorted_keys(partition.path)
+            rows = slice(np.searchsorted(keys, key, "left"), np.searchsorted(keys, key, "right"))
+            if rows.stop > rows.start:
+                frame = read_frame(partition.path, columns=[HISTORY_KEY, "Name", *columns], rows=rows)
+                frames.append(
+                    frame.assign(
+                        Date=partition.date, ProjectionSource=partition.source, StatCategory=partition.stat_category
+                    )
+                )
+        return frames
+
+    def movers(
+        self, dataset=RAW, column=None, start=None, end=None, stat_category=None, sources=None, limit=25
+    ):
+        """Players whose ``column`` changed the most between two snapshots, by absolute change.
+
+        Compares the latest snapshot on or before ``end`` (the latest overall by default) with the latest
+        on or before ``start`` (a week earlier by default), per source and stat category. ``column``
+        defaults to ``Points``, or each stat category's ``RAW_COLUMNS`` for datasets without points.
+        """
+        stored = self.columns(dataset, stat_category)
+        if column is not None and column not in stored:
+            raise ValueError(f"Column '{column}' is not stored in dataset '{dataset}'.")
+        default = "Points" if "Points" in stored else None
+        columns = {category: column or default or RAW_COLUMNS[category] for category in _categories(stat_category)}
+
+        dates = self.dates(dataset)
+        end = max([d for d in dates if end is None or d <= end], default=None)
+        if end is not None and start is None:
+            start = _days_before(end, 7)
+        start = max([d for d in dates if start is not None and d <= start], default=None)
+        if start is None or end is None or start == end:
+            return pd.DataFrame(columns=_MOVER_COLUMNS)
+
+        earlier_partitions = self.partitions(dataset, stat_category, sources, start, start)
+        before = {(p.source, p.stat_category): p for p in earlier_partitions}
+        changes = list()
+        for partition in self.partitions(dataset, stat_category, sources, end, end):
+            earlier = before.get((partition.source, partition.stat_category))
+            if earlier is None:
+                continue
+            after_values = _values(partition, columns[partition.stat_category])
+            before_values = _values(earlier, columns[partition.stat_category])
+            if after_values is None or before_values is None:
+                continue
+            after_keys, before_keys = self._sorted_keys(partition.path), self._sorted_keys(earlier.path)
+            keys, after_rows, before_rows = np.intersect1d(after_keys, before_keys, return_indices=True)
+            after_values, before_values = after_values[after_rows], before_values[before_rows]
+            valid = (keys != MISSING_KEY) & ~np.isnan(after_values) & ~np.isnan(before_values)
+            changes.append(
+                (partition, after_rows[valid], before_values[valid], after_values[valid] - before_values[valid])
+            )
+
+        if not changes:
+            return pd.DataFrame(columns=_MOVER_COLUMNS)
+        # Only the biggest changes need their player columns read
+        magnitude = np.abs(np.concatenate([change for *_, change in changes]))
+        top = np.sort(np.argsort(-magnitude, kind="stable")[:limit])
+        offsets = np.cumsum([0] + [len(change) for *_, change in changes])
+
+        frames = list()
+        for i, (partition, rows, before_values, change) in enumerate(changes):
+            selected = top[(top >= offsets[i]) & (top < offsets[i + 1])] - offsets[i]
+            if len(selected):
+                frame = read_frame(partition.path, columns=[HISTORY_KEY, *PLAYER_COLUMNS], rows=rows[selected])
+                frames.append(
+                    frame.reset_index(drop=True).assign(
+                        ProjectionSource=partition.source,
+                        StatCategory=partition.stat_category,
+                        Before=before_values[selected],
+                        After=before_values[selected] + change[selected],
+                        Change=change[selected],
+                    )
+                )
+
+        movers = pd.concat(frames, ignore_index=True)
+        movers = movers.iloc[np.argsort(-movers["Change"].abs().to_numpy(), kind="stable")].reset_index(drop=True)
+        return movers[[c for c in _MOVER_COLUMNS if c in movers]]
+
+
+_MOVER_COLUMNS = [HISTORY_KEY, *PLAYER_COLUMNS, "ProjectionSource", "StatCategory", "Before", "After", "Change"]
+
+
+def _subdirectories(directory):
+    try:
+        with os.scandir(directory) as entries:
+            names = [e.name for e in entries if e.is_dir() and not e.name.startswith(".")]
+    except FileNotFoundError:
+        return []
+    return [directory / name for name in sorted(names)]
+
+
+def _values(partition, column):
+    """``column`` of a partition as floats, or None when the partition doesn't store it."""
+    frame = read_frame(partition.path, columns=[column])
+    return frame[column].to_numpy(dtype="float64", na_value=np.nan) if column in frame else None
+
+
+def _default_columns(stored, stat_category):
+    columns = [c for c in DEFAULT_COLUMNS if c in stored]
+    return columns or [RAW_COLUMNS[c] for c in _categories(stat_category) if RAW_COLUMNS[c] in stored]
+
+
+def _days_before(date, days):
+    return (datetime.fromisoformat(date) - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def _categories(stat_category):
+    return [StatCategory(stat_category).value] if stat_category else [s.value for s in StatCategory]
+
+
+def _is_live(frame, snapshots):
+    """Rows of a series segment that belong to one of its live ``(date, source)`` snapshots."""
+    date_codes, dates = pd.factorize(frame["Date"])
+    source_codes, sources = pd.factorize(frame["ProjectionSource"])
+    live = np.array([[(d, s) in snapshots for s in sources] for d in dates], dtype=bool)
+    return live.reshape(len(dates), len(sources))[date_codes, source_codes]
+
+
+def main():
+    args = parse_args()
+    store = HistoryStore(args.history_dir)
+
+    try:
+        if args.command == "player":
+            result = store.player_history(
+                args.player, args.dataset, args.columns, args.stat_category, args.projection_source
+            )
+        else:
+            end = args.end or max(store.dates(args.dataset), default=None)
+            start = _days_before(end, args.days) if end else None
+            result = store.movers(
+                args.dataset, args.column, start, end, args.stat_category, args.projection_source, args.limit
+            )
+    except (KeyError, ValueError) as e:
+        raise SystemExit(f"fbb-history: {e.args[0]}")
+
+    with pd.option_context("display.max_columns", None, "display.width", 200, "display.max_rows", 500):
+        print(result)
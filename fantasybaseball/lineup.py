@@ -0,0 +1,128 @@
+from collections import deque
+
+import numpy as np
+
+from .model import Position
+
+BENCH = "bench"
+ANY_POSITION = -1
+
+
+def slot_types(roster_positions, teams=1, include_bench=True):
+    """``(names, accepts, capacities)`` for a roster's slots, ``teams`` times over.
+
+    A slot type accepts a player when ``player_mask & accepts`` is non-zero. Flex slots need no special
+    handling because eligibility masks already carry the CI/MI/UTIL bits; bench slots accept anyone.
+    """
+    names, accepts, capacities = list(), list(), list()
+    for position, count in roster_positions.items():
+        if position == BENCH:
+            if not include_bench:
+                continue
+            mask = ANY_POSITION
+        else:
+            mask = Position(position).bit
+        names.append(position)
+        accepts.append(mask)
+        capacities.append(count * teams)
+    return names, accepts, capacities
+
+
+class SlotAssignment:
+    """Greedy assignment of players to typed slots with capacities.
+
+    Players are offered in descending order of value. A player is kept when an augmenting path exists:
+    a free slot they're eligible for, possibly after shifting already-assigned players to other slot
+    types they're eligible for. This is the greedy algorithm on a transversal matroid, so the kept set
+    is a maximum-value set of players that can legally fill the slots. Paths are searched over slot
+    types rather than players, so each offer costs O(types^2) plus the players moved.
+    """
+
+    def __init__(self, accepts, capacities):
+        self.accepts = list(accepts)
+        self.capacities = np.asarray(capacities, dtype=np.int64)
+        self.slots = [list() for _ in self.accepts]
+        # eligible_counts[t, u]: players assigned to type t that are also eligible for type u
+        self.eligible_counts = np.zeros((len(self.accepts), len(self.accepts)), dtype=np.int64)
+        self.free = int(self.capacities.sum())
+
+    @property
+    def full(self):
+        return self.free == 0
+
+    def _eligible_types(self, mask):
+        return [t for t, accepts in enumerate(self.accepts) if mask & accepts]
+
+    def _find_path(self, mask):
+        """Slot types from one the player fits to one with a free slot, or None."""
+        starts = self._eligible_types(mask)
+        parents = dict()
+        queue = deque()
+        for t in starts:
+            parents[t] = None
+            queue.append(t)
+        while queue:
+            t = queue.popleft()
+            if len(self.slots[t]) < self.capacities[t]:
+                path = [t]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                return path[::-1]
+            for u in np.flatnonzero(self.eligible_counts[t]):
+                if u not in parents:
+                    parents[u] = t
+                    queue.append(u)
+        return None
+
+    def _place(self, player, mask, t):
+        self.slots[t].append((player, mask))
+        for u in self._eligible_types(mask):
+            self.eligible_counts[t, u] += 1
+
+    def _move(self, t, u):
+        for i, (player, mask) in enumerate(self.slots[t]):
+            if mask & self.accepts[u]:
+                del self.slots[t][i]
+                for v in self._eligible_types(mask):
+                    self.eligible_counts[t, v] -= 1
+                self._place(player, mask, u)
+                return
+
+    def offer(self, player, mask):
+        """Assign ``player`` if they can join the kept set; returns whether they were kept."""
+        if self.full or not mask:
+            return False
+        path = self._find_path(mask)
+        if path is None:
+            return False
+        # Shift players along the path, starting from the free end
+        for t, u in reversed(list(zip(path, path[1:]))):
+            self._move(t, u)
+        self._place(player, mask, path[0])
+        self.free -= 1
+        return True
+
+    def assignments(self):
+        """Map of player to the index of the slot type they fill."""
+        return {player: t for t, slots in enumerate(self.slots) for player, _ in slots}
+
+
+def assign_slots(values, masks, accepts, capacities):
+    """Offer players in descending ``values`` order; returns each player's slot type index or -1.
+
+    Players with missing values or no eligibility are skipped.
+    """
+    values = np.asarray(values, dtype="float64")
+    masks = np.asarray(masks)
+    assignment = SlotAssignment(accepts, capacities)
+    for player in np.argsort(-values, kind="stable"):
+        if assignment.full:
+            break
+        if np.isnan(values[player]):
+            continue
+        assignment.offer(player, int(masks[player]))
+
+    slots = np.full(len(values), -1, dtype=np.int64)
+    for player, t in assignment.assignments().items():
+        slots[player] = t
+    return slots
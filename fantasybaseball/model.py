@@ -67,6 +67,11 @@ class Position(Enum):
     RP = "RP"
     UTIL = "UTIL"
 
+    @property
+    def bit(self):
+        """Single-bit mask for this position; eligibility masks OR these together."""
+        return 1 << list(Position).index(self)
+
 
 class League(Enum):
     ALL = "ALL"
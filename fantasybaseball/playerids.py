@@ -1,7 +1,26 @@
+import hashlib
+import io
+import pathlib
 from importlib import resources
 
+import numpy as np
 import pandas as pd
 
+from .cache import default_cache_dir
+from .colstore import read_frame, write_frame
+
+# SFBB column name -> player ID map column name
+PLAYER_ID_MAP_COLUMNS = {
+    "PLAYERNAME": "Name",
+    "MLBID": "MlbamId",
+    "IDFANGRAPHS": "FangraphsId",
+    "FANTRAXID": "FantraxId",
+    "ESPNID": "EspnId",
+    "YAHOOID": "YahooId",
+}
+
+LEAGUE_EXPORT_COLUMNS = ["Status", "Age", "Salary", "Contract", "FantraxId"]
+
 
 def default_player_id_map_path():
     """Locate bundled player_id_map.csv using importlib.resources."""
@@ -9,84 +28,83 @@ def default_player_id_map_path():
     return str(ref)
 
 
-def load_player_id_map(path=None):
-    """Load Smart Fantasy Baseball player ID mapping."""
-    player_map = pd.read_csv(path or default_player_id_map_path())
+def _parse_player_id_map(csv):
+    player_map = pd.read_csv(
+        csv, usecols=list(PLAYER_ID_MAP_COLUMNS), dtype={"PLAYERNAME": object, "FANTRAXID": object}
+    )
 
     # Standardize column names from SFBB format
-    player_map.rename(
-        columns={
-            "MLBID": "MlbamId",
-            "IDFANGRAPHS": "FangraphsId",
-            "FANTRAXID": "FantraxId",
-            "ESPNID": "EspnId",
-            "YAHOOID": "YahooId",
-        },
-        inplace=True,
-    )
+    player_map = player_map.rename(columns=PLAYER_ID_MAP_COLUMNS)[list(PLAYER_ID_MAP_COLUMNS.values())]
 
     # Convert to appropriate types
-    player_map["MlbamId"] = pd.to_numeric(player_map["MlbamId"], errors="coerce").astype("Int64")
-    player_map["FangraphsId"] = pd.to_numeric(player_map["FangraphsId"], errors="coerce").astype("Int64")
+    for column in ["MlbamId", "FangraphsId", "EspnId", "YahooId"]:
+        player_map[column] = pd.to_numeric(player_map[column], errors="coerce").astype("Int64")
 
     return player_map
 
 
+def load_player_id_map(path=None, cache_dir=None):
+    """Load Smart Fantasy Baseball player ID mapping.
+
+    Only the ID and name columns are kept. The parsed map is cached as a memory-mappable column store
+    keyed by the CSV's content hash, so the CSV is only parsed again after it changes.
+    """
+    data = pathlib.Path(path or default_player_id_map_path()).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    cache_path = pathlib.Path(cache_dir or default_cache_dir()) / "player_id_map" / digest
+
+    try:
+        return read_frame(cache_path)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    player_map = _parse_player_id_map(io.BytesIO(data))
+    try:
+        write_frame(player_map, cache_path, metadata={"sha256": digest})
+    except OSError:
+        pass  # A read-only cache directory shouldn't stop a run
+
+    return player_map
+
+
+def _id_keys(ids):
+    return pd.to_numeric(ids, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _lookup_rows(ids, lookup_ids):
+    """Return the position of each ID's first occurrence in ``lookup_ids``, or -1 for nulls and misses."""
+    lookup_keys = _id_keys(lookup_ids)
+    valid = ~np.isnan(lookup_keys) & ~pd.Series(lookup_keys).duplicated().to_numpy()
+    positions = pd.Index(lookup_keys[valid]).get_indexer(_id_keys(ids))
+    # Misses index the trailing -1
+    return np.append(np.flatnonzero(valid), -1)[positions]
+
+
 def merge_with_league_export(projections, league_export):
-    """Merge projections with league export using MLBAM ID with Fangraphs fallback."""
-
-    # Ensure consistent types for FangraphsId
-    league_export = league_export.copy()
-    league_export["FangraphsId"] = pd.to_numeric(league_export["FangraphsId"], errors="coerce").astype("Int64")
-
-    # Select league data columns, filtering out rows with null IDs to avoid cartesian products
-    league_data = league_export[["Status", "Age", "Salary", "Contract", "MlbamId", "FangraphsId", "FantraxId"]].copy()
-
-    # Primary join on MLBAM ID (only for non-null MlbamIds)
-    league_data_mlbam = league_data[league_data["MlbamId"].notna()]
-    merged = projections.merge(league_data_mlbam, on="MlbamId", how="left", suffixes=("_proj", "_league"))
-
-    # For rows without MLBAM match, try Fangraphs ID
-    unmatched_mask = merged["Status"].isna()
-    if unmatched_mask.any():
-        # Get unmatched projections
-        unmatched_projections = projections[projections.index.isin(merged[unmatched_mask].index)]
-
-        # Try to match on Fangraphs ID (only for non-null FangraphsIds)
-        league_data_fangraphs = league_data[league_data["FangraphsId"].notna()]
-        fangraphs_matches = unmatched_projections.merge(
-            league_data_fangraphs[["Status", "Age", "Salary", "Contract", "FangraphsId", "FantraxId"]],
-            on="FangraphsId",
-            how="inner",
-            suffixes=("", "_fg"),
-        )
-
-        # Update merged dataframe with Fangraphs matches
-        if not fangraphs_matches.empty:
-            for idx in fangraphs_matches.index:
-                if idx in merged.index:
-                    merged.loc[idx, "Status"] = fangraphs_matches.loc[idx, "Status"]
-                    merged.loc[idx, "Age"] = fangraphs_matches.loc[idx, "Age"]
-                    merged.loc[idx, "Salary"] = fangraphs_matches.loc[idx, "Salary"]
-                    merged.loc[idx, "Contract"] = fangraphs_matches.loc[idx, "Contract"]
-                    merged.loc[idx, "FantraxId"] = fangraphs_matches.loc[idx, "FantraxId"]
-                    # Keep the FangraphsId from league export if they differ
-                    if "FangraphsId_league" in merged.columns:
-                        merged.loc[idx, "FangraphsId_league"] = fangraphs_matches.loc[idx, "FangraphsId"]
-
-    # Consolidate FangraphsId columns - prefer projection's FangraphsId, then league's
-    if "FangraphsId_proj" in merged.columns and "FangraphsId_league" in merged.columns:
-        merged["FangraphsId"] = merged["FangraphsId_proj"].fillna(merged["FangraphsId_league"])
-        merged.drop(["FangraphsId_proj", "FangraphsId_league"], axis=1, inplace=True)
-    elif "FangraphsId_league" in merged.columns:
-        merged.rename(columns={"FangraphsId_league": "FangraphsId"}, inplace=True)
-
-    # Clean up any remaining duplicate columns
-    merged.drop(
-        [col for col in merged.columns if col.endswith("_league") or col.endswith("_proj")],
+    """Merge projections with league export using MLBAM ID with Fangraphs fallback.
+
+    Every projection row is matched to at most one export row in a single vectorized pass: by MLBAM ID
+    when the export has it, otherwise by Fangraphs ID. Unmatched rows get null league data.
+    """
+    mlbam_rows = _lookup_rows(projections["MlbamId"], league_export["MlbamId"])
+    fangraphs_rows = _lookup_rows(projections["FangraphsId"], league_export["FangraphsId"])
+    rows = np.where(mlbam_rows >= 0, mlbam_rows, fangraphs_rows)
+
+    # Rows of -1 reindex to nulls
+    league_data = league_export[LEAGUE_EXPORT_COLUMNS + ["FangraphsId"]].reset_index(drop=True)
+    league_data["FangraphsId"] = pd.to_numeric(league_data["FangraphsId"], errors="coerce").astype("Int64")
+    league_data = league_data.reindex(rows)
+    league_data.index = pd.RangeIndex(len(projections))
+
+    merged = pd.concat(
+        [
+            projections.drop(columns=LEAGUE_EXPORT_COLUMNS, errors="ignore").reset_index(drop=True),
+            league_data[LEAGUE_EXPORT_COLUMNS],
+        ],
         axis=1,
-        inplace=True,
-        errors="ignore",
     )
 
+    # Prefer projection's FangraphsId, then league's
+    merged["FangraphsId"] = merged["FangraphsId"].fillna(league_data["FangraphsId"]).astype(merged["FangraphsId"].dtype)
+
     return merged
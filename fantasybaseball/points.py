@@ -1,14 +1,34 @@
-from .model import StatCategory
+import pandas as pd
+
 from .scoring import calculate_score_vector
 
 
 def calculate_points(projections, stat_category, league_scoring, use_stat_proxies=False):
+    return calculate_points_matrix(projections, stat_category, {0: league_scoring}, use_stat_proxies)[0]
+
+
+def calculate_points_matrix(projections, stat_category, league_scorings, use_stat_proxies=False):
+    """Score projections for several leagues with one (players x stats) @ (stats x leagues) product.
+
+    ``league_scorings`` maps a league key to its scoring config. Returns a DataFrame with one column of
+    points per league key, aligned to ``projections``.
+    """
     stat_cols = list(projections.select_dtypes(include=["number"]))
-    score_vector = calculate_score_vector(
-        stat_category=stat_category,
-        stat_cols=stat_cols,
-        league_scoring=league_scoring,
-        use_stat_proxies=use_stat_proxies,
+    score_matrix = pd.concat(
+        {
+            key: calculate_score_vector(
+                stat_category=stat_category,
+                stat_cols=stat_cols,
+                league_scoring=league_scoring,
+                use_stat_proxies=use_stat_proxies,
+            )
+            for key, league_scoring in league_scorings.items()
+        },
+        axis=1,
     )
 
-    return projections.loc[:, stat_cols].fillna(0.0).dot(score_vector)
+    # Stats no league scores don't need to take part in the product
+    score_matrix = score_matrix.loc[(score_matrix != 0.0).any(axis=1)]
+    stats = projections.loc[:, list(score_matrix.index)].fillna(0.0).to_numpy(dtype="float64")
+
+    return pd.DataFrame(stats @ score_matrix.to_numpy(), index=projections.index, columns=score_matrix.columns)
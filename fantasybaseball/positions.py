@@ -1,36 +1,109 @@
+import re
+
+import numpy as np
 import pandas as pd
 
+from .dtypes import like
+from .model import Position
+
+FLEX_POSITIONS = {
+    Position.CI: [Position.FiB, Position.ThB],
+    Position.MI: [Position.SeB, Position.SS],
+    Position.UTIL: [Position.C, Position.FiB, Position.SeB, Position.SS, Position.ThB, Position.OF],
+}
+
+POSITION_BITS = {position.value: position.bit for position in Position}
+FLEX_BITS = {flex.bit: sum(p.bit for p in eligible) for flex, eligible in FLEX_POSITIONS.items()}
+# DH-only hitters can start at UTIL, but DH takes no share of UTIL replacement ranks
+FLEX_BITS[Position.UTIL.bit] |= Position.DH.bit
+ELIGIBILITY_DTYPE = np.int32
+
+
+def position_mask(position):
+    """Eligibility bitmask for a "1B/3B"-style position string, including the flex positions it fills.
+
+    Tokens that aren't a ``Position`` are ignored.
+    """
+    mask = 0
+    for token in re.split(r"[/,]", position):
+        mask |= POSITION_BITS.get(token, 0)
+    for flex_bit, eligible_bits in FLEX_BITS.items():
+        if mask & eligible_bits:
+            mask |= flex_bit
+    return mask
+
+
+def eligibility_masks(positions):
+    """Eligibility bitmask for each position string, parsing each distinct string once. Missing is 0."""
+    codes, uniques = pd.factorize(positions)
+    # A trailing zero mask for missing positions (code -1)
+    masks = np.array([position_mask(str(p)) for p in uniques] + [0], dtype=ELIGIBILITY_DTYPE)
+    return masks[codes]
+
+
+def add_eligibility(projections):
+    """Set the ``Eligibility`` bitmask column from ``Position``."""
+    projections["Eligibility"] = eligibility_masks(projections["Position"])
+    return projections
 
-def replace_pitcher_position(projections, league_roster):
+
+class PositionLookup:
+    """League export positions indexed by MLBAM and Fangraphs ID.
+
+    Built once per league export and reused for every projection frame joined against it.
+    """
+
+    def __init__(self, league_export):
+        positions = league_export["Position"]
+        has_position = positions.notna()
+        positions = positions[has_position].astype(str).str.replace(",", "/")
+
+        self.mlbam_positions = self._index(league_export.loc[has_position, "MlbamId"], positions)
+        self.fangraphs_positions = self._index(league_export.loc[has_position, "FangraphsId"], positions)
+
+    @staticmethod
+    def _index(ids, positions):
+        ids = pd.to_numeric(ids, errors="coerce")
+        has_id = ids.notna()
+        lookup = pd.Series(positions[has_id].to_numpy(), index=ids[has_id].astype("int64").to_numpy())
+        # Later export rows win, matching dict assignment
+        return lookup[~lookup.index.duplicated(keep="last")]
+
+    def map(self, projections):
+        """League positions for each projection row, trying MlbamId first, then FangraphsId."""
+        mlbam_match = projections["MlbamId"].map(self.mlbam_positions).astype(object)
+        fangraphs_match = projections["FangraphsId"].map(self.fangraphs_positions).astype(object)
+        return mlbam_match.where(mlbam_match.notna(), fangraphs_match)
+
+
+def replace_pitcher_position(projections, league_roster, position_lookup=None):
     projections = projections.copy()
     if "SP" in league_roster["positions"] or "RP" in league_roster["positions"]:
-        projections["Position"] = ["SP" if gs > 0.0 else "RP" for gs in projections["GS"]]
+        positions = pd.Series(np.where(projections["GS"] > 0.0, "SP", "RP"), index=projections.index)
+        if position_lookup is not None:
+            # League eligibility overrides the games-started heuristic where the export has SP/RP positions
+            league_positions = position_lookup.map(projections)
+            is_sp_rp = league_positions.str.fullmatch(r"(SP|RP)(/(SP|RP))*", na=False)
+            positions = league_positions.where(is_sp_rp, positions)
+        projections["Position"] = like(positions, projections.get("Position"))
+        projections = add_eligibility(projections)
     else:
         projections["Position"] = "P"
+        projections["Eligibility"] = ELIGIBILITY_DTYPE(Position.P.bit)
 
     return projections
 
 
-def replace_positions(projections, league_export):
-    """Replace projection positions with league export positions using ID matching."""
-    # Build lookup dicts from league export
-    mlbam_positions = {}
-    fangraphs_positions = {}
+def replace_positions(projections, position_lookup):
+    """Replace projection positions with league export positions using ID matching.
 
-    for _, row in league_export.iterrows():
-        position = row.get("Position")
-        if pd.isna(position):
-            continue
-        position = str(position).replace(",", "/")
+    ``position_lookup`` is a ``PositionLookup`` or a league export to build one from.
+    """
+    if not isinstance(position_lookup, PositionLookup):
+        position_lookup = PositionLookup(position_lookup)
 
-        if pd.notna(row.get("MlbamId")):
-            mlbam_positions[row["MlbamId"]] = position
-        if pd.notna(row.get("FangraphsId")):
-            fangraphs_positions[row["FangraphsId"]] = position
+    league_positions = position_lookup.map(projections)
+    positions = league_positions.where(league_positions.notna(), projections["Position"].astype(object))
+    projections["Position"] = like(positions, projections["Position"])
 
-    # Map positions: try MlbamId first, then FangraphsId fallback
-    mlbam_match = projections["MlbamId"].map(mlbam_positions)
-    fangraphs_match = projections["FangraphsId"].map(fangraphs_positions)
-    projections["Position"] = mlbam_match.fillna(fangraphs_match).fillna(projections["Position"])
-
-    return projections
+    return add_eligibility(projections)
@@ -1,17 +1,43 @@
 import argparse
+import hashlib
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import yaml
+
+from .cache import _package_version, default_cache_dir
+from .colstore import read_frame, write_frame
+from .config import load_league_config
+from .dtypes import concat_projections
+from .lineup import assign_slots, slot_types
+from .positions import eligibility_masks
 
 NUM_BATTERS_PER_TEAM = 15
 NUM_PITCHERS_PER_TEAM = 15
+RANKINGS_CACHE_VERSION = 1  # Bump when parsing of the cached columns changes
+
+# Columns rankings read from projection CSVs, with the dtype each is parsed to
+RANKING_COLUMNS = {
+    "ProjectionSource": "category",
+    "Name": object,
+    "MlbamId": "Int64",
+    "Position": "category",
+    "Status": "category",
+    "Points": "float64",
+    "PAR": "float64",
+}
+CURRENCY_COLUMNS = ["Salary", "PlayerValue", "AuctionValue", "ContractValue"]
+RANKED_COLUMNS = ["Points", "Salary", "AuctionValue", "ContractValue"]
 
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Generate fantasy baseball power rankings from projections.")
     parser.add_argument("-b", "--bat-projections", required=True, help="Path to batters projection CSV")
     parser.add_argument("-p", "--pit-projections", required=True, help="Path to pitchers projection CSV")
-    parser.add_argument("--projection-source", default="zobs", help="Projection type to use (default: zobs)")
+    parser.add_argument(
+        "--projection-source", default="zobs", help="Projection type to use, or 'all' for every source (default: zobs)"
+    )
     parser.add_argument("--num-batters", type=int, default=15, help="Number of top batters per team (default: 15)")
     parser.add_argument("--num-pitchers", type=int, default=15, help="Number of top pitchers per team (default: 15)")
     parser.add_argument(
@@ -20,72 +46,166 @@ def parse_args():
         default="combined",
         help="Type of rankings to show (default: combined)",
     )
+    parser.add_argument(
+        "-l", "--league-file", default=None, help="League YAML; rank teams by their optimal starting lineups"
+    )
+    parser.add_argument("--cache-dir", default=None, help="Directory for cached parsed projections")
+    parser.add_argument("--no-cache", action="store_true", default=False, help="Always parse the CSVs")
     return parser.parse_args()
 
 
+def parse_currency(series):
+    """Parse currency strings like ``$1,234.50`` (as written by ``write_projections_file``) to floats."""
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.astype("float64")
+    cleaned = series.astype("string").str.replace(r"[$,\s]", "", regex=True).replace("", pd.NA)
+    return pd.to_numeric(cleaned, errors="coerce").astype("float64")
+
+
+def _parse_projections(path):
+    header = pd.read_csv(path, nrows=0).columns
+    dtypes = {c: dtype for c, dtype in RANKING_COLUMNS.items() if c in header}
+    currency = [c for c in CURRENCY_COLUMNS if c in header]
+    projections = pd.read_csv(
+        path, usecols=list(dtypes) + currency, dtype={**dtypes, **dict.fromkeys(currency, object)}
+    )
+    for column in currency:
+        projections[column] = parse_currency(projections[column])
+    return projections
+
+
+def load_projections(path, cache_dir=None, use_cache=True):
+    """Load the columns rankings need from a projections CSV, with currency columns parsed to floats.
+
+    The parsed frame is cached as a column store keyed by the CSV's content hash, salted with
+    ``RANKINGS_CACHE_VERSION`` and the installed package version, so repeated rankings of the same file skip
+    the CSV parse and an upgrade re-parses it.
+    """
+    path = Path(path)
+    if not use_cache:
+        return _parse_projections(path)
+
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    key = hashlib.sha256(f"v{RANKINGS_CACHE_VERSION}:{_package_version()}:{digest}".encode()).hexdigest()
+    cache_path = Path(cache_dir or default_cache_dir()) / "rankings" / key
+    try:
+        return read_frame(cache_path, mmap_mode=None)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    projections = _parse_projections(path)
+    try:
+        write_frame(projections, cache_path, metadata={"sha256": digest, "source": str(path)})
+    except OSError:
+        pass  # A read-only cache directory shouldn't stop a run
+
+    return projections
+
+
 def get_top_n_by_team(df, n=None):
-    """Get top N players per team, or all players if N is None."""
-    filtered_df = df[df["Status"] != "FA"].sort_values("Points", ascending=False)
+    """Get top N players per team (and projection source), or all signed players if N is None."""
+    filtered_df = df[df["Status"].notna() & (df["Status"] != "FA")].sort_values("Points", ascending=False)
     if n is None:
         return filtered_df
-    return filtered_df.groupby("Status").head(n)
+    return filtered_df.groupby(_group_columns(filtered_df), observed=True, sort=False).head(n)
 
 
-def get_rankings_by_type(players_df: pd.DataFrame) -> pd.DataFrame:
-    """Generate rankings for a specific set of players."""
-    agg_dict = {
-        "Points": ["sum", "mean"],
-        "Salary": ["sum", "mean"],
-        "AuctionValue": ["sum", "mean"],
-        "ContractValue": ["sum", "mean"],
-        "PlayerId": "count",
-    }
+def get_optimal_lineups(df, roster_positions):
+    """Each team's highest-scoring legal starting lineup, per projection source.
 
-    rankings = players_df.groupby("Status").agg(agg_dict).round(2)
-    rankings.columns = [
-        f"{col[0]}_{col[1]}".replace("_sum", " Total").replace("_mean", " Avg") for col in rankings.columns
-    ]
+    Starting slots come from the league's ``roster.positions`` (bench excluded), with CI/MI/UTIL filled by
+    eligible players. Every (source, team) is solved with ``lineup.assign_slots``, which is exact for
+    maximizing total points. Returns the starters with the ``Slot`` they fill.
+    """
+    names, accepts, capacities = slot_types(roster_positions, include_bench=False)
+    signed = df[df["Status"].notna() & (df["Status"] != "FA")]
+    masks = eligibility_masks(signed["Position"])
+    points = signed["Points"].to_numpy(dtype="float64", na_value=np.nan)
 
-    rankings = (
-        rankings.rename(columns={"PlayerId_count": "Player Count"})
-        .sort_values("Points Total", ascending=False)
-        .reset_index()
-        .rename(columns={"Status": "Team"})
-    )
+    slots = np.full(len(signed), -1, dtype=np.int64)
+    for rows in signed.groupby(_group_columns(signed), observed=True, sort=False).indices.values():
+        slots[rows] = assign_slots(points[rows], masks[rows], accepts, capacities)
 
-    rankings.index = rankings.index + 1
-    return rankings
+    starting = slots >= 0
+    lineups = signed[starting].copy()
+    lineups["Slot"] = np.asarray(names, dtype=object)[slots[starting]]
+    return lineups.sort_values("Points", ascending=False)
+
+
+def _group_columns(df):
+    return ["ProjectionSource", "Status"] if "ProjectionSource" in df else ["Status"]
+
+
+def get_rankings_by_type(players_df: pd.DataFrame) -> pd.DataFrame:
+    """Rank teams by their players' totals and averages, for every projection source in one grouped pass.
+
+    With a ``ProjectionSource`` column the result is indexed by (ProjectionSource, Rank); otherwise by Rank.
+    """
+    groups = _group_columns(players_df)
+    ranked = [c for c in RANKED_COLUMNS if c in players_df]
+    grouped = players_df.groupby(groups, observed=True)
+    totals = grouped[ranked].sum().add_suffix(" Total")
+    averages = grouped[ranked].mean().add_suffix(" Avg")
+    rankings = pd.concat([totals, averages, grouped.size().rename("Player Count")], axis=1).round(2)
+    rankings = rankings[[f"{c} {stat}" for c in ranked for stat in ("Total", "Avg")] + ["Player Count"]]
+    rankings = rankings.reset_index().rename(columns={"Status": "Team"})
+    rankings["Team"] = rankings["Team"].astype(str)
+
+    if "ProjectionSource" in groups:
+        rankings = rankings.sort_values(["ProjectionSource", "Points Total"], ascending=[True, False])
+        rankings["Rank"] = rankings.groupby("ProjectionSource", observed=True).cumcount() + 1
+        return rankings.set_index(["ProjectionSource", "Rank"])
+
+    rankings = rankings.sort_values("Points Total", ascending=False)
+    rankings["Rank"] = np.arange(1, len(rankings) + 1)
+    return rankings.set_index("Rank")
 
 
 def generate_power_rankings(
     bat_proj_path: Path,
     pit_proj_path: Path,
-    projection_source: str,
+    projection_source: str = None,
     num_batters=NUM_BATTERS_PER_TEAM,
     num_pitchers=NUM_PITCHERS_PER_TEAM,
+    cache_dir=None,
+    use_cache=True,
+    league_roster=None,
 ) -> dict[str, pd.DataFrame]:
-    """Generate power rankings for teams based on projections."""
-    bat_proj = pd.read_csv(bat_proj_path)
-    pit_proj = pd.read_csv(pit_proj_path)
-
-    # Filter for specified projection type
-    bat_proj = bat_proj[bat_proj["ProjectionSource"] == projection_source]
-    pit_proj = pit_proj[pit_proj["ProjectionSource"] == projection_source]
-
-    # Get top players per team for each category
-    top_batters = get_top_n_by_team(bat_proj, num_batters)
-    top_pitchers = get_top_n_by_team(pit_proj, num_pitchers)
+    """Generate power rankings for teams based on projections.
+
+    Every projection source is ranked in the same grouped pass. With ``projection_source`` the rankings
+    for that source are returned indexed by Rank; with None, all sources indexed by (ProjectionSource, Rank).
+    Teams are scored on their top ``num_batters``/``num_pitchers`` players by points, or with a
+    ``league_roster`` on their optimal starting lineups (see ``get_optimal_lineups``).
+    """
+    bat_proj = load_projections(bat_proj_path, cache_dir, use_cache)
+    pit_proj = load_projections(pit_proj_path, cache_dir, use_cache)
+
+    # Get top players (or starting lineups) per team for each category
+    if league_roster:
+        top_batters = get_optimal_lineups(bat_proj, league_roster["positions"])
+        top_pitchers = get_optimal_lineups(pit_proj, league_roster["positions"])
+    else:
+        top_batters = get_top_n_by_team(bat_proj, num_batters)
+        top_pitchers = get_top_n_by_team(pit_proj, num_pitchers)
 
     # Generate rankings for each type
     rankings = {
-        "combined": get_rankings_by_type(pd.concat([top_batters, top_pitchers])),
+        "combined": get_rankings_by_type(concat_projections([top_batters, top_pitchers])),
         "batter": get_rankings_by_type(top_batters),
         "pitcher": get_rankings_by_type(top_pitchers),
     }
+    if projection_source is not None:
+        rankings = {ranking_type: _select_source(df, projection_source) for ranking_type, df in rankings.items()}
 
     return rankings
 
 
+def _select_source(rankings, projection_source):
+    sources = rankings.index.get_level_values("ProjectionSource")
+    return rankings[sources == projection_source].droplevel("ProjectionSource")
+
+
 def main():
     args = parse_args()
 
@@ -95,15 +215,24 @@ def main():
     print(f"\nProjection Source: {args.projection_source}")
     print(f"Batters Projections: {bat_path}")
     print(f"Pitchers Projections: {pit_path}")
-    print(f"Top Batters per Team: {args.num_batters}")
-    print(f"Top Pitchers per Team: {args.num_pitchers}")
+    league = None
+    if args.league_file:
+        with open(Path(args.league_file).resolve()) as f:
+            league = load_league_config(yaml.safe_load(f))
+        print(f"Optimal Lineups: {league.name}")
+    else:
+        print(f"Top Batters per Team: {args.num_batters}")
+        print(f"Top Pitchers per Team: {args.num_pitchers}")
 
     rankings = generate_power_rankings(
         bat_path,
         pit_path,
-        args.projection_source,
+        None if args.projection_source == "all" else args.projection_source,
         args.num_batters,
         args.num_pitchers,
+        cache_dir=args.cache_dir,
+        use_cache=not args.no_cache,
+        league_roster=league.get("roster") if league else None,
     )
 
     pd.set_option(
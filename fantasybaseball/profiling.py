@@ -0,0 +1,119 @@
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class StageRecord:
+    name: str
+    start: float = 0.0
+    wall: float = 0.0
+    cpu: float = 0.0
+    rows: int = None
+    peak_bytes: int = None
+
+
+class _Stage:
+    def __init__(self, profiler, name, rows):
+        self.profiler = profiler
+        self.record = StageRecord(name, rows=rows)
+
+    def __enter__(self):
+        if self.profiler.trace_memory:
+            # Collect earlier garbage now so a collection mid-stage can't offset the stage's own allocations
+            gc.collect()
+            tracemalloc.reset_peak()
+            self._start_bytes = tracemalloc.get_traced_memory()[0]
+        self.record.start = time.perf_counter() - self.profiler.origin
+        self._start_cpu = time.process_time()
+        return self.record
+
+    def __exit__(self, *exc_info):
+        self.record.wall = time.perf_counter() - self.profiler.origin - self.record.start
+        self.record.cpu = time.process_time() - self._start_cpu
+        if self.profiler.trace_memory:
+            self.record.peak_bytes = tracemalloc.get_traced_memory()[1] - self._start_bytes
+        self.profiler.records.append(self.record)
+        return False
+
+
+class Profiler:
+    """Records wall time, CPU time, row counts and peak memory for named pipeline stages.
+
+    Use ``with profiler.stage("points") as stage:`` around each stage and set ``stage.rows`` inside the
+    block. Stages shouldn't be nested: each one resets the tracemalloc peak.
+    """
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.records = list()
+        self.origin = time.perf_counter()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stage(self, name, rows=None):
+        return _Stage(self, name, rows)
+
+    def close(self):
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def format_table(self):
+        lines = [f"{'stage':<16} {'wall (s)':>10} {'cpu (s)':>10} {'rows':>10} {'peak (MB)':>10}"]
+        for record in self.records:
+            rows = f"{record.rows:,}" if record.rows is not None else ""
+            peak = f"{record.peak_bytes / 1024 / 1024:.1f}" if record.peak_bytes is not None else ""
+            lines.append(f"{record.name:<16} {record.wall:>10.3f} {record.cpu:>10.3f} {rows:>10} {peak:>10}")
+        wall = sum(r.wall for r in self.records)
+        cpu = sum(r.cpu for r in self.records)
+        lines.append(f"{'total':<16} {wall:>10.3f} {cpu:>10.3f}")
+        return "\n".join(lines)
+
+    def print_table(self, file=None):
+        print(self.format_table(), file=file or sys.stderr)
+
+    def to_chrome_trace(self):
+        """Return the stages as a Chrome trace (chrome://tracing, Perfetto) with the raw records attached."""
+        events = [
+            {
+                "name": record.name,
+                "ph": "X",
+                "ts": record.start * 1e6,
+                "dur": record.wall * 1e6,
+                "pid": os.getpid(),
+                "tid": 0,
+                "args": {"cpu": record.cpu, "rows": record.rows, "peak_bytes": record.peak_bytes},
+            }
+            for record in self.records
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms", "stages": [asdict(r) for r in self.records]}
+
+    def write_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f, indent=2)
+
+
+class _NullStage:
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class NullProfiler:
+    """Profiler stand-in used when profiling is disabled; every stage is a shared no-op context."""
+
+    _stage = _NullStage()
+
+    def stage(self, name, rows=None):
+        return self._stage
+
+
+NULL_PROFILER = NullProfiler()
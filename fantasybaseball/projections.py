@@ -1,29 +1,31 @@
 import logging
+import pathlib
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 
+import pandas as pd
+
 from .model import ProjectionSource, ProjectionSourceName, StatCategory
 from .columns import BAT_START_COLUMNS, PIT_START_COLUMNS
-from .playerids import load_player_id_map, merge_with_league_export
+from .cache import StageCache
+from .colstore import read_frame, write_frame
+from .dtypes import map_strings
+from .playerids import default_player_id_map_path, load_player_id_map, merge_with_league_export
 from .aggregation import add_mean_projection
 from .formatting import format_currency_for_csv, format_stats, order_and_rank_rows, order_columns
-from .points import calculate_points
-from .positions import replace_pitcher_position, replace_positions
+from .points import calculate_points, calculate_points_matrix
+from .profiling import NULL_PROFILER
+from .positions import PositionLookup, add_eligibility, replace_pitcher_position, replace_positions
 from .replacement import calculate_points_above_replacement
 from .valuation import calculate_auction_values, calculate_available_budget
 
 logger = logging.getLogger(__name__)
 
 
-def augment_projections(
-    bat_projections,
-    pit_projections,
-    league_config=None,
-    league_export=None,
-    include_bench=True,
-    ros=False,
-    player_id_map_path=None,
-    power_factor=None,
-):
+def add_consensus_projections(bat_projections, pit_projections, ros=False):
     bat_projections = add_mean_projection(
         bat_projections,
         projection_sources=[
@@ -45,77 +47,117 @@ def augment_projections(
         name="rzobs" if ros else "zobs",
     )
 
-    if league_export is not None:
-        player_id_map = load_player_id_map(player_id_map_path)
+    return bat_projections, pit_projections
+
+
+def add_player_ids(league_export, player_id_map_path=None, cache_dir=None):
+    player_id_map = load_player_id_map(player_id_map_path, cache_dir=cache_dir)
+
+    # Add MLBAM IDs to league export via Fantrax ID
+    return league_export.merge(
+        player_id_map[["MlbamId", "FangraphsId", "FantraxId"]],
+        left_on="ID",  # Fantrax ID from export (e.g., "*02yc4*")
+        right_on="FantraxId",
+        how="left",
+    )
 
-        # Add MLBAM IDs to league export via Fantrax ID
-        league_export = league_export.merge(
-            player_id_map[["MlbamId", "FangraphsId", "FantraxId"]],
-            left_on="ID",  # Fantrax ID from export (e.g., "*02yc4*")
-            right_on="FantraxId",
-            how="left",
-        )
 
-        # Join projections with league export on MLBAM ID (primary)
-        # with fallback to Fangraphs ID for players without MLBAM
-        bat_projections = merge_with_league_export(bat_projections, league_export)
-        pit_projections = merge_with_league_export(pit_projections, league_export)
+def join_league_export(bat_projections, pit_projections, league_export, position_lookup=None):
+    # Join projections with league export on MLBAM ID (primary)
+    # with fallback to Fangraphs ID for players without MLBAM
+    bat_projections = merge_with_league_export(bat_projections, league_export)
+    pit_projections = merge_with_league_export(pit_projections, league_export)
 
-        bat_projections = replace_positions(bat_projections, league_export)
+    position_lookup = position_lookup or PositionLookup(league_export)
+    bat_projections = replace_positions(bat_projections, position_lookup)
 
+    return bat_projections, pit_projections
+
+
+def strip_pitcher_positions(bat_projections):
     # Strip pitcher positions from batting projections (fixes two-way players like Ohtani)
     if "Position" in bat_projections.columns:
-        bat_projections["Position"] = bat_projections["Position"].str.replace(r"[,/]?P", "", regex=True).str.strip("/,")
+        bat_projections["Position"] = map_strings(
+            bat_projections["Position"], lambda position: re.sub(r"[,/]?P", "", position).strip("/,")
+        )
+        bat_projections = add_eligibility(bat_projections)
+    return bat_projections
 
-    if league_config:
-        if "scoring" in league_config:
-            bat_projections["Points"] = calculate_points(
-                bat_projections, StatCategory.BATTING, league_config["scoring"], use_stat_proxies=True
-            )
-            bat_projections["Pts/G"] = bat_projections["Points"] / bat_projections["G"]
 
-            pit_projections["Points"] = calculate_points(
-                pit_projections, StatCategory.PITCHING, league_config["scoring"], use_stat_proxies=True
-            )
-            pit_projections["Pts/IP"] = pit_projections["Points"] / pit_projections["IP"]
+def add_points(bat_projections, pit_projections, league_scoring, points=None):
+    """Add Points columns, or assign precomputed ``(bat_points, pit_points)`` aligned by row position."""
+    if points is None:
+        bat_projections["Points"] = calculate_points(
+            bat_projections, StatCategory.BATTING, league_scoring, use_stat_proxies=True
+        )
+        pit_projections["Points"] = calculate_points(
+            pit_projections, StatCategory.PITCHING, league_scoring, use_stat_proxies=True
+        )
+    else:
+        bat_projections["Points"] = points[0].to_numpy()
+        pit_projections["Points"] = points[1].to_numpy()
 
-            if "roster" in league_config:
-                bat_projections["PAR"] = calculate_points_above_replacement(
-                    bat_projections, league_config["roster"], include_bench
-                )
-                pit_projections = replace_pitcher_position(pit_projections, league_config["roster"])
-                pit_projections["PAR"] = calculate_points_above_replacement(
-                    pit_projections, league_config["roster"], include_bench
-                )
+    bat_projections["Pts/G"] = bat_projections["Points"] / bat_projections["G"]
+    pit_projections["Pts/IP"] = pit_projections["Points"] / pit_projections["IP"]
 
-                if "salary" in league_config:
-                    roster, salary = league_config["roster"], league_config["salary"]
-                    pf = power_factor or 1.0
+    return bat_projections, pit_projections
 
-                    # PlayerValue: theoretical full-market value
-                    bat_projections["PlayerValue"], pit_projections["PlayerValue"] = calculate_auction_values(
-                        bat_projections, pit_projections, roster, salary, pf
-                    )
 
-                    # AuctionValue: inflation-adjusted (only when league export provides Status)
-                    if "Status" in bat_projections.columns:
-                        signed_bat = bat_projections["Status"].notna() & (bat_projections["Status"] != "FA")
-                        signed_pit = pit_projections["Status"].notna() & (pit_projections["Status"] != "FA")
+def add_points_above_replacement(
+    bat_projections,
+    pit_projections,
+    league_roster,
+    include_bench=True,
+    position_lookup=None,
+    replacement_mode="proportional",
+):
+    bat_projections["PAR"] = calculate_points_above_replacement(
+        bat_projections, league_roster, include_bench, replacement_mode
+    )
+    pit_projections = replace_pitcher_position(pit_projections, league_roster, position_lookup)
+    pit_projections["PAR"] = calculate_points_above_replacement(
+        pit_projections, league_roster, include_bench, replacement_mode
+    )
+
+    return bat_projections, pit_projections
+
+
+def add_auction_values(
+    bat_projections, pit_projections, league_roster, league_salary, power_factor=None, league_export=None
+):
+    roster, salary = league_roster, league_salary
+    pf = power_factor or 1.0
+
+    # PlayerValue: theoretical full-market value
+    bat_projections["PlayerValue"], pit_projections["PlayerValue"] = calculate_auction_values(
+        bat_projections, pit_projections, roster, salary, pf
+    )
 
-                        available_budget = calculate_available_budget(roster, salary, league_export)
+    # AuctionValue: inflation-adjusted (only when league export provides Status)
+    if "Status" in bat_projections.columns:
+        signed_bat = bat_projections["Status"].notna() & (bat_projections["Status"] != "FA")
+        signed_pit = pit_projections["Status"].notna() & (pit_projections["Status"] != "FA")
 
-                        bat_projections["AuctionValue"], pit_projections["AuctionValue"] = calculate_auction_values(
-                            bat_projections, pit_projections, roster, salary, pf,
-                            total_auction_value=available_budget,
-                            bat_pool_mask=~signed_bat,
-                            pit_pool_mask=~signed_pit,
-                        )
+        available_budget = calculate_available_budget(roster, salary, league_export)
 
-                    bat_projections["ContractValue"] = bat_projections["PlayerValue"] - bat_projections["Salary"]
-                    pit_projections["ContractValue"] = pit_projections["PlayerValue"] - pit_projections["Salary"]
+        bat_projections["AuctionValue"], pit_projections["AuctionValue"] = calculate_auction_values(
+            bat_projections, pit_projections, roster, salary, pf,
+            total_auction_value=available_budget,
+            bat_pool_mask=~signed_bat,
+            pit_pool_mask=~signed_pit,
+        )
+
+    if "Salary" in bat_projections.columns:
+        bat_projections["ContractValue"] = bat_projections["PlayerValue"] - bat_projections["Salary"]
+        pit_projections["ContractValue"] = pit_projections["PlayerValue"] - pit_projections["Salary"]
+
+    return bat_projections, pit_projections
 
-            bat_projections = order_and_rank_rows(bat_projections, order_by="Points", asc=False)
-            pit_projections = order_and_rank_rows(pit_projections, order_by="Points", asc=False)
+
+def format_projections(bat_projections, pit_projections, rank=False):
+    if rank:
+        bat_projections = order_and_rank_rows(bat_projections, order_by="Points", asc=False)
+        pit_projections = order_and_rank_rows(pit_projections, order_by="Points", asc=False)
 
     bat_projections = order_columns(bat_projections, [c[0] for c in BAT_START_COLUMNS])
     pit_projections = order_columns(pit_projections, [c[0] for c in PIT_START_COLUMNS])
@@ -129,6 +171,249 @@ def augment_projections(
     return bat_projections, pit_projections
 
 
+@dataclass
+class PipelineState:
+    bat_projections: pd.DataFrame
+    pit_projections: pd.DataFrame
+    league_export: pd.DataFrame = None
+    position_lookup: PositionLookup = None
+
+    @property
+    def rows(self):
+        return len(self.bat_projections) + len(self.pit_projections)
+
+
+def _pipeline_stages(
+    league_config,
+    league_export,
+    include_bench,
+    ros,
+    player_id_map_path,
+    power_factor,
+    cache_dir,
+    add_consensus=True,
+    precomputed_points=None,
+    replacement_mode="proportional",
+):
+    """Return the (name, inputs, run) stages of ``augment_projections`` for this configuration.
+
+    ``inputs`` are everything a stage reads besides the upstream state, and ``run`` maps the upstream
+    state to the stage's output state.
+    """
+
+    def consensus(state):
+        state.bat_projections, state.pit_projections = add_consensus_projections(
+            state.bat_projections, state.pit_projections, ros
+        )
+        return state
+
+    def player_ids(state):
+        if league_export is not None:
+            state.league_export = add_player_ids(league_export, player_id_map_path, cache_dir)
+            state.position_lookup = PositionLookup(state.league_export)
+            state.bat_projections, state.pit_projections = join_league_export(
+                state.bat_projections, state.pit_projections, state.league_export, state.position_lookup
+            )
+        state.bat_projections = strip_pitcher_positions(state.bat_projections)
+        if "Position" in state.pit_projections:
+            state.pit_projections = add_eligibility(state.pit_projections)
+        return state
+
+    def points(state):
+        state.bat_projections, state.pit_projections = add_points(
+            state.bat_projections, state.pit_projections, league_config["scoring"], precomputed_points
+        )
+        return state
+
+    def replacement(state):
+        state.bat_projections, state.pit_projections = add_points_above_replacement(
+            state.bat_projections,
+            state.pit_projections,
+            league_config["roster"],
+            include_bench,
+            state.position_lookup,
+            replacement_mode,
+        )
+        return state
+
+    def valuation(state):
+        state.bat_projections, state.pit_projections = add_auction_values(
+            state.bat_projections,
+            state.pit_projections,
+            league_config["roster"],
+            league_config["salary"],
+            power_factor,
+            state.league_export,
+        )
+        return state
+
+    scored = bool(league_config) and "scoring" in league_config
+
+    def formatting(state):
+        state.bat_projections, state.pit_projections = format_projections(
+            state.bat_projections, state.pit_projections, rank=scored
+        )
+        return state
+
+    id_map_file = pathlib.Path(player_id_map_path or default_player_id_map_path())
+    stages = [("consensus", [ros], consensus)] if add_consensus else []
+    stages.append(("player_ids", [league_export, id_map_file if league_export is not None else None], player_ids))
+    if scored:
+        stages.append(("points", [league_config["scoring"]], points))
+        if "roster" in league_config:
+            replacement_inputs = [league_config["roster"], include_bench, replacement_mode]
+            stages.append(("replacement", replacement_inputs, replacement))
+            if "salary" in league_config:
+                valuation_inputs = [league_config["roster"], league_config["salary"], power_factor]
+                stages.append(("valuation", valuation_inputs, valuation))
+    stages.append(("formatting", [scored], formatting))
+
+    return stages
+
+
+def augment_projections(
+    bat_projections,
+    pit_projections,
+    league_config=None,
+    league_export=None,
+    include_bench=True,
+    ros=False,
+    player_id_map_path=None,
+    power_factor=None,
+    cache_dir=None,
+    profiler=None,
+    stage_cache=None,
+    add_consensus=True,
+    precomputed_points=None,
+    replacement_mode="proportional",
+):
+    """Add consensus projections, league data, points, PAR and auction values to raw projections.
+
+    Pass a ``profiling.Profiler`` as ``profiler`` to record timings and memory for each stage. With a
+    ``cache.StageCache``, each stage's output is stored under a hash of its inputs, and a run resumes from
+    the last stage whose inputs haven't changed. ``add_consensus`` and ``precomputed_points`` let callers that
+    already built the consensus rows or scored them (see ``augment_league_projections``) skip that work.
+    ``replacement_mode`` selects how replacement levels are found (see
+    ``replacement.calculate_points_above_replacement``).
+    """
+    profiler = profiler or NULL_PROFILER
+    stages = _pipeline_stages(
+        league_config,
+        league_export,
+        include_bench,
+        ros,
+        player_id_map_path,
+        power_factor,
+        cache_dir,
+        add_consensus,
+        precomputed_points,
+        replacement_mode,
+    )
+
+    keys = [None] * len(stages)
+    state, resume_at = None, 0
+    if stage_cache is not None:
+        upstream_key = StageCache.key("raw", "", [bat_projections, pit_projections])
+        for i, (name, inputs, _) in enumerate(stages):
+            keys[i] = upstream_key = StageCache.key(name, upstream_key, inputs)
+        for i in reversed(range(len(stages))):
+            if keys[i] in stage_cache:
+                with profiler.stage(f"{stages[i][0]} (cached)") as stage:
+                    state = stage_cache.get(keys[i])
+                    stage.rows = state.rows if state is not None else None
+                if state is not None:
+                    resume_at = i + 1
+                    break
+
+    state = state or PipelineState(bat_projections, pit_projections)
+    for i, (name, _, run) in enumerate(stages[resume_at:], start=resume_at):
+        with profiler.stage(name) as stage:
+            state = run(state)
+            stage.rows = state.rows
+        if stage_cache is not None:
+            stage_cache.put(keys[i], state)
+
+    return state.bat_projections, state.pit_projections
+
+
+def _shared_league_inputs(bat_projections, pit_projections, leagues, ros, profiler):
+    """Consensus projections and every scored league's points, as ``(bat, pit, bat_points, pit_points)``.
+
+    The points frames have one column per scored league, keyed by the league's position in ``leagues``.
+    """
+    with profiler.stage("consensus") as stage:
+        bat_projections, pit_projections = add_consensus_projections(bat_projections, pit_projections, ros)
+        stage.rows = len(bat_projections) + len(pit_projections)
+
+    scorings = {
+        i: league_config["scoring"]
+        for i, (league_config, _) in enumerate(leagues)
+        if league_config and "scoring" in league_config
+    }
+    bat_points = pit_points = pd.DataFrame()
+    if scorings:
+        with profiler.stage("points") as stage:
+            bat_points = calculate_points_matrix(
+                bat_projections, StatCategory.BATTING, scorings, use_stat_proxies=True
+            )
+            pit_points = calculate_points_matrix(
+                pit_projections, StatCategory.PITCHING, scorings, use_stat_proxies=True
+            )
+            stage.rows = len(bat_projections) + len(pit_projections)
+
+    return bat_projections, pit_projections, bat_points, pit_points
+
+
+def augment_league_projections(
+    bat_projections,
+    pit_projections,
+    leagues,
+    include_bench=True,
+    ros=False,
+    player_id_map_path=None,
+    power_factor=None,
+    cache_dir=None,
+    profiler=None,
+    stage_cache=None,
+    replacement_mode="proportional",
+):
+    """Augment one set of raw projections for several leagues.
+
+    ``leagues`` is a list of ``(league_config, league_export)`` pairs. The consensus projections are built
+    once and every league is scored in a single matrix product; the league-specific stages then run per
+    league from that shared base. Returns a list of ``(bat_projections, pit_projections)`` in league order.
+    """
+    profiler = profiler or NULL_PROFILER
+    bat_projections, pit_projections, bat_points, pit_points = _shared_league_inputs(
+        bat_projections, pit_projections, leagues, ros, profiler
+    )
+
+    augmented = list()
+    for i, (league_config, league_export) in enumerate(leagues):
+        # Without an export to merge, later stages would write into the shared base frames
+        copy = league_export is None
+        augmented.append(
+            augment_projections(
+                bat_projections.copy() if copy else bat_projections,
+                pit_projections.copy() if copy else pit_projections,
+                league_config,
+                league_export,
+                include_bench,
+                ros,
+                player_id_map_path=player_id_map_path,
+                power_factor=power_factor,
+                cache_dir=cache_dir,
+                profiler=profiler,
+                stage_cache=stage_cache,
+                add_consensus=False,
+                precomputed_points=(bat_points[i], pit_points[i]) if i in bat_points else None,
+                replacement_mode=replacement_mode,
+            )
+        )
+
+    return augmented
+
+
 def write_projections_file(projections, stat_category, output_dir, league_name=None, custom=None):
     current_time_string = datetime.utcnow().strftime("%Y-%m-%d")
     filename = f"{stat_category.value}_{current_time_string}.csv"
@@ -142,3 +427,96 @@ def write_projections_file(projections, stat_category, output_dir, league_name=N
     output = format_currency_for_csv(projections, columns)
     output.to_csv(file_path, index=False)
     return file_path
+
+
+def _augment_league_worker(shared_dir, i, league_config, league_export, output_dir, options):
+    """Run one league's stages on the memory-mapped shared inputs; returns the league's file paths."""
+    shared_dir = pathlib.Path(shared_dir)
+    # Copy-on-write maps: stages may write into columns without touching the shared files
+    bat_projections = read_frame(shared_dir / "bat", mmap_mode="c")
+    pit_projections = read_frame(shared_dir / "pit", mmap_mode="c")
+    points = None
+    if league_config and "scoring" in league_config:
+        points = tuple(read_frame(shared_dir / f"{name}_points", columns=[i])[i] for name in ("bat", "pit"))
+
+    bat_projections, pit_projections = augment_projections(
+        bat_projections,
+        pit_projections,
+        league_config,
+        league_export,
+        add_consensus=False,
+        precomputed_points=points,
+        **options,
+    )
+
+    league_name = league_config.name if league_config else None
+    write_frame(bat_projections, shared_dir / f"league{i}" / "bat")
+    write_frame(pit_projections, shared_dir / f"league{i}" / "pit")
+    return [
+        write_projections_file(bat_projections, StatCategory.BATTING, output_dir, league_name),
+        write_projections_file(pit_projections, StatCategory.PITCHING, output_dir, league_name),
+    ]
+
+
+def write_league_projections(
+    bat_projections,
+    pit_projections,
+    leagues,
+    output_dir,
+    include_bench=True,
+    ros=False,
+    player_id_map_path=None,
+    power_factor=None,
+    cache_dir=None,
+    profiler=None,
+    stage_cache=None,
+    replacement_mode="proportional",
+    max_workers=None,
+):
+    """Augment one set of raw projections for several leagues in a process pool and write their files.
+
+    The consensus projections and every league's points are built once, as in ``augment_league_projections``,
+    and written to a temporary column store. Each worker memory-maps them instead of receiving a pickled copy,
+    then runs its league's remaining stages and writes the league's files. The player ID map is parsed once
+    up front, so workers memory-map it from the cache too. Returns ``(augmented, file_paths)``, with the
+    augmented projections read back in league order.
+    """
+    profiler = profiler or NULL_PROFILER
+    bat_projections, pit_projections, bat_points, pit_points = _shared_league_inputs(
+        bat_projections, pit_projections, leagues, ros, profiler
+    )
+    if any(league_export is not None for _, league_export in leagues):
+        load_player_id_map(player_id_map_path, cache_dir=cache_dir)
+
+    options = {
+        "include_bench": include_bench,
+        "ros": ros,
+        "player_id_map_path": player_id_map_path,
+        "power_factor": power_factor,
+        "cache_dir": cache_dir,
+        "stage_cache": stage_cache,
+        "replacement_mode": replacement_mode,
+    }
+    with tempfile.TemporaryDirectory(prefix="fbb-leagues-") as shared_dir, profiler.stage("leagues") as stage:
+        shared_dir = pathlib.Path(shared_dir)
+        for name, frame in [("bat", bat_projections), ("pit", pit_projections)]:
+            write_frame(frame, shared_dir / name)
+        for name, frame in [("bat_points", bat_points), ("pit_points", pit_points)]:
+            write_frame(frame, shared_dir / name)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _augment_league_worker, shared_dir, i, league_config, league_export, output_dir, options
+                )
+                for i, (league_config, league_export) in enumerate(leagues)
+            ]
+            file_paths = [file_path for future in futures for file_path in future.result()]
+
+        augmented = [
+            tuple(read_frame(shared_dir / f"league{i}" / name, mmap_mode=None) for name in ("bat", "pit"))
+            for i in range(len(leagues))
+        ]
+        stage.rows = sum(len(bat) + len(pit) for bat, pit in augmented)
+
+    return augmented, file_paths
@@ -1,23 +1,27 @@
 import copy
 import math
+import warnings
 
 import numpy as np
 import pandas as pd
 
+from .lineup import ANY_POSITION, BENCH, assign_slots, slot_types
 from .model import Position
+from .positions import FLEX_POSITIONS, eligibility_masks
 
-FLEX_POSITIONS = {
-    Position.CI: [Position.FiB, Position.ThB],
-    Position.MI: [Position.SeB, Position.SS],
-    Position.UTIL: [Position.C, Position.FiB, Position.SeB, Position.SS, Position.ThB, Position.OF],
-}
+REPLACEMENT_MODES = ["proportional", "assignment"]
 
 
-def _calculate_replacement_level_ranks(league_roster, include_bench=True):
-    league_roster = copy.deepcopy(league_roster)
+def _team_count(league_roster):
     team_count = league_roster["teams"]
     if not isinstance(team_count, int):
         team_count = len(team_count)
+    return team_count
+
+
+def _calculate_replacement_level_ranks(league_roster, include_bench=True):
+    league_roster = copy.deepcopy(league_roster)
+    team_count = _team_count(league_roster)
     positions = league_roster["positions"]
     bench_count = positions.pop("bench", None)
     positions = {Position(p): c for p, c in league_roster["positions"].items()}
@@ -38,58 +42,155 @@ def _calculate_replacement_level_ranks(league_roster, include_bench=True):
     return {p: c * team_count for p, c in positions.items()}
 
 
+def _eligibility(projections):
+    if "Eligibility" in projections:
+        return projections["Eligibility"].to_numpy()
+    return eligibility_masks(projections["Position"])
+
+
 def _calculate_replacement_level_points(projections, replacement_level_ranks, replacement_players=5):
-    replacement_level_points = dict()
-    for projection_source in projections["ProjectionSource"].unique():
-        replacement_level_points[projection_source] = dict()
-        for position, rank in replacement_level_ranks.items():
-            position_projections = projections.loc[
-                (projections["ProjectionSource"] == projection_source)
-                & projections["Position"].str.contains(position.value)
-            ]
-            if not position_projections.empty:
-                points = (
-                    position_projections.nlargest(math.ceil(rank + replacement_players - 1), "Points")
-                    .nsmallest(replacement_players, "Points")["Points"]
-                    .mean()
-                )
-                replacement_level_points[projection_source][position.value] = points
+    """Mean points of the ``replacement_players`` players ending at each position's replacement rank.
+
+    All (source, position) groups are handled in one pass: each row enters the pool of every position its
+    eligibility mask has, the pools are sorted once by group and descending points, and each group's
+    window is read by its position within the group.
+    """
+    source_codes, sources = pd.factorize(projections["ProjectionSource"])
+    rank_positions = [position.value for position in replacement_level_ranks]
+    window_ends = np.array([math.ceil(rank + replacement_players - 1) for rank in replacement_level_ranks.values()])
+
+    position_bits = np.array([position.bit for position in replacement_level_ranks], dtype=np.int64)
+    eligible = (_eligibility(projections)[:, None] & position_bits) != 0
+    points = projections["Points"].to_numpy(dtype="float64", na_value=np.nan)
+    eligible &= (~np.isnan(points) & (source_codes >= 0))[:, None]
+    rows, position_codes = np.nonzero(eligible)
+    groups = source_codes[rows] * len(rank_positions) + position_codes
+    points = points[rows]
+
+    order = np.lexsort((-points, groups))
+    groups, points = groups[order], points[order]
+    sizes = np.bincount(groups, minlength=len(sources) * len(rank_positions))
+    group_starts = np.cumsum(sizes) - sizes
+    group_ranks = np.arange(len(groups)) - group_starts[groups]
+
+    # Replacement window per group: the last ``replacement_players`` of its top ``ceil(rank + rp - 1)``
+    window_end = np.minimum(np.tile(window_ends, len(sources)), sizes)
+    window_start = np.maximum(window_end - replacement_players, 0)
+    in_window = (group_ranks >= window_start[groups]) & (group_ranks < window_end[groups])
+
+    totals = np.bincount(groups[in_window], weights=points[in_window], minlength=len(sizes))
+    counts = np.bincount(groups[in_window], minlength=len(sizes))
+
+    replacement_level_points = {source: dict() for source in sources}
+    for group in np.flatnonzero(counts):
+        source, position = divmod(group, len(rank_positions))
+        replacement_level_points[sources[source]][rank_positions[position]] = totals[group] / counts[group]
 
     return replacement_level_points
 
 
-def calculate_points_above_replacement(projections, league_roster, include_bench=True):
-    replacement_level_ranks = _calculate_replacement_level_ranks(league_roster, include_bench)
-    replacement_level_points = _calculate_replacement_level_points(projections, replacement_level_ranks)
+def _roster_slots(league_roster, eligibility, include_bench=True):
+    """League-wide ``(accepts, capacities)`` for the side of the roster these players can fill.
+
+    Batters and pitchers are assigned separately, so only slot types some player is eligible for are kept,
+    and the bench is split between the two sides in proportion to their starting slots.
+    """
+    team_count = _team_count(league_roster)
+    positions = {p: c for p, c in league_roster["positions"].items() if p != BENCH}
+    _, accepts, capacities = slot_types(positions, team_count)
+    eligible_bits = np.bitwise_or.reduce(eligibility) if len(eligibility) else 0
+    side = [i for i, mask in enumerate(accepts) if mask & eligible_bits]
+    accepts, capacities = [accepts[i] for i in side], [capacities[i] for i in side]
+
+    bench_count = league_roster["positions"].get(BENCH)
+    if bench_count and include_bench and capacities:
+        accepts.append(ANY_POSITION)
+        capacities.append(round(bench_count * sum(capacities) / sum(positions.values())))
+
+    return accepts, capacities
+
+
+def _calculate_assigned_replacement_level_points(
+    projections, league_roster, order_by, include_bench=True, replacement_players=5
+):
+    """Replacement points from filling every team's roster slots with actual players.
+
+    For each source, players are offered in descending ``order_by`` to the league-wide starting slots
+    (and bench slots, which take anyone), moving already-assigned players between slots they're eligible
+    for whenever that makes room (see ``lineup.SlotAssignment``). A position's replacement level is then
+    the mean points of the best ``replacement_players`` eligible players left once the slots are full,
+    topped up with the last ones assigned when too few are left.
+    """
+    source_codes, sources = pd.factorize(projections["ProjectionSource"])
+    eligibility = _eligibility(projections)
+    points = projections["Points"].to_numpy(dtype="float64", na_value=np.nan)
+    order_by = np.asarray(order_by, dtype="float64")
+    accepts, capacities = _roster_slots(league_roster, eligibility, include_bench)
+    positions = list(_calculate_replacement_level_ranks(league_roster, include_bench))
+
+    replacement_level_points = {source: dict() for source in sources}
+    for code, source in enumerate(sources):
+        rows = np.flatnonzero((source_codes == code) & ~np.isnan(points))
+        slots = assign_slots(order_by[rows], eligibility[rows], accepts, capacities)
+        assigned = slots >= 0
+        for position in positions:
+            eligible = (eligibility[rows] & position.bit) != 0
+            if not eligible.any():
+                continue
+            # Assigned players first, then the ones left over, each by descending points
+            pool_points, pool_assigned = points[rows][eligible], assigned[eligible]
+            ordered = pool_points[np.lexsort((-pool_points, ~pool_assigned))]
+            end = min(pool_assigned.sum() + replacement_players, len(ordered))
+            start = max(end - replacement_players, 0)
+            replacement_level_points[source][position.value] = ordered[start:end].mean()
 
-    # Build a flat lookup: (projection_source, position) -> replacement_points
-    repl_lookup = {}
-    for source, pos_dict in replacement_level_points.items():
-        for pos, pts in pos_dict.items():
-            repl_lookup[(source, pos)] = pts
-
-    # Compute fallback replacement points per source (max across positions)
-    fallback = {}
-    for source, pos_dict in replacement_level_points.items():
-        fallback[source] = max(pos_dict.values())
-
-    # Explode multi-position players into one row per position
-    expanded = projections[["ProjectionSource", "Position", "Points"]].copy()
-    expanded["_orig_idx"] = expanded.index
-    expanded["_positions"] = expanded["Position"].str.split("/")
-    expanded = expanded.explode("_positions")
-
-    # Look up replacement points for each (source, position) pair
-    expanded["_repl_pts"] = [
-        repl_lookup.get((src, pos), np.nan) for src, pos in zip(expanded["ProjectionSource"], expanded["_positions"])
-    ]
-
-    # For each original row, pick the position with the lowest replacement points
+    return replacement_level_points
+
+
+def _points_above_replacement_levels(projections, replacement_level_points):
+    # Replacement points as a (source, position) table, with a trailing NaN row and column for misses
+    source_codes, sources = pd.factorize(projections["ProjectionSource"])
+    positions = pd.Index(sorted({p for pos_dict in replacement_level_points.values() for p in pos_dict}))
+    repl_table = np.full((len(sources) + 1, len(positions) + 1), np.nan)
+    for i, source in enumerate(sources):
+        for pos, pts in replacement_level_points[source].items():
+            repl_table[i, positions.get_loc(pos)] = pts
+
+    # For each row, pick the eligible position with the lowest replacement points
     # (most favorable for the player -- maximizes PAR)
-    best_repl = expanded.groupby("_orig_idx")["_repl_pts"].min()
+    position_bits = np.array([Position(p).bit for p in positions], dtype=np.int64)
+    eligible = (_eligibility(projections)[:, None] & position_bits) != 0
+    repl_pts = np.where(eligible, repl_table[source_codes, :-1], np.inf).min(axis=1, initial=np.inf)
+    best_repl = np.where(np.isfinite(repl_pts), repl_pts, np.nan)
 
-    # Fill NaN (no matching position) with fallback
-    fallback_series = projections["ProjectionSource"].map(fallback)
-    replacement_pts = best_repl.reindex(projections.index).fillna(fallback_series)
+    # Fill NaN (no matching position) with fallback: the max across the source's positions
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        fallback = np.nanmax(repl_table, axis=1)
+    replacement_pts = np.where(np.isnan(best_repl), fallback[source_codes], best_repl)
 
     return projections["Points"] - replacement_pts
+
+
+def calculate_points_above_replacement(
+    projections, league_roster, include_bench=True, replacement_mode="proportional"
+):
+    """Points above the best (lowest) replacement level among each player's eligible positions.
+
+    With ``replacement_mode="proportional"`` replacement ranks come from the roster's slot counts, with
+    bench and flex slots spread over the positions. With ``"assignment"`` the slots are filled with actual
+    players in order of their proportional PAR, so multi-position players only take one slot.
+    """
+    if replacement_mode not in REPLACEMENT_MODES:
+        raise ValueError(f"replacement_mode must be one of {REPLACEMENT_MODES}.")
+
+    replacement_level_ranks = _calculate_replacement_level_ranks(league_roster, include_bench)
+    replacement_level_points = _calculate_replacement_level_points(projections, replacement_level_ranks)
+    par = _points_above_replacement_levels(projections, replacement_level_points)
+    if replacement_mode == "assignment":
+        replacement_level_points = _calculate_assigned_replacement_level_points(
+            projections, league_roster, par, include_bench
+        )
+        par = _points_above_replacement_levels(projections, replacement_level_points)
+
+    return par
@@ -0,0 +1,249 @@
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from .config import load_league_config
+from .dtypes import concat_projections
+from .powerrankings import (
+    NUM_BATTERS_PER_TEAM,
+    NUM_PITCHERS_PER_TEAM,
+    get_optimal_lineups,
+    get_top_n_by_team,
+    load_projections,
+)
+
+DEFAULT_WEEKLY_CV = 0.15
+DEFAULT_PLAYOFF_TEAMS = 6
+SCHEDULE_COLUMNS = ["Week", "Home", "Away"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Simulate head-to-head fantasy baseball seasons from projections.")
+    parser.add_argument("-b", "--bat-projections", required=True, help="Path to batters projection CSV")
+    parser.add_argument("-p", "--pit-projections", required=True, help="Path to pitchers projection CSV")
+    parser.add_argument("-s", "--schedule", default=None, help="Schedule CSV with Week, Home and Away columns")
+    parser.add_argument("-l", "--league-file", default=None, help="League YAML; score teams by optimal lineups")
+    parser.add_argument(
+        "--projection-source", default=None, help="Projection source for team means (default: mean of all)"
+    )
+    parser.add_argument("--weeks", type=int, default=21, help="Round-robin weeks when no schedule is given")
+    parser.add_argument("--seasons", type=int, default=100_000, help="Number of seasons to simulate")
+    parser.add_argument("--playoff-teams", type=int, default=DEFAULT_PLAYOFF_TEAMS)
+    parser.add_argument("--weekly-cv", type=float, default=DEFAULT_WEEKLY_CV, help="Weekly score std / mean")
+    parser.add_argument("--workers", type=int, default=None, help="Simulate chunks in a process pool")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-dir", default=None, help="Directory for cached parsed projections")
+    return parser.parse_args()
+
+
+def load_schedule(path):
+    """Read a schedule CSV with one row per matchup: ``Week``, ``Home`` and ``Away``."""
+    schedule = pd.read_csv(path, dtype={"Home": str, "Away": str})
+    missing = [c for c in SCHEDULE_COLUMNS if c not in schedule]
+    if missing:
+        raise ValueError(f"Schedule is missing columns: {missing}")
+    return schedule[SCHEDULE_COLUMNS]
+
+
+def round_robin_schedule(teams, weeks):
+    """A ``weeks``-long schedule cycling through round-robin rounds (circle method); odd counts get byes."""
+    teams = list(teams)
+    slots = teams + [None] if len(teams) % 2 else teams
+    rounds = list()
+    for r in range(len(slots) - 1):
+        rotated = [slots[0]] + slots[1:][r:] + slots[1:][:r]
+        pairs = zip(rotated[: len(slots) // 2], reversed(rotated[len(slots) // 2 :]))
+        rounds.append([(home, away) for home, away in pairs if home is not None and away is not None])
+
+    matchups = [
+        (week, home, away)
+        for week, round_pairs in zip(range(1, weeks + 1), itertools.cycle(rounds))
+        for home, away in round_pairs
+    ]
+    return pd.DataFrame(matchups, columns=SCHEDULE_COLUMNS)
+
+
+def team_distributions(
+    bat_projections,
+    pit_projections,
+    weeks,
+    projection_source=None,
+    league_roster=None,
+    num_batters=NUM_BATTERS_PER_TEAM,
+    num_pitchers=NUM_PITCHERS_PER_TEAM,
+    weekly_cv=DEFAULT_WEEKLY_CV,
+):
+    """Weekly point distribution per team, indexed by team.
+
+    Season totals come from each team's optimal lineup with a ``league_roster``, else from its top players
+    (as in power rankings), for every projection source. ``Mean`` is the ``projection_source`` total (the
+    mean over sources by default) per week. ``Talent`` is the cross-source standard deviation per week,
+    which is drawn once per season, and ``Noise`` the week-to-week standard deviation, ``weekly_cv * Mean``.
+    """
+    if league_roster:
+        players = [get_optimal_lineups(p, league_roster["positions"]) for p in (bat_projections, pit_projections)]
+    else:
+        players = [
+            get_top_n_by_team(bat_projections, num_batters),
+            get_top_n_by_team(pit_projections, num_pitchers),
+        ]
+    players = concat_projections(players)
+    totals = players.groupby(["Status", "ProjectionSource"], observed=True)["Points"].sum().unstack()
+    totals.index = totals.index.astype(str)
+
+    mean = totals.mean(axis=1) if projection_source is None else totals[projection_source]
+    talent = totals.std(axis=1, ddof=1).fillna(0.0) if totals.shape[1] > 1 else totals.iloc[:, 0] * 0.0
+    return pd.DataFrame(
+        {"Mean": mean / weeks, "Talent": talent / weeks, "Noise": weekly_cv * mean / weeks}
+    ).rename_axis("Team")
+
+
+@dataclass
+class _Season:
+    """Schedule and team arrays the simulation needs, with teams as integer codes."""
+
+    mean: np.ndarray
+    talent: np.ndarray
+    noise: np.ndarray
+    weeks: np.ndarray
+    home: np.ndarray
+    away: np.ndarray
+    playoff_teams: int
+
+
+def _simulate_chunk(season, seasons, seed):
+    """Simulate ``seasons`` seasons; returns (wins, seed counts) summed over the chunk."""
+    rng = np.random.default_rng(seed)
+    team_count, week_count = len(season.mean), season.weeks.max() + 1
+
+    strength = season.mean + season.talent * rng.standard_normal((seasons, team_count), dtype=np.float32)
+    scores = strength[:, None, :] + season.noise * rng.standard_normal(
+        (seasons, week_count, team_count), dtype=np.float32
+    )
+    home_scores = scores[:, season.weeks, season.home]
+    away_scores = scores[:, season.weeks, season.away]
+    home_result = (home_scores > away_scores) + 0.5 * (home_scores == away_scores)
+
+    # Wins and points for per season and team, as (seasons x games) @ (games x teams)
+    home_teams = np.eye(team_count, dtype=np.float32)[season.home]
+    away_teams = np.eye(team_count, dtype=np.float32)[season.away]
+    wins = home_result @ home_teams + (1.0 - home_result) @ away_teams
+    points_for = home_scores @ home_teams + away_scores @ away_teams
+
+    # Seed by wins, then points for (scaled below one win)
+    tiebreak = points_for / (np.abs(points_for).max() * 2 + 1)
+    order = np.argsort(-(wins + tiebreak), axis=1, kind="stable")
+    seeds = np.zeros((team_count, season.playoff_teams), dtype=np.int64)
+    for seed in range(season.playoff_teams):
+        seeds[:, seed] = np.bincount(order[:, seed], minlength=team_count)
+
+    return wins.sum(axis=0, dtype=np.float64), seeds
+
+
+def simulate_seasons(
+    distributions,
+    schedule,
+    seasons=100_000,
+    playoff_teams=DEFAULT_PLAYOFF_TEAMS,
+    chunk_size=10_000,
+    max_workers=None,
+    seed=0,
+):
+    """Monte Carlo head-to-head seasons; expected wins, playoff odds and seed distribution per team.
+
+    Each simulated season draws every team's strength around its ``Mean`` with its ``Talent`` spread,
+    then each week's score around that strength with its ``Noise``. Every ``schedule`` matchup goes to
+    the higher score, and the top ``playoff_teams`` by wins (points for breaks ties) make the playoffs.
+    Seasons run in chunks of ``chunk_size`` as array operations; with ``max_workers`` the chunks run in a
+    process pool.
+    """
+    teams = list(distributions.index)
+    unknown = sorted(set(schedule["Home"]).union(schedule["Away"]) - set(teams))
+    if unknown:
+        raise ValueError(f"Schedule teams without projections: {unknown}")
+    playoff_teams = min(playoff_teams, len(teams))
+
+    team_codes = {team: i for i, team in enumerate(teams)}
+    week_codes, weeks = pd.factorize(schedule["Week"], sort=True)
+    season = _Season(
+        distributions["Mean"].to_numpy(dtype=np.float32),
+        distributions["Talent"].to_numpy(dtype=np.float32),
+        distributions["Noise"].to_numpy(dtype=np.float32),
+        week_codes,
+        schedule["Home"].map(team_codes).to_numpy(),
+        schedule["Away"].map(team_codes).to_numpy(),
+        playoff_teams,
+    )
+
+    chunks = [min(chunk_size, seasons - start) for start in range(0, seasons, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    if max_workers and max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_simulate_chunk, [season] * len(chunks), chunks, seeds))
+    else:
+        results = [_simulate_chunk(season, n, s) for n, s in zip(chunks, seeds)]
+
+    wins = sum(result[0] for result in results) / seasons
+    seed_odds = sum(result[1] for result in results) / seasons
+    games = np.bincount(np.concatenate([season.home, season.away]), minlength=len(teams))
+
+    summary = pd.DataFrame(
+        {
+            "Team": teams,
+            "PointsPerWeek": distributions["Mean"].to_numpy().round(2),
+            "ExpectedWins": wins.round(2),
+            "ExpectedLosses": (games - wins).round(2),
+            "PlayoffOdds": seed_odds.sum(axis=1).round(4),
+        }
+    )
+    for i in range(playoff_teams):
+        summary[f"Seed{i + 1}"] = seed_odds[:, i].round(4)
+
+    return summary.sort_values(["PlayoffOdds", "ExpectedWins"], ascending=False, ignore_index=True)
+
+
+def main():
+    args = parse_args()
+
+    league = None
+    if args.league_file:
+        with open(Path(args.league_file).resolve()) as f:
+            league = load_league_config(yaml.safe_load(f))
+
+    bat_projections = load_projections(Path(args.bat_projections), args.cache_dir)
+    pit_projections = load_projections(Path(args.pit_projections), args.cache_dir)
+
+    schedule = load_schedule(args.schedule) if args.schedule else None
+    weeks = schedule["Week"].nunique() if schedule is not None else args.weeks
+    distributions = team_distributions(
+        bat_projections,
+        pit_projections,
+        weeks,
+        args.projection_source,
+        league.get("roster") if league else None,
+        weekly_cv=args.weekly_cv,
+    )
+    if schedule is None:
+        schedule = round_robin_schedule(distributions.index, weeks)
+
+    print(f"\nSeasons: {args.seasons}")
+    print(f"Weeks: {weeks}")
+    print(f"Playoff Teams: {args.playoff_teams}")
+
+    summary = simulate_seasons(
+        distributions,
+        schedule,
+        seasons=args.seasons,
+        playoff_teams=args.playoff_teams,
+        max_workers=args.workers,
+        seed=args.seed,
+    )
+    summary.index = summary.index + 1
+    with pd.option_context("display.max_columns", None, "display.width", 200):
+        print(summary)
@@ -0,0 +1,194 @@
+import math
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .model import StatCategory
+from .replacement import _calculate_replacement_level_ranks
+from .scoring import calculate_score_vector
+from .tensor import ProjectionTensor
+from .valuation import calculate_total_auction_value
+
+PERCENTILES = (10, 50, 90)
+SIMULATED_COLUMNS = ["Points", "PAR", "Value"]
+VARIANCE_MODES = ["source", "stat"]
+
+
+@dataclass
+class _PlayerPool:
+    """Arrays the simulation needs for one stat category, aligned by player."""
+
+    attributes: pd.DataFrame
+    mean: np.ndarray
+    std: np.ndarray
+    eligible: np.ndarray
+    pools: list
+    windows: list
+
+
+def _points_distribution(tensor, stat_category, league_scoring, variance, sources):
+    selected = [j for j, source in enumerate(tensor.sources) if sources is None or source in sources]
+    if "Points" in tensor.stats:
+        points = tensor.stat("Points")[:, selected]
+    else:
+        points = tensor.points(stat_category, league_scoring, use_stat_proxies=True)[:, selected]
+
+    mean = np.nanmean(points, axis=1)
+    if variance == "stat":
+        stats = [s for s in tensor.stats if s != "Points"]
+        score_vector = calculate_score_vector(stat_category, stats, league_scoring, use_stat_proxies=True)
+        spread = np.nan_to_num(tensor.spread([tensor.sources[j] for j in selected]))
+        spread = spread[:, [tensor.stats.index(s) for s in stats]]
+        # Stats treated as independent: var(points) = sum of (coefficient * stat spread)^2
+        std = np.sqrt((spread**2) @ (score_vector.to_numpy(dtype="float64") ** 2))
+    else:
+        counts = (~np.isnan(points)).sum(axis=1)
+        std = np.where(counts > 1, np.nanstd(points, axis=1, ddof=1), 0.0)
+
+    return mean, np.nan_to_num(std)
+
+
+def _player_pool(projections, stat_category, league_config, variance, sources, include_bench, replacement_players):
+    tensor = ProjectionTensor.from_long(projections)
+    with warnings.catch_warnings():
+        # Players missing from every source (mean of empty slice) are dropped below
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        mean, std = _points_distribution(tensor, stat_category, league_config["scoring"], variance, sources)
+    simulated = ~np.isnan(mean)
+
+    ranks = _calculate_replacement_level_ranks(league_config["roster"], include_bench)
+    eligibility = tensor.eligibility()[simulated]
+    eligible = np.stack([(eligibility & position.bit) != 0 for position in ranks], axis=1)
+    pools, windows = list(), list()
+    for j, rank in enumerate(ranks.values()):
+        pool = np.flatnonzero(eligible[:, j])
+        end = min(math.ceil(rank + replacement_players - 1), len(pool))
+        pools.append(pool)
+        windows.append((max(end - replacement_players, 0), end))
+
+    return _PlayerPool(
+        tensor.attributes[simulated].reset_index(drop=True),
+        mean[simulated].astype(np.float32),
+        std[simulated].astype(np.float32),
+        eligible,
+        pools,
+        windows,
+    )
+
+
+def _points_above_replacement(points, pool):
+    """PAR for a (samples x players) block: replacement windows are read per sample with a partition."""
+    levels = np.full((len(points), len(pool.pools)), np.nan, dtype=points.dtype)
+    for j, (players, (start, end)) in enumerate(zip(pool.pools, pool.windows)):
+        if end > start:
+            # After partitioning, columns start..end-1 hold exactly the players ranked there (descending)
+            ranked = -np.partition(-points[:, players], (start, end - 1), axis=1)
+            levels[:, j] = ranked[:, start:end].mean(axis=1)
+
+    # Best (lowest) eligible replacement level, falling back to the highest level
+    best = np.full(points.shape, np.inf, dtype=points.dtype)
+    for j in range(levels.shape[1]):
+        if not np.isnan(levels[:, j]).all():
+            best = np.where(pool.eligible[:, j], np.minimum(best, levels[:, j, None]), best)
+    fallback = np.nanmax(np.where(np.isnan(levels), -np.inf, levels), axis=1)
+    best = np.where(np.isfinite(best), best, fallback[:, None])
+
+    return points - best
+
+
+def _simulate_chunk(pools, samples, seed, total_auction_value, minimum_salary, power_factor):
+    """Simulate ``samples`` seasons; returns (points, par, value) sample blocks per pool as float32."""
+    rng = np.random.default_rng(seed)
+    points = [
+        pool.mean + pool.std * rng.standard_normal((samples, len(pool.mean)), dtype=np.float32) for pool in pools
+    ]
+    par = [_points_above_replacement(p, pool) for p, pool in zip(points, pools)]
+
+    scaled = [np.where(p > 0.0, p, 0.0) ** power_factor for p in par]
+    total_par = sum(s.sum(axis=1) for s in scaled)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        par_value = total_auction_value / total_par
+    values = [par_value[:, None] * s + minimum_salary for s in scaled]
+
+    return [
+        (p.astype(np.float32), r.astype(np.float32), v.astype(np.float32)) for p, r, v in zip(points, par, values)
+    ]
+
+
+def _percentiles(samples, percentiles=PERCENTILES):
+    """``np.percentile(samples, percentiles, axis=0)`` (linear interpolation) as a players x percentiles array.
+
+    Sorting each player's contiguous samples is several times faster than ``np.percentile`` on the
+    (samples x players) layout.
+    """
+    count = len(samples)
+    ordered = np.sort(np.ascontiguousarray(samples.T), axis=1)
+    positions = np.asarray(percentiles) / 100 * (count - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.minimum(lower + 1, count - 1)
+    fraction = positions - lower
+    return ordered[:, lower] * (1 - fraction) + ordered[:, upper] * fraction
+
+
+def simulate_projections(
+    bat_projections,
+    pit_projections,
+    league_config,
+    samples=1000,
+    variance="source",
+    sources=None,
+    power_factor=None,
+    include_bench=True,
+    replacement_players=5,
+    chunk_size=1000,
+    max_workers=None,
+    seed=0,
+):
+    """Monte Carlo percentiles of Points, PAR and auction value per player.
+
+    Each player's season points are drawn from a normal distribution around the mean across
+    ``sources`` (all sources by default). With ``variance="source"`` its spread is the cross-source
+    standard deviation of points. With ``variance="stat"`` it is built from the cross-source spread of
+    each stat, weighted by the league's scoring. Every sample then goes through replacement levels and
+    auction values like the point-estimate pipeline with the default ``replacement_mode="proportional"``;
+    slot assignment (``"assignment"``) is not simulated.
+
+    Samples are simulated in chunks of ``chunk_size``; with ``max_workers`` the chunks run in a process
+    pool. Returns ``(bat, pit)`` DataFrames with the player attributes and ``<column>_P10/P50/P90``
+    columns, ordered by median value.
+    """
+    if variance not in VARIANCE_MODES:
+        raise ValueError(f"variance must be one of {VARIANCE_MODES}.")
+
+    pools = [
+        _player_pool(projections, stat_category, league_config, variance, sources, include_bench, replacement_players)
+        for projections, stat_category in [
+            (bat_projections, StatCategory.BATTING),
+            (pit_projections, StatCategory.PITCHING),
+        ]
+    ]
+    total_auction_value = calculate_total_auction_value(league_config["roster"], league_config["salary"])
+    minimum_salary = league_config["salary"]["minimum"]
+
+    chunks = [min(chunk_size, samples - start) for start in range(0, samples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    args = [(pools, n, s, total_auction_value, minimum_salary, power_factor or 1.0) for n, s in zip(chunks, seeds)]
+    if max_workers and max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_simulate_chunk, *zip(*args)))
+    else:
+        results = [_simulate_chunk(*a) for a in args]
+
+    summaries = list()
+    for i, pool in enumerate(pools):
+        summary = pool.attributes.copy()
+        for k, column in enumerate(SIMULATED_COLUMNS):
+            blocks = np.concatenate([result[i][k] for result in results], axis=0)
+            for percentile, values in zip(PERCENTILES, _percentiles(blocks).T):
+                summary[f"{column}_P{percentile}"] = values.astype("float64").round(2)
+        summaries.append(summary.sort_values("Value_P50", ascending=False, ignore_index=True))
+
+    return tuple(summaries)
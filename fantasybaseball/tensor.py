@@ -0,0 +1,164 @@
+import math
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .aggregation import PLAYER_ATTRIBUTE_COLUMNS, player_keys
+from .model import Position
+from .positions import eligibility_masks
+from .replacement import _calculate_replacement_level_ranks
+from .scoring import calculate_score_vector
+
+
+@dataclass
+class ProjectionTensor:
+    """Projections as a dense players x sources x stats array.
+
+    ``values[i, j, k]`` is player ``i``'s projection for stat ``stats[k]`` from ``sources[j]``, NaN where
+    the source doesn't project the player (see ``present``). ``attributes`` holds one row of descriptive
+    columns (Name, IDs, Position, ...) per player, aligned with the first axis.
+
+    Built once from the long format with ``from_long``; per-source math then runs as array operations
+    instead of filtering the long frame by ``ProjectionSource``. ``to_long`` converts back for output.
+    """
+
+    values: np.ndarray
+    present: np.ndarray
+    sources: list
+    stats: list
+    attributes: pd.DataFrame
+
+    @classmethod
+    def from_long(cls, projections, stats=None):
+        """Build a tensor from long-format projections, one row per (player, source).
+
+        Players are matched across sources by ``aggregation.player_keys``; their attributes come from the
+        first non-null value. Several rows for one player from the same source raise ``ValueError``.
+        """
+        attribute_cols = [c for c in PLAYER_ATTRIBUTE_COLUMNS + ["Eligibility"] if c in projections]
+        if stats is None:
+            stats = [c for c in projections.select_dtypes(include=["number"]) if c not in attribute_cols]
+
+        keys = player_keys(projections)
+        source_codes, sources = pd.factorize(projections["ProjectionSource"])
+        player_count = keys.max() + 1 if len(keys) else 0
+        duplicated = pd.Series(keys * len(sources) + source_codes).duplicated().to_numpy()
+        if duplicated.any():
+            names = projections["Name"].iloc[np.flatnonzero(duplicated)] if "Name" in projections else []
+            raise ValueError(f"Several rows per player and source for: {sorted(set(map(str, names)))[:10]}")
+
+        values = np.full((player_count, len(sources), len(stats)), np.nan)
+        values[keys, source_codes] = projections[stats].to_numpy(dtype="float64", na_value=np.nan)
+        present = np.zeros((player_count, len(sources)), dtype=bool)
+        present[keys, source_codes] = True
+
+        attributes = projections[attribute_cols].reset_index(drop=True).groupby(keys).first().reset_index(drop=True)
+
+        return cls(values, present, list(sources), list(stats), attributes)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def stat(self, name):
+        """One stat as a players x sources array."""
+        return self.values[:, :, self.stats.index(name)]
+
+    def to_long(self, columns=None):
+        """Long-format DataFrame with one row per (source, player) present, sources in order.
+
+        ``columns`` maps extra column names to players x sources arrays (e.g. ``{"Points": points}``).
+        """
+        source_idx, player_idx = np.nonzero(self.present.T)
+        projections = self.attributes.iloc[player_idx].reset_index(drop=True)
+        projections.insert(0, "ProjectionSource", np.asarray(self.sources, dtype=object)[source_idx])
+        stats = pd.DataFrame(self.values[player_idx, source_idx], columns=self.stats)
+        extra = pd.DataFrame({name: array[player_idx, source_idx] for name, array in (columns or {}).items()})
+
+        return pd.concat([projections, stats, extra], axis=1)
+
+    def mean(self, sources=None, weights=None):
+        """Weighted mean across ``sources`` (all by default), skipping missing values; players x stats.
+
+        ``weights`` maps source names to weights; unlisted sources weigh 1.
+        """
+        source_weights = self._source_weights(sources, weights)
+        has_value = ~np.isnan(self.values)
+        weighted = np.where(has_value, self.values, 0.0) * source_weights[None, :, None]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return weighted.sum(axis=1) / (has_value * source_weights[None, :, None]).sum(axis=1)
+
+    def with_mean(self, name, sources=None, weights=None):
+        """Return a tensor with the consensus ``mean`` added as source ``name``."""
+        mean = self.mean(sources, weights)
+        values = np.concatenate([self.values, mean[:, None, :]], axis=1)
+        selected = self._source_weights(sources, weights) > 0
+        present = np.concatenate([self.present, self.present[:, selected].any(axis=1, keepdims=True)], axis=1)
+
+        return ProjectionTensor(values, present, self.sources + [name], self.stats, self.attributes)
+
+    def spread(self, sources=None):
+        """Cross-source standard deviation of every stat; players x stats (NaN with fewer than two sources)."""
+        values = self.values if sources is None else self.values[:, [self.sources.index(s) for s in sources]]
+        counts = (~np.isnan(values)).sum(axis=1)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            return np.where(counts > 1, np.nanstd(values, axis=1, ddof=1), np.nan)
+
+    def points(self, stat_category, league_scoring, use_stat_proxies=False):
+        """Points for every player and source with one einsum against the score vector; players x sources."""
+        score_vector = calculate_score_vector(stat_category, self.stats, league_scoring, use_stat_proxies)
+        points = np.einsum("psk,k->ps", np.nan_to_num(self.values), score_vector.to_numpy(dtype="float64"))
+        return np.where(self.present, points, np.nan)
+
+    def eligibility(self):
+        """Position eligibility bitmask per player."""
+        if "Eligibility" in self.attributes:
+            return self.attributes["Eligibility"].to_numpy()
+        return eligibility_masks(self.attributes["Position"])
+
+    def replacement_levels(self, points, league_roster, include_bench=True, replacement_players=5):
+        """Replacement-level points per source and position as a DataFrame (sources x positions).
+
+        Matches ``replacement._calculate_replacement_level_points``: the mean of the ``replacement_players``
+        players ending at each position's replacement rank, computed for all sources at once.
+        """
+        ranks = _calculate_replacement_level_ranks(league_roster, include_bench)
+        eligibility = self.eligibility()
+
+        levels = np.full((len(self.sources), len(ranks)), np.nan)
+        for j, (position, rank) in enumerate(ranks.items()):
+            pool = np.where((eligibility & position.bit)[:, None] != 0, points, np.nan)
+            # Descending per source, with missing values last
+            ordered = -np.sort(-pool, axis=0)
+            sizes = (~np.isnan(pool)).sum(axis=0)
+            end = np.minimum(math.ceil(rank + replacement_players - 1), sizes)
+            start = np.maximum(end - replacement_players, 0)
+            cumulative = np.vstack([np.zeros(len(self.sources)), np.nancumsum(ordered, axis=0)])
+            columns = np.arange(len(self.sources))
+            with np.errstate(invalid="ignore", divide="ignore"):
+                levels[:, j] = (cumulative[end, columns] - cumulative[start, columns]) / (end - start)
+
+        return pd.DataFrame(levels, index=self.sources, columns=[position.value for position in ranks])
+
+    def points_above_replacement(self, points, league_roster, include_bench=True):
+        """PAR for every player and source against the best (lowest) eligible replacement level."""
+        levels = self.replacement_levels(points, league_roster, include_bench)
+        position_bits = np.array([Position(p).bit for p in levels.columns], dtype=np.int64)
+        eligible = (self.eligibility()[:, None] & position_bits) != 0
+
+        table = levels.to_numpy()
+        best = np.where(eligible[:, None, :], table[None, :, :], np.inf).min(axis=2, initial=np.inf)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            fallback = np.nanmax(table, axis=1)
+        replacement = np.where(np.isfinite(best), best, fallback[None, :])
+
+        return points - replacement
+
+    def _source_weights(self, sources, weights):
+        selected = self.sources if sources is None else [getattr(s, "value", s) for s in sources]
+        weights = {getattr(source, "value", source): weight for source, weight in (weights or {}).items()}
+        return np.array([weights.get(s, 1.0) if s in selected else 0.0 for s in self.sources])
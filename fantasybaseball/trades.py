@@ -0,0 +1,332 @@
+import argparse
+import itertools
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from .config import load_league_config
+from .dtypes import concat_projections
+from .lineup import slot_types
+from .positions import eligibility_masks
+from .powerrankings import load_projections
+
+TEAM_ARRAY_COLUMNS = ["Points", "PAR", "PlayerValue", "Salary", "ContractValue"]
+DEFAULT_TRADE_SIZES = ((1, 1), (2, 1), (1, 2), (2, 2))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Score fantasy baseball trades by optimal-lineup points.")
+    parser.add_argument("-b", "--bat-projections", required=True, help="Path to batters projection CSV")
+    parser.add_argument("-p", "--pit-projections", required=True, help="Path to pitchers projection CSV")
+    parser.add_argument("-l", "--league-file", required=True, help="League YAML with roster positions")
+    parser.add_argument("-t", "--team", required=True, help="Team to find trades for")
+    parser.add_argument("--partner", nargs="+", default=None, help="Trade partners (default: every other team)")
+    parser.add_argument("--projection-source", default="zobs", help="Projection type to use (default: zobs)")
+    parser.add_argument(
+        "--sizes", nargs="+", default=["1x1", "2x1", "1x2", "2x2"], help="Trade sizes as GIVExGET (default: all)"
+    )
+    parser.add_argument("--top", type=int, default=25, help="Number of trades to show (default: 25)")
+    parser.add_argument("--cache-dir", default=None, help="Directory for cached parsed projections")
+    return parser.parse_args()
+
+
+@dataclass
+class TeamArrays:
+    """One team's players sorted by descending points, as aligned arrays."""
+
+    names: np.ndarray
+    eligibility: np.ndarray
+    points: np.ndarray
+    par: np.ndarray
+    player_value: np.ndarray
+    salary: np.ndarray
+    contract_value: np.ndarray
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_players(cls, players):
+        players = players.sort_values("Points", ascending=False, kind="stable")
+
+        def column(name):
+            if name not in players:
+                return np.full(len(players), np.nan)
+            return players[name].to_numpy(dtype="float64", na_value=np.nan)
+
+        return cls(
+            players["Name"].to_numpy(dtype=object),
+            eligibility_masks(players["Position"]),
+            *(column(c) for c in TEAM_ARRAY_COLUMNS),
+        )
+
+
+class _LineupFamily:
+    """Hall's-condition bookkeeping for batched optimal lineups.
+
+    A set of players can fill distinct starting slots iff, for every set ``U`` of slot types, the players
+    eligible only within ``U`` number no more than ``U``'s slots. It's enough to check the ``U`` that are
+    unions of player neighborhoods, built separately per connected group of slot types (batting and
+    pitching slots never share a player). Each player adds one to the count of every family set containing
+    its neighborhood, so independence is a counter comparison that vectorizes across candidate rosters.
+    The legal lineups are a transversal matroid, so greedy and single-exchange updates are exact.
+    """
+
+    def __init__(self, roster_positions, eligibility):
+        _, accepts, capacities = slot_types(roster_positions, include_bench=False)
+        self.classes = np.unique(eligibility)
+        # Neighborhood of each distinct eligibility mask as a bitmask over slot types
+        self.neighborhoods = np.array(
+            [sum(1 << t for t, a in enumerate(accepts) if int(mask) & a) for mask in self.classes], dtype=np.int64
+        )
+
+        family = set()
+        for component in self._components([int(n) for n in self.neighborhoods if n]):
+            unions = set()
+            for neighborhood in component:
+                unions |= {neighborhood} | {neighborhood | u for u in unions}
+            family |= unions
+        self.family = np.array(sorted(family), dtype=np.int64)
+        self.capacity = np.array(
+            [sum(c for t, c in enumerate(capacities) if int(u) >> t & 1) for u in self.family], dtype=np.int16
+        )
+        # supersets[class, i]: the family set i contains the class's neighborhood (never for no neighborhood)
+        self.supersets = (
+            ((self.neighborhoods[:, None] & ~self.family[None, :]) == 0) & (self.neighborhoods[:, None] != 0)
+        ).astype(np.int16)
+
+    @staticmethod
+    def _components(neighborhoods):
+        components = list()
+        for neighborhood in set(neighborhoods):
+            joined = [c for c in components if any(n & neighborhood for n in c)]
+            merged = {neighborhood}.union(*joined)
+            components = [c for c in components if c not in joined] + [merged]
+        return components
+
+    def codes(self, eligibility):
+        return np.searchsorted(self.classes, eligibility)
+
+    def greedy(self, points, eligibility, members):
+        """Optimal lineups for each row of ``members`` (candidate rosters x players).
+
+        Returns ``(totals, starters, counts)``: lineup points, the starting players and the family counts.
+        """
+        codes = self.codes(eligibility)
+        order = np.argsort(-np.nan_to_num(points, nan=-np.inf), kind="stable")
+        offered = ~np.isnan(points) & (self.neighborhoods[codes] != 0)
+
+        totals = np.zeros(len(members))
+        starters = np.zeros(members.shape, dtype=bool)
+        counts = np.zeros((len(members), len(self.family)), dtype=np.int16)
+        for j in order[offered[order]]:
+            columns = np.flatnonzero(self.supersets[codes[j]])
+            fits = members[:, j] & (counts[:, columns] < self.capacity[columns]).all(axis=1)
+            counts[:, columns] += fits[:, None]
+            totals += fits * points[j]
+            starters[:, j] = fits
+        return totals, starters, counts
+
+
+class TradeEvaluator:
+    """Scores trades by the change in each side's optimal-lineup points and contract value.
+
+    Built once from one projection source's signed players (``Status`` is the team); each team's players
+    are kept as ``TeamArrays`` sorted by points. For a batch of trades, each side's optimal lineup without
+    the players it gives is solved once per distinct give set. Each received player is then inserted with
+    a single matroid exchange (it replaces the weakest starter it could swap with, if that's an
+    improvement), as array operations over every trade in the batch.
+    """
+
+    def __init__(self, players, league_roster, chunk_size=50_000):
+        players = players[players["Status"].notna() & (players["Status"] != "FA")]
+        self.chunk_size = chunk_size
+        self.teams = {
+            str(team): TeamArrays.from_players(team_players)
+            for team, team_players in players.groupby("Status", observed=True, sort=True)
+        }
+        self.family = _LineupFamily(league_roster["positions"], eligibility_masks(players["Position"]))
+        self.baseline = {team: self._lineups(team, np.full((1, 0), -1))[0][0] for team in self.teams}
+
+    @classmethod
+    def from_files(cls, bat_path, pit_path, projection_source, league_roster, cache_dir=None):
+        players = concat_projections([load_projections(Path(p), cache_dir) for p in (bat_path, pit_path)])
+        return cls(players[players["ProjectionSource"] == projection_source], league_roster)
+
+    def _lineups(self, team, give_sets):
+        """Optimal lineups of ``team`` without each give set (rows of indices, -1 padded).
+
+        Returns ``(totals, lineups, counts)``, with each lineup as its starters' indices (-1 padded).
+        """
+        arrays = self.teams[team]
+        members = np.ones((len(give_sets), len(arrays) + 1), dtype=bool)
+        # Padding (-1) lands in a spare last column
+        members[np.arange(len(give_sets))[:, None], give_sets] = False
+        totals, starters, counts = self.family.greedy(arrays.points, arrays.eligibility, members[:, :-1])
+
+        width = starters.sum(axis=1).max(initial=0)
+        order = np.argsort(~starters, axis=1, kind="stable")[:, :width]
+        return totals, np.where(np.take_along_axis(starters, order, axis=1), order, -1), counts
+
+    def _lineup_points(self, team, partner, lineups, gets):
+        """Lineup points of ``team`` after receiving ``gets`` from ``partner`` (rows of indices, -1 padded).
+
+        ``lineups`` are the ``(totals, lineups, counts)`` of ``team`` without each trade's give set.
+        """
+        own, other = self.teams[team], self.teams[partner]
+        family = self.family
+        # Players of both teams share one table; the partner's come after the team's own
+        points = np.concatenate([own.points, other.points, [np.inf]])
+        codes = family.codes(np.concatenate([own.eligibility, other.eligibility]))
+        neighborhoods = np.append(family.neighborhoods[codes], 0)
+        supersets = np.vstack([family.supersets[codes], np.zeros((1, len(family.family)), dtype=np.int16)])
+
+        totals, lineup, counts = lineups
+        # Make room for the received players (-1 is an empty spot)
+        lineup = np.concatenate([lineup, np.full(gets.shape, -1)], axis=1)
+
+        rows = np.arange(len(gets))
+        received = np.where(gets >= 0, gets + len(own), -1)
+        for k in range(gets.shape[1]):
+            player = received[:, k]
+            valid = (player >= 0) & np.isfinite(points[player]) & (neighborhoods[player] != 0)
+
+            over = counts + supersets[player] > family.capacity
+            fits = valid & ~over.any(axis=1)
+            # The exchange circuit: starters whose neighborhoods lie within every family set that would overflow
+            bound = np.bitwise_and.reduce(np.where(over, family.family, -1), axis=1)
+            in_circuit = (lineup >= 0) & ((neighborhoods[lineup] & ~bound[:, None]) == 0)
+            circuit_points = np.where(in_circuit, points[lineup], np.inf)
+            weakest = circuit_points.argmin(axis=1)
+            weakest_player = lineup[rows, weakest]
+            swap = valid & ~fits & (circuit_points[rows, weakest] < points[player])
+
+            added = fits | swap
+            dropped = np.where(swap, weakest_player, -1)
+            counts += added[:, None] * supersets[player] - supersets[dropped]
+            totals += np.where(added, points[player], 0.0) - np.where(swap, points[dropped], 0.0)
+            lineup[rows[swap], weakest[swap]] = -1
+            lineup[:, -gets.shape[1] + k] = np.where(added, player, -1)
+
+        return totals
+
+    def evaluate(self, team, partner, gives, gets):
+        """Score trades where ``team`` sends ``gives[i]`` to ``partner`` for ``gets[i]``.
+
+        ``gives`` and ``gets`` hold index tuples (or -1 padded index rows) into each team's ``TeamArrays``.
+        Returns one row per trade with the players moved and each side's change in lineup points and
+        contract value.
+        """
+        a, b = self.teams[team], self.teams[partner]
+        give_sets, give_codes = _index_sets(gives)
+        get_sets, get_codes = _index_sets(gets)
+        a_lineups, b_lineups = self._lineups(team, give_sets), self._lineups(partner, get_sets)
+
+        a_points, b_points = np.zeros(len(give_codes)), np.zeros(len(give_codes))
+        for start in range(0, len(give_codes), self.chunk_size):
+            chunk = slice(start, start + self.chunk_size)
+            give_chunk, get_chunk = give_codes[chunk], get_codes[chunk]
+            a_points[chunk] = self._lineup_points(
+                team, partner, [x[give_chunk] for x in a_lineups], get_sets[get_chunk]
+            )
+            b_points[chunk] = self._lineup_points(
+                partner, team, [x[get_chunk] for x in b_lineups], give_sets[give_chunk]
+            )
+
+        a_value = _sum_at(b.contract_value, get_sets)[get_codes] - _sum_at(a.contract_value, give_sets)[give_codes]
+        return pd.DataFrame(
+            {
+                "Team": team,
+                "Gives": _labels(a.names, give_sets)[give_codes],
+                "Partner": partner,
+                "Gets": _labels(b.names, get_sets)[get_codes],
+                "PointsChange": (a_points - self.baseline[team]).round(2),
+                "PartnerPointsChange": (b_points - self.baseline[partner]).round(2),
+                "ContractValueChange": a_value.round(2),
+                "PartnerContractValueChange": (-a_value).round(2),
+            }
+        )
+
+    def enumerate_trades(self, team, partner, sizes=DEFAULT_TRADE_SIZES):
+        """Score every trade of the given ``(give, get)`` sizes between ``team`` and ``partner``.
+
+        Sorted so trades that help both sides the most (by the smaller points change) come first.
+        """
+        width = max(max(size) for size in sizes)
+        gives, gets = list(), list()
+        for give_count, get_count in sizes:
+            give_sets = _combinations(len(self.teams[team]), give_count, width)
+            get_sets = _combinations(len(self.teams[partner]), get_count, width)
+            gives.append(np.repeat(give_sets, len(get_sets), axis=0))
+            gets.append(np.tile(get_sets, (len(give_sets), 1)))
+
+        return _by_worst_side(self.evaluate(team, partner, np.concatenate(gives), np.concatenate(gets)))
+
+
+def _padded(index_sets):
+    """Index tuples as a -1 padded integer array."""
+    if isinstance(index_sets, np.ndarray):
+        return index_sets.astype(np.int64).reshape(len(index_sets), -1)
+    width = max((len(s) for s in index_sets), default=0)
+    padded = np.full((len(index_sets), width), -1, dtype=np.int64)
+    for i, index_set in enumerate(index_sets):
+        padded[i, : len(index_set)] = index_set
+    return padded
+
+
+def _index_sets(index_sets):
+    """Distinct index sets (sorted, -1 padded rows) and each input's row among them."""
+    padded = _padded(index_sets)
+    padded = np.sort(np.where(padded >= 0, padded, np.iinfo(np.int64).max), axis=1)
+    padded[padded == np.iinfo(np.int64).max] = -1
+    # One integer key per set keeps np.unique one-dimensional
+    keys = np.zeros(len(padded), dtype=np.int64)
+    if padded.shape[1]:
+        keys = np.ravel_multi_index(tuple((padded + 1).T), (padded.max(initial=0) + 2,) * padded.shape[1])
+    _, first, codes = np.unique(keys, return_index=True, return_inverse=True)
+    return padded[first], codes
+
+
+def _combinations(n, r, width):
+    combinations = np.full((0, width), -1, dtype=np.int64)
+    if r <= n:
+        combinations = np.full((math.comb(n, r), width), -1, dtype=np.int64)
+        combinations[:, :r] = np.array(list(itertools.combinations(range(n), r)), dtype=np.int64).reshape(-1, r)
+    return combinations
+
+
+def _labels(names, index_sets):
+    return np.array([" + ".join(names[index_set[index_set >= 0]]) for index_set in index_sets], dtype=object)
+
+
+def _sum_at(values, indices):
+    return np.where(indices >= 0, np.nan_to_num(values)[indices], 0.0).sum(axis=1)
+
+
+def _by_worst_side(trades):
+    worst_side = np.minimum(trades["PointsChange"], trades["PartnerPointsChange"]).to_numpy()
+    return trades.iloc[np.argsort(-worst_side, kind="stable")].reset_index(drop=True)
+
+
+def main():
+    args = parse_args()
+
+    with open(Path(args.league_file).resolve()) as f:
+        league = load_league_config(yaml.safe_load(f))
+    evaluator = TradeEvaluator.from_files(
+        args.bat_projections, args.pit_projections, args.projection_source, league.roster, args.cache_dir
+    )
+    sizes = [tuple(int(n) for n in size.lower().split("x")) for size in args.sizes]
+    partners = args.partner or [team for team in evaluator.teams if team != args.team]
+
+    print(f"\nProjection Source: {args.projection_source}")
+    print(f"Team: {args.team} ({evaluator.baseline[args.team]:.2f} lineup points)")
+
+    trades = _by_worst_side(pd.concat([evaluator.enumerate_trades(args.team, partner, sizes) for partner in partners]))
+    trades.index = trades.index + 1
+    with pd.option_context("display.max_columns", None, "display.width", 200, "display.max_colwidth", 60):
+        print(trades.head(args.top))
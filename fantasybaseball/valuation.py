@@ -1,3 +1,61 @@
+import numpy as np
+import pandas as pd
+
+
+def _minors_pct(league_salary):
+    return league_salary.get("minors_pct", 0.0) if hasattr(league_salary, "get") else league_salary["minors_pct"]
+
+
+def calculate_total_auction_value(league_roster, league_salary, salary_cap=None, minors_pct=None):
+    """Dollars to spend above the minimum salary; ``salary_cap``/``minors_pct`` override the league's.
+
+    Broadcasts when ``salary_cap`` or ``minors_pct`` are arrays.
+    """
+    team_count = league_roster["teams"]
+    if not isinstance(team_count, int):
+        team_count = len(team_count)
+    roster_spots = sum(league_roster["positions"].values())
+    if salary_cap is None:
+        salary_cap = league_salary["cap"]
+    if minors_pct is None:
+        minors_pct = _minors_pct(league_salary)
+    effective_cap = np.asarray(salary_cap, dtype="float64") * (1 - np.asarray(minors_pct, dtype="float64"))
+    total_budget = team_count * effective_cap
+    total_roster_spots = team_count * roster_spots
+
+    return total_budget - (total_roster_spots * league_salary["minimum"])
+
+
+def _par_pool(bat_projections, pit_projections, bat_pool_mask, pit_pool_mask):
+    """PAR, source codes and pool membership for batters and pitchers stacked into one array."""
+    par = np.concatenate(
+        [
+            bat_projections["PAR"].to_numpy(dtype="float64", na_value=np.nan),
+            pit_projections["PAR"].to_numpy(dtype="float64", na_value=np.nan),
+        ]
+    )
+    source_codes, sources = pd.factorize(
+        np.concatenate(
+            [
+                np.asarray(bat_projections["ProjectionSource"], dtype=object),
+                np.asarray(pit_projections["ProjectionSource"], dtype=object),
+            ]
+        )
+    )
+
+    in_pool = par > 0.0
+    for mask, projections, rows in [
+        (bat_pool_mask, bat_projections, slice(0, len(bat_projections))),
+        (pit_pool_mask, pit_projections, slice(len(bat_projections), None)),
+    ]:
+        if mask is not None:
+            if isinstance(mask, pd.Series):
+                mask = mask.reindex(projections.index, fill_value=False)
+            in_pool[rows] &= np.asarray(mask, dtype=bool)
+
+    return par, source_codes, len(sources), in_pool
+
+
 def calculate_auction_values(
     bat_projections,
     pit_projections,
@@ -8,61 +66,73 @@ def calculate_auction_values(
     bat_pool_mask=None,
     pit_pool_mask=None,
 ):
-    team_count = league_roster["teams"]
-    roster_spots = sum(league_roster["positions"].values())
-    salary_cap = league_salary["cap"]
-    minimum_salary = league_salary["minimum"]
-    minors_pct = league_salary.get("minors_pct", 0.0) if hasattr(league_salary, "get") else league_salary["minors_pct"]
-    effective_cap = salary_cap * (1 - minors_pct)
-    total_budget = team_count * effective_cap
-    total_roster_spots = team_count * roster_spots
-
     if total_auction_value is None:
-        total_auction_value = total_budget - (total_roster_spots * minimum_salary)
-
-    if bat_pool_mask is None:
-        bat_pool_mask = bat_projections.index.to_series().map(lambda _: True)
-    if pit_pool_mask is None:
-        pit_pool_mask = pit_projections.index.to_series().map(lambda _: True)
-
-    total_par = dict()
-    bat_projection_sources = bat_projections["ProjectionSource"].unique()
-    pit_projection_sources = pit_projections["ProjectionSource"].unique()
-    projection_sources = set(bat_projection_sources).union(set(pit_projection_sources))
-    for projection_source in projection_sources:
-        bat_par = (
-            bat_projections.loc[
-                (bat_projections["ProjectionSource"] == projection_source)
-                & (bat_projections["PAR"] > 0.0)
-                & bat_pool_mask
-            ]["PAR"]
-            .pow(power_factor)
-            .sum()
-        )
+        total_auction_value = calculate_total_auction_value(league_roster, league_salary)
 
-        pit_par = (
-            pit_projections.loc[
-                (pit_projections["ProjectionSource"] == projection_source)
-                & (pit_projections["PAR"] > 0.0)
-                & pit_pool_mask
-            ]["PAR"]
-            .pow(power_factor)
-            .sum()
-        )
-        total_par[projection_source] = bat_par + pit_par
+    par, source_codes, source_count, in_pool = _par_pool(bat_projections, pit_projections, bat_pool_mask, pit_pool_mask)
 
-    par_value = {p: total_auction_value / t for p, t in total_par.items()}
+    # Total PAR^pf of each source's pool in one grouped pass over batters and pitchers
+    scaled = np.where(par > 0.0, par, 0.0) ** power_factor
+    scaled = np.where(np.isnan(par), np.nan, scaled)
+    total_par = np.bincount(source_codes, weights=np.where(in_pool, scaled, 0.0), minlength=source_count)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = total_auction_value / total_par[source_codes] * scaled + league_salary["minimum"]
 
-    bat_values = (
-        bat_projections["ProjectionSource"].map(par_value) * bat_projections["PAR"].clip(lower=0).pow(power_factor)
-        + minimum_salary
-    )
-    pit_values = (
-        pit_projections["ProjectionSource"].map(par_value) * pit_projections["PAR"].clip(lower=0).pow(power_factor)
-        + minimum_salary
+    return (
+        pd.Series(values[: len(bat_projections)], index=bat_projections.index),
+        pd.Series(values[len(bat_projections) :], index=pit_projections.index),
     )
 
-    return bat_values, pit_values
+
+def calculate_auction_value_grid(
+    bat_projections,
+    pit_projections,
+    league_roster,
+    league_salary,
+    power_factors=(1.0,),
+    salary_caps=None,
+    minors_pcts=None,
+    bat_pool_mask=None,
+    pit_pool_mask=None,
+):
+    """Auction values for every combination of power factor, salary cap and minors percentage at once.
+
+    Caps and minors percentages default to the league's. Returns ``(bat_values, pit_values)`` DataFrames
+    aligned with the projections, with one column per setting under a ``(power_factor, cap, minors_pct)``
+    column MultiIndex. Each column equals ``calculate_auction_values`` run with that setting, but the
+    per-source PAR totals are computed once per power factor and shared by every cap and minors
+    percentage.
+    """
+    power_factors = np.atleast_1d(np.asarray(power_factors, dtype="float64"))
+    salary_caps = np.atleast_1d(np.asarray(league_salary["cap"] if salary_caps is None else salary_caps))
+    if minors_pcts is None:
+        minors_pcts = _minors_pct(league_salary)
+    minors_pcts = np.atleast_1d(np.asarray(minors_pcts, dtype="float64"))
+
+    par, source_codes, source_count, in_pool = _par_pool(bat_projections, pit_projections, bat_pool_mask, pit_pool_mask)
+
+    # (power factors x rows)
+    scaled = np.where(par > 0.0, par, 0.0)[None, :] ** power_factors[:, None]
+    scaled = np.where(np.isnan(par)[None, :], np.nan, scaled)
+    # (power factors x sources)
+    pool_par = np.where(in_pool, scaled, 0.0)
+    total_par = np.stack([np.bincount(source_codes, weights=w, minlength=source_count) for w in pool_par])
+    # (caps x minors_pcts)
+    budgets = calculate_total_auction_value(league_roster, league_salary, salary_caps[:, None], minors_pcts[None, :])
+
+    # (power factors x caps x minors_pcts x rows)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        par_value = budgets[None, :, :, None] / total_par[:, None, None, source_codes]
+        values = par_value * scaled[:, None, None, :] + league_salary["minimum"]
+
+    columns = pd.MultiIndex.from_product(
+        [power_factors, salary_caps, minors_pcts], names=["power_factor", "cap", "minors_pct"]
+    )
+    values = values.reshape(len(columns), len(par)).T
+    return (
+        pd.DataFrame(values[: len(bat_projections)], index=bat_projections.index, columns=columns),
+        pd.DataFrame(values[len(bat_projections) :], index=pit_projections.index, columns=columns),
+    )
 
 
 def calculate_available_budget(
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+SOURCES = ["oopsy", "steamer", "thebatx", "thebat", "zipsdc"]
+
+
+def _projections(batting, players=30):
+    """Long-format batting or pitching projections for ``players`` players from every source in ``SOURCES``."""
+    rng = np.random.default_rng(0 if batting else 1)
+    frames = list()
+    for source in SOURCES:
+        frame = pd.DataFrame(
+            {
+                "ProjectionSource": source,
+                "Name": [f"Player {i}" for i in range(players)],
+                "MlbamId": pd.array(np.arange(players) + (1000 if batting else 2000), dtype="Int64"),
+                "FangraphsId": pd.array(np.arange(players) + (1 if batting else 501), dtype="Int64"),
+                "Position": rng.choice(["C", "1B", "2B", "SS", "3B", "OF"] if batting else ["SP", "RP"], players),
+                "League": "AL",
+                "Team": "LAA",
+                "ShortName": "LAA",
+            }
+        )
+        if batting:
+            frame["G"] = rng.uniform(50, 160, players)
+            for stat in ["AB", "H", "2B", "3B", "HR", "R", "RBI", "BB", "SO", "SB"]:
+                frame[stat] = rng.uniform(0, 100, players)
+        else:
+            frame["IP"] = rng.uniform(20, 200, players)
+            for stat in ["GS", "W", "L", "SV", "SO", "ER", "BB"]:
+                frame[stat] = rng.uniform(0, 30, players)
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.fixture
+def league_yaml():
+    return {
+        "name": "test",
+        "scoring": {"bat": {"HR": 4, "R": 1, "RBI": 1, "SO": -1}, "pit": {"IP": 3, "SO": 1, "ER": -2}},
+        "roster": {"teams": 2, "positions": {"C": 1, "1B": 1, "OF": 2, "UTIL": 1, "P": 4, "bench": 2}},
+        "salary": {"cap": 260, "minimum": 1},
+    }
+
+
+@pytest.fixture
+def make_projections():
+    """Builder for synthetic projections: ``make_projections(batting, players=30)``."""
+    return _projections
+
+
+@pytest.fixture
+def projection_sources():
+    return list(SOURCES)
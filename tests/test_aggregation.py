@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fantasybaseball.aggregation import add_mean_projection, player_keys
+from fantasybaseball.model import ProjectionSource, ProjectionSourceName
+
+
+@pytest.fixture
+def projections():
+    return pd.DataFrame(
+        {
+            "ProjectionSource": ["steamer", "zipsdc", "steamer", "zipsdc", "steamer", "zipsdc"],
+            "Name": ["A", "A", "B", "B", "C", "C"],
+            "MlbamId": pd.array([1, 1, 2, None, None, None], dtype="Int64"),
+            "FangraphsId": pd.array([11, 11, 12, 12, None, None], dtype="Int64"),
+            "Position": ["1B", "1B/3B", "SS", "SS", "OF", "OF"],
+            "Team": ["LAA", "NYY", "BOS", "BOS", None, None],
+            "HR": [10.0, 20.0, 30.0, np.nan, 5.0, 7.0],
+        }
+    )
+
+
+class TestPlayerKeys:
+    def test_mlbam_then_fangraphs_then_name(self, projections):
+        # B's second row has no MLBAM ID but its Fangraphs ID pairs with MLBAM ID 2
+        assert player_keys(projections).tolist() == [0, 0, 1, 1, 2, 2]
+
+    def test_fangraphs_only(self):
+        frame = pd.DataFrame(
+            {
+                "MlbamId": pd.array([None, None, None], dtype="Int64"),
+                "FangraphsId": pd.array([7, 8, 7], dtype="Int64"),
+                "Name": ["X", "X", "Y"],
+            }
+        )
+        assert player_keys(frame).tolist() == [0, 1, 0]
+
+    def test_filled_ids_fall_back_to_name(self):
+        # add_mean_projection fills missing IDs with -1 and missing names with "--"
+        frame = pd.DataFrame(
+            {
+                "MlbamId": pd.array([-1, -1, -1, -1, -1], dtype="Int64"),
+                "FangraphsId": pd.array([-1, -1, -1, -1, 0], dtype="Int64"),
+                "Name": ["Prospect A", "Prospect B", "Prospect A", "--", "--"],
+            }
+        )
+        assert player_keys(frame).tolist() == [0, 1, 0, 2, 3]
+
+
+class TestAddMeanProjection:
+    def test_one_row_per_player(self, projections):
+        result = add_mean_projection(projections, name="mean")
+        means = result[result["ProjectionSource"] == "mean"].set_index("Name")
+
+        assert len(means) == 3
+        assert means.loc["A", "HR"] == 15.0
+        # Missing stats are skipped rather than counted as zero
+        assert means.loc["B", "HR"] == 30.0
+        # Attributes come from the first row
+        assert means.loc["A", "Team"] == "LAA"
+        assert means.loc["A", "Position"] == "1B"
+
+    def test_caller_frame_unchanged(self, projections):
+        original = projections.copy()
+        add_mean_projection(projections)
+        pd.testing.assert_frame_equal(projections, original)
+
+    def test_missing_attributes_filled(self, projections):
+        result = add_mean_projection(projections)
+        assert (result.loc[result["Name"] == "C", "Team"] == "--").all()
+        assert (result.loc[result["Name"] == "C", "MlbamId"] == -1).all()
+
+    def test_selected_sources(self, projections):
+        steamer = ProjectionSource(ProjectionSourceName.STEAMER)
+        result = add_mean_projection(projections, [steamer], name="mean")
+        means = result[result["ProjectionSource"] == "mean"].set_index("Name")
+        assert means.loc["A", "HR"] == 10.0
+
+    def test_weights(self, projections):
+        result = add_mean_projection(projections, name="mean", weights={"steamer": 3.0})
+        means = result[result["ProjectionSource"] == "mean"].set_index("Name")
+        assert means.loc["A", "HR"] == pytest.approx((3 * 10.0 + 20.0) / 4)
+        assert means.loc["C", "HR"] == pytest.approx((3 * 5.0 + 7.0) / 4)
@@ -0,0 +1,168 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fantasybaseball.auction import AuctionState, create_auction_server
+from fantasybaseball.valuation import calculate_auction_values, calculate_available_budget
+
+ROSTER = {"teams": 2, "positions": {"C": 1, "P": 1, "bench": 1}, "minors": 0}
+SALARY = {"cap": 100, "minimum": 1}
+
+
+def _projections(names, pars, statuses, first_id):
+    return pd.DataFrame(
+        {
+            "ProjectionSource": np.repeat(["steamer", "zips"], len(names)),
+            "Name": names * 2,
+            "MlbamId": list(range(first_id, first_id + len(names))) * 2,
+            "FangraphsId": np.nan,
+            "Status": statuses * 2,
+            "PAR": pars + [p * 0.5 for p in pars],
+        }
+    )
+
+
+@pytest.fixture
+def frames():
+    bat = _projections(["Catcher A", "Catcher B", "Catcher C"], [50.0, 20.0, -5.0], ["T1", "FA", "FA"], 1)
+    pit = _projections(["Pitcher A", "Pitcher B"], [40.0, np.nan], ["FA", "FA"], 100)
+    export = pd.DataFrame({"Status": ["T1", "FA"], "Salary": [30.0, np.nan]})
+    return bat, pit, export
+
+
+def _expected_values(bat, pit, export, power_factor=1.0):
+    budget = calculate_available_budget(ROSTER, SALARY, export)
+    signed_bat = bat["Status"] != "FA"
+    signed_pit = pit["Status"] != "FA"
+    bat_values, pit_values = calculate_auction_values(
+        bat, pit, ROSTER, SALARY, power_factor, budget, ~signed_bat, ~signed_pit
+    )
+    return np.concatenate([bat_values, pit_values])
+
+
+class TestAuctionState:
+    def test_default_source_is_consensus(self, frames):
+        bat, pit, export = frames
+        bat.loc[bat["ProjectionSource"] == "zips", "ProjectionSource"] = "zobs"
+
+        state = AuctionState(bat, pit, ROSTER, SALARY, export)
+
+        assert state.default_source == "zobs"
+        assert {p["ProjectionSource"] for p in state.top()} == {"zobs"}
+
+    def test_initial_values_match_full_valuation(self, frames):
+        bat, pit, export = frames
+        state = AuctionState(bat, pit, ROSTER, SALARY, export, power_factor=1.5)
+
+        np.testing.assert_allclose(state.auction_values(), _expected_values(bat, pit, export, 1.5))
+        assert state.available_budget == calculate_available_budget(ROSTER, SALARY, export)
+
+    def test_sign_matches_full_valuation(self, frames):
+        bat, pit, export = frames
+        state = AuctionState(bat, pit, ROSTER, SALARY, export)
+
+        records = state.sign(2, "T2", 12)
+
+        bat.loc[bat["MlbamId"] == 2, "Status"] = "T2"
+        export = pd.concat([export, pd.DataFrame({"Status": ["T2"], "Salary": [12.0]})], ignore_index=True)
+        np.testing.assert_allclose(state.auction_values(), _expected_values(bat, pit, export))
+        assert [(r["ProjectionSource"], r["Status"], r["Salary"]) for r in records] == [
+            ("steamer", "T2", 12.0),
+            ("zips", "T2", 12.0),
+        ]
+
+    def test_undo_restores_values(self, frames):
+        state = AuctionState(frames[0], frames[1], ROSTER, SALARY, frames[2])
+        before, budget = state.auction_values(), state.available_budget
+
+        state.sign("Pitcher A", "T2", 20)
+        state.undo()
+
+        np.testing.assert_allclose(state.auction_values(), before)
+        assert state.available_budget == budget
+        with pytest.raises(ValueError):
+            state.undo()
+
+    def test_top_skips_signed_players(self, frames):
+        state = AuctionState(frames[0], frames[1], ROSTER, SALARY, frames[2])
+        state.sign("Catcher B", "T2", 5)
+
+        assert [r["Name"] for r in state.top("steamer", limit=2)] == ["Pitcher A", "Catcher C"]
+        assert [r["Name"] for r in state.top("steamer", limit=2, available=False)] == ["Catcher A", "Pitcher A"]
+
+    def test_invalid_signings(self, frames):
+        bat, pit, export = frames
+        bat.loc[2, "Name"] = "Catcher B"
+        bat.loc[5, "Name"] = "Catcher B"
+        state = AuctionState(bat, pit, ROSTER, SALARY, export)
+
+        with pytest.raises(KeyError):
+            state.sign("Nobody", "T2", 5)
+        with pytest.raises(ValueError, match="more than one player"):
+            state.sign("Catcher B", "T2", 5)
+        with pytest.raises(ValueError, match="already signed"):
+            state.sign(1, "T2", 5)
+
+    def test_name_shared_by_players_without_ids(self, frames):
+        bat, pit, export = frames
+        # Two prospects named alike in every source, with the -1 IDs that augmentation fills in
+        bat.loc[[1, 2, 4, 5], "Name"] = "Prospect"
+        bat.loc[[1, 2, 4, 5], "MlbamId"] = -1
+        state = AuctionState(bat, pit, ROSTER, SALARY, export)
+
+        with pytest.raises(ValueError, match="more than one player"):
+            state.sign("Prospect", "T2", 5)
+        with pytest.raises(KeyError):
+            state.sign(-1, "T2", 5)
+
+
+class TestAuctionServer:
+    @pytest.fixture
+    def url(self, frames):
+        server = create_auction_server(AuctionState(frames[0], frames[1], ROSTER, SALARY, frames[2]), port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}"
+        server.shutdown()
+        server.server_close()
+
+    @staticmethod
+    def _request(url, data=None):
+        body = json.dumps(data).encode() if data is not None else None
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, data=body, method="POST" if body else "GET")) as r:
+                return r.status, json.loads(r.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_sign_updates_state(self, url):
+        status, before = self._request(f"{url}/state")
+        assert status == 200
+
+        status, records = self._request(f"{url}/sign", {"player": "100", "team": "T2", "salary": 20})
+        assert status == 200
+        assert {r["Name"] for r in records} == {"Pitcher A"}
+
+        _, after = self._request(f"{url}/state")
+        assert after["available_budget"] == before["available_budget"] - 19
+        assert after["signings"] == 1
+
+    def test_players(self, url):
+        status, players = self._request(f"{url}/players?source=zips&limit=1")
+        assert status == 200
+        assert [p["Name"] for p in players] == ["Pitcher A"]
+
+    def test_players_default_source(self, url):
+        status, players = self._request(f"{url}/players?limit=1")
+        assert status == 200
+        assert [p["ProjectionSource"] for p in players] == ["steamer"]
+
+    def test_errors(self, url):
+        assert self._request(f"{url}/nowhere")[0] == 404
+        assert self._request(f"{url}/player?id=Nobody")[0] == 404
+        assert self._request(f"{url}/sign", {"player": "1", "team": "T2", "salary": 5})[0] == 400
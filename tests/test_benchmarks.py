@@ -0,0 +1,37 @@
+import pytest
+
+from benchmarks.pipeline import LEAGUES_DIR, benchmark_case, load_leagues
+from benchmarks.synthetic import generate_league_export, generate_player_id_map, generate_projections
+from fantasybaseball.fangraphs import _projection_schema
+from fantasybaseball.model import StatCategory
+
+
+class TestSyntheticProjections:
+    @pytest.mark.parametrize("stat_category", list(StatCategory))
+    def test_matches_decoder_schema(self, stat_category):
+        projections = generate_projections(stat_category, 60, sources=3)
+
+        schema = dict(_projection_schema(stat_category).values())
+        assert projections["ProjectionSource"].nunique() == 3
+        for column in projections.columns.drop("ProjectionSource"):
+            assert str(projections[column].dtype) == schema[column], column
+
+    def test_league_export_players_are_in_player_id_map(self):
+        bat = generate_projections(StatCategory.BATTING, 60, sources=2)
+        pit = generate_projections(StatCategory.PITCHING, 60, sources=2)
+
+        export = generate_league_export(bat, pit)
+        player_id_map = generate_player_id_map(bat, pit)
+
+        assert export["ID"].isin(player_id_map["FANTRAXID"]).all()
+
+
+class TestBenchmarkCase:
+    def test_runs_stages_the_league_supports(self, tmp_path):
+        standard, thedoo = load_leagues([LEAGUES_DIR / "standard.yaml", LEAGUES_DIR / "thedoo.yaml"])
+
+        standard_stages = [r.stage for r in benchmark_case(standard, 200, 2, tmp_path, memory=False)]
+        thedoo_stages = [r.stage for r in benchmark_case(thedoo, 200, 2, tmp_path, memory=False)]
+
+        assert standard_stages == ["augment_projections", "merge_with_league_export", "calculate_points"]
+        assert thedoo_stages[-1] == "calculate_auction_values"
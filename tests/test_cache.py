@@ -0,0 +1,117 @@
+import json
+import os
+
+import pytest
+
+from fantasybaseball.cache import CacheMissError, ResponseCache
+from fantasybaseball.fangraphs import REQUEST_TIMEOUT, get_projections
+from fantasybaseball.model import ProjectionSource, ProjectionSourceName, StatCategory
+
+PAYLOAD = [{"PlayerName": "Mike Trout", "minpos": "OF", "playerids": "10155", "xMLBAMID": 545361, "HR": 35.0}]
+
+
+class FakeResponse:
+    def __init__(self, body=b"", status_code=200, headers=None):
+        self.content = body
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = list()
+        self.timeouts = list()
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append(headers or {})
+        self.timeouts.append(timeout)
+        return self.responses.pop(0)
+
+
+class TestResponseCache:
+    def test_put_and_get_roundtrip(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        key = cache.key("bat", "steamer", False, "2025-03-01")
+        cache.put(key, b"[]", etag='"abc"')
+
+        entry = cache.get(key)
+        assert entry.body == b"[]"
+        assert entry.etag == '"abc"'
+        assert entry.validators() == {"If-None-Match": '"abc"'}
+
+    def test_latest_returns_most_recent_earlier_day(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        cache.put(cache.key("bat", "steamer", False, "2025-03-01"), b"[1]")
+        cache.put(cache.key("bat", "steamer", False, "2025-03-02"), b"[2]")
+        cache.put(cache.key("bat", "steamer", False, "2025-03-05"), b"[5]")
+
+        entry = cache.latest(cache.key("bat", "steamer", False, "2025-03-04"))
+        assert entry.body == b"[2]"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=10**9)
+        old_key = cache.key("bat", "steamer", False, "2025-03-01")
+        new_key = cache.key("bat", "steamer", False, "2025-03-02")
+        cache.put(old_key, b"x" * 1000)
+        cache.put(new_key, b"y" * 1000)
+        body_path = cache._paths(old_key)[0]
+        os.utime(body_path, (0, 0))
+
+        cache.max_bytes = 1500
+        cache.evict()
+
+        assert cache.get(old_key) is None
+        assert cache.get(new_key) is not None
+
+
+class TestGetProjectionsWithCache:
+    @pytest.fixture
+    def source(self):
+        return ProjectionSource(ProjectionSourceName.STEAMER)
+
+    def test_fresh_entry_skips_network(self, tmp_path, source):
+        cache = ResponseCache(tmp_path)
+        session = FakeSession([FakeResponse(json.dumps(PAYLOAD).encode())])
+
+        first = get_projections(StatCategory.BATTING, source, session=session, cache=cache)
+        second = get_projections(StatCategory.BATTING, source, session=session, cache=cache)
+
+        assert len(session.requests) == 1
+        assert session.timeouts == [REQUEST_TIMEOUT]
+        assert first.equals(second)
+        assert second["MlbamId"].tolist() == [545361]
+
+    def test_stale_entry_revalidated_with_304(self, tmp_path, source):
+        cache = ResponseCache(tmp_path, ttl=0)
+        session = FakeSession(
+            [
+                FakeResponse(json.dumps(PAYLOAD).encode(), headers={"ETag": '"v1"'}),
+                FakeResponse(status_code=304),
+            ]
+        )
+
+        get_projections(StatCategory.BATTING, source, session=session, cache=cache)
+        projections = get_projections(StatCategory.BATTING, source, session=session, cache=cache)
+
+        assert session.requests[1] == {"If-None-Match": '"v1"'}
+        assert projections["Name"].tolist() == ["Mike Trout"]
+
+    def test_offline_serves_only_from_cache(self, tmp_path, source):
+        cache = ResponseCache(tmp_path)
+        cache.put(cache.key("bat", "steamer", False, "2000-01-01"), json.dumps(PAYLOAD).encode())
+        session = FakeSession([])
+
+        projections = get_projections(StatCategory.BATTING, source, session=session, cache=cache, offline=True)
+
+        assert session.requests == []
+        assert projections["Name"].tolist() == ["Mike Trout"]
+
+    def test_offline_miss_raises(self, tmp_path, source):
+        cache = ResponseCache(tmp_path)
+        with pytest.raises(CacheMissError):
+            get_projections(StatCategory.PITCHING, source, cache=cache, offline=True)
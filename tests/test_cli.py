@@ -0,0 +1,231 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+import requests
+
+from fantasybaseball import cli
+from fantasybaseball.history import RAW, HistoryStore
+from fantasybaseball.model import ProjectionSource, ProjectionSourceName, StatCategory
+
+
+def _fake_projections(stat_category, projection_source):
+    return pd.DataFrame(
+        {
+            "ProjectionSource": [projection_source.value],
+            "StatCategory": [stat_category.value],
+        }
+    )
+
+
+class TestRunProjectionRequests:
+    @pytest.fixture
+    def projection_requests(self):
+        return cli.create_projection_requests(
+            [StatCategory.BATTING, StatCategory.PITCHING],
+            [ProjectionSource(ProjectionSourceName.STEAMER), ProjectionSource(ProjectionSourceName.ZIPS)],
+        )
+
+    def test_results_in_request_order(self, monkeypatch, projection_requests):
+        """Frames are concatenated in request order even when requests finish out of order."""
+
+        def get_projections(stat_category, projection_source, session=None, **kwargs):
+            # Make earlier requests finish last
+            if projection_source == "steamer":
+                time.sleep(0.05)
+            return _fake_projections(stat_category, projection_source)
+
+        monkeypatch.setattr(cli, "get_projections", get_projections)
+        bat, pit = cli.run_projection_requests(projection_requests, max_workers=4)
+
+        assert bat["ProjectionSource"].tolist() == ["steamer", "zips"]
+        assert pit["ProjectionSource"].tolist() == ["steamer", "zips"]
+        assert (bat["StatCategory"] == "bat").all()
+        assert (pit["StatCategory"] == "pit").all()
+
+    def test_shares_one_session(self, monkeypatch, projection_requests):
+        sessions = set()
+
+        def get_projections(stat_category, projection_source, session=None, **kwargs):
+            sessions.add(id(session))
+            return _fake_projections(stat_category, projection_source)
+
+        monkeypatch.setattr(cli, "get_projections", get_projections)
+        cli.run_projection_requests(projection_requests, max_workers=4)
+
+        assert len(sessions) == 1
+
+    def test_retries_are_per_request(self, monkeypatch, projection_requests):
+        """Each request gets its own retry budget instead of sharing one counter."""
+        failures = dict()
+        lock = threading.Lock()
+
+        def get_projections(stat_category, projection_source, session=None, **kwargs):
+            key = (stat_category, projection_source.value)
+            with lock:
+                failures[key] = failures.get(key, 0) + 1
+                attempt = failures[key]
+            if attempt <= 2:
+                raise requests.exceptions.ConnectionError()
+            return _fake_projections(stat_category, projection_source)
+
+        monkeypatch.setattr(cli, "get_projections", get_projections)
+        monkeypatch.setattr(cli.time, "sleep", lambda _: None)
+        bat, pit = cli.run_projection_requests(projection_requests, retries=2, max_workers=4)
+
+        assert len(bat) == 2
+        assert len(pit) == 2
+        assert all(count == 3 for count in failures.values())
+
+    def test_raises_after_retries_exhausted(self, monkeypatch, projection_requests):
+        def get_projections(stat_category, projection_source, session=None, **kwargs):
+            raise requests.exceptions.ConnectionError()
+
+        monkeypatch.setattr(cli, "get_projections", get_projections)
+        monkeypatch.setattr(cli.time, "sleep", lambda _: None)
+        with pytest.raises(requests.exceptions.ConnectionError):
+            cli.run_projection_requests(projection_requests, retries=1, max_workers=2)
+
+    @pytest.mark.parametrize("status_code, calls", [(503, 2), (404, 1)])
+    def test_only_server_errors_retried(self, monkeypatch, projection_requests, status_code, calls):
+        attempts = list()
+
+        def get_projections(stat_category, projection_source, session=None, **kwargs):
+            attempts.append(projection_source)
+            response = requests.Response()
+            response.status_code = status_code
+            raise requests.exceptions.HTTPError(response=response)
+
+        monkeypatch.setattr(cli, "get_projections", get_projections)
+        monkeypatch.setattr(cli.time, "sleep", lambda _: None)
+        with pytest.raises(requests.exceptions.HTTPError):
+            cli.run_projection_requests(projection_requests[:1], retries=1, max_workers=1)
+
+        assert len(attempts) == calls
+
+    def test_empty_responses_skipped(self, monkeypatch, projection_requests):
+        def get_projections(stat_category, projection_source, session=None, **kwargs):
+            if projection_source == "zips":
+                return pd.DataFrame()
+            return _fake_projections(stat_category, projection_source)
+
+        monkeypatch.setattr(cli, "get_projections", get_projections)
+        bat, pit = cli.run_projection_requests(projection_requests, max_workers=4)
+
+        assert bat["ProjectionSource"].tolist() == ["steamer"]
+        assert pit["ProjectionSource"].tolist() == ["steamer"]
+
+
+class TestGetArgs:
+    def test_multiple_leagues(self, monkeypatch):
+        monkeypatch.setattr(cli, "load_config_defaults", lambda: {})
+        monkeypatch.setattr("sys.argv", ["fbb", "-l", "a.yaml", "b.yaml", "-e", "a.csv", "b.csv"])
+        args = cli.get_args()
+        assert args.league_file == ["a.yaml", "b.yaml"]
+        assert args.league_export == ["a.csv", "b.csv"]
+
+    def test_league_file_from_config(self, monkeypatch):
+        monkeypatch.setattr(cli, "load_config_defaults", lambda: {"league_file": "a.yaml"})
+        monkeypatch.setattr("sys.argv", ["fbb"])
+        assert cli.get_args().league_file == ["a.yaml"]
+
+    def test_unpaired_exports_rejected(self, monkeypatch):
+        monkeypatch.setattr(cli, "load_config_defaults", lambda: {})
+        monkeypatch.setattr("sys.argv", ["fbb", "-l", "a.yaml", "b.yaml", "-e", "a.csv"])
+        with pytest.raises(SystemExit):
+            cli.get_args()
+
+    def test_export_without_league_file(self, monkeypatch):
+        monkeypatch.setattr(cli, "load_config_defaults", lambda: {})
+        monkeypatch.setattr("sys.argv", ["fbb", "-e", "export.csv"])
+        args = cli.get_args()
+        assert args.league_file == [None]
+        assert args.league_export == ["export.csv"]
+
+    def test_league_dir(self, monkeypatch, tmp_path):
+        for name in ["a.yaml", "a.csv", "b.yaml"]:
+            (tmp_path / name).touch()
+        monkeypatch.setattr(cli, "load_config_defaults", lambda: {})
+        monkeypatch.setattr("sys.argv", ["fbb", "-l", "c.yaml", "--league-dir", str(tmp_path)])
+        args = cli.get_args()
+        assert args.league_file == ["c.yaml", tmp_path / "a.yaml", tmp_path / "b.yaml"]
+        assert args.league_export == [None, tmp_path / "a.csv", None]
+
+    def test_empty_league_dir_rejected(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(cli, "load_config_defaults", lambda: {})
+        monkeypatch.setattr("sys.argv", ["fbb", "--league-dir", str(tmp_path)])
+        with pytest.raises(SystemExit):
+            cli.get_args()
+
+    def test_simulate_needs_proportional_replacement(self, monkeypatch):
+        monkeypatch.setattr(cli, "load_config_defaults", lambda: {})
+        monkeypatch.setattr("sys.argv", ["fbb", "--simulate", "100", "--replacement-mode", "assignment"])
+        with pytest.raises(SystemExit):
+            cli.get_args()
+
+    def test_serve_default_port(self, monkeypatch):
+        monkeypatch.setattr(cli, "load_config_defaults", lambda: {})
+        monkeypatch.setattr("sys.argv", ["fbb", "-l", "leagues/thedoo.yaml", "--serve"])
+        assert cli.get_args().serve == cli.DEFAULT_PORT
+
+    @pytest.mark.parametrize("argv", [["-e", "export.csv"], ["-l", "leagues/standard.yaml"]])
+    def test_serve_needs_roster_and_salary(self, monkeypatch, argv):
+        monkeypatch.setattr(cli, "load_config_defaults", lambda: {})
+        monkeypatch.setattr("sys.argv", ["fbb", *argv, "--serve"])
+        with pytest.raises(SystemExit):
+            cli.get_args()
+
+    def test_serve_needs_one_league(self, monkeypatch):
+        monkeypatch.setattr(cli, "load_config_defaults", lambda: {})
+        monkeypatch.setattr("sys.argv", ["fbb", "--serve", "9000"])
+        with pytest.raises(SystemExit):
+            cli.get_args()
+
+
+class TestLoadLeagues:
+    def test_no_leagues(self):
+        assert cli.load_leagues([], []) == [(None, None)]
+
+    def test_leagues_without_exports(self):
+        leagues = cli.load_leagues(["leagues/thedoo.yaml", "leagues/beastmode.yaml"], [])
+        assert [league.name for league, _ in leagues] == ["thedoo", "beastmode"]
+        assert all(export is None for _, export in leagues)
+
+    def test_leagues_with_some_exports(self, tmp_path):
+        export = tmp_path / "thedoo.csv"
+        pd.DataFrame({"ID": ["*a*"]}).to_csv(export, index=False)
+        leagues = cli.load_leagues(["leagues/thedoo.yaml", "leagues/beastmode.yaml"], [export, None])
+        assert leagues[0][1]["ID"].tolist() == ["*a*"]
+        assert leagues[1][1] is None
+
+    def test_export_without_league(self, tmp_path):
+        export = tmp_path / "export.csv"
+        pd.DataFrame({"ID": ["*a*"]}).to_csv(export, index=False)
+        leagues = cli.load_leagues([None], [export])
+        assert leagues[0][0] is None
+        assert leagues[0][1]["ID"].tolist() == ["*a*"]
+
+
+class TestAppendHistory:
+    def test_raw_and_league_datasets(self, tmp_path):
+        projections = pd.DataFrame({"ProjectionSource": ["steamer"], "MlbamId": [1], "Name": ["a"], "Points": [1.0]})
+        leagues = cli.load_leagues(["leagues/thedoo.yaml"], [])
+
+        cli.append_history(tmp_path, projections, projections, leagues, [(projections, projections)])
+
+        store = HistoryStore(tmp_path)
+        assert [p.stat_category for p in store.partitions(RAW)] == ["bat", "pit"]
+        assert store.player_history(1, "thedoo")["Points"].tolist() == [1.0, 1.0]
+
+    def test_unnamed_leagues_use_export_stems(self, tmp_path):
+        projections = pd.DataFrame({"ProjectionSource": ["steamer"], "MlbamId": [1], "Name": ["a"], "Points": [1.0]})
+        leagues, augmented = [(None, None), (None, None)], [(projections, projections)] * 2
+
+        cli.append_history(tmp_path, projections, projections, leagues, augmented, league_exports=["a.csv", "b.csv"])
+
+        store = HistoryStore(tmp_path)
+        assert [p.stat_category for p in store.partitions("a")] == ["bat", "pit"]
+        assert [p.stat_category for p in store.partitions("b")] == ["bat", "pit"]
+        with pytest.raises(ValueError, match="augmented"):
+            cli.append_history(tmp_path, projections, projections, leagues, augmented)
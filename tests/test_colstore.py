@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from fantasybaseball.colstore import read_columns, read_frame, read_metadata, write_frame
+
+
+class TestColumnStore:
+    def test_roundtrip_preserves_values_and_dtypes(self, tmp_path):
+        frame = pd.DataFrame(
+            {
+                "Name": ["Mike Trout", np.nan, "Shohei Ohtani"],
+                "MlbamId": pd.array([545361, None, 660271], dtype="Int64"),
+                "HR": [35.0, np.nan, 44.0],
+                "G": np.array([140, 20, 150], dtype="int16"),
+                "Team": pd.Categorical(["LAA", "LAA", "LAD"]),
+            }
+        )
+        write_frame(frame, tmp_path / "frame", metadata={"version": 1})
+        result = read_frame(tmp_path / "frame")
+
+        pd.testing.assert_frame_equal(result, frame)
+        assert read_metadata(tmp_path / "frame") == {"version": 1}
+        assert read_columns(tmp_path / "frame") == ["Name", "MlbamId", "HR", "G", "Team"]
+
+    def test_categories_keep_their_order(self, tmp_path):
+        frame = pd.DataFrame({"Status": pd.Categorical(["Team B", "FA", None], categories=["FA", "Team A", "Team B"])})
+        write_frame(frame, tmp_path / "frame")
+
+        pd.testing.assert_frame_equal(read_frame(tmp_path / "frame"), frame)
+
+    def test_numeric_columns_are_memory_mapped(self, tmp_path):
+        frame = pd.DataFrame({"HR": [1.0, 2.0, 3.0]})
+        write_frame(frame, tmp_path / "frame")
+        result = read_frame(tmp_path / "frame")
+
+        base = result["HR"].values
+        while base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        assert isinstance(base, np.memmap)
+
+    def test_reads_subset_of_columns(self, tmp_path):
+        frame = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        write_frame(frame, tmp_path / "frame")
+
+        assert list(read_frame(tmp_path / "frame", columns=["b"]).columns) == ["b"]
+
+    def test_reads_subset_of_rows(self, tmp_path):
+        frame = pd.DataFrame(
+            {"a": [1, 2, 3], "b": ["x", "y", "z"], "c": pd.array([1, None, 3], dtype="Int64")}
+        )
+        write_frame(frame, tmp_path / "frame")
+
+        pd.testing.assert_frame_equal(read_frame(tmp_path / "frame", rows=[2, 1]), frame.iloc[[2, 1]])
+        pd.testing.assert_frame_equal(read_frame(tmp_path / "frame", rows=slice(1, 3)), frame.iloc[1:3])
+
+    def test_overwrites_existing(self, tmp_path):
+        write_frame(pd.DataFrame({"a": [1]}), tmp_path / "frame")
+        write_frame(pd.DataFrame({"a": [2, 3]}), tmp_path / "frame")
+
+        assert read_frame(tmp_path / "frame")["a"].tolist() == [2, 3]
@@ -142,3 +142,10 @@ class TestLoadLeagueConfig:
         }
         config = load_league_config(yaml)
         assert config.salary.minors_pct == 0.0
+
+    def test_missing_roster_not_contained(self):
+        yaml = {"scoring": {"bat": {"HR": 4}, "pit": {"SO": 1}}}
+        config = load_league_config(yaml)
+        assert "roster" not in config
+        assert config.get("roster") is None
+        assert config.roster
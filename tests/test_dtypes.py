@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+from fantasybaseball.dtypes import as_strings, compact_projections, concat_projections, fill_missing, map_strings
+
+
+def _frame(source, names):
+    return pd.DataFrame(
+        {
+            "ProjectionSource": source,
+            "Name": names,
+            "MlbamId": pd.array(range(len(names)), dtype="Int64"),
+            "HR": np.arange(len(names), dtype="float64") + 0.5,
+        }
+    )
+
+
+class TestCompactProjections:
+    def test_dtypes(self):
+        compact = compact_projections(_frame("steamer", ["A", "B"]))
+        assert isinstance(compact["ProjectionSource"].dtype, pd.CategoricalDtype)
+        assert isinstance(compact["Name"].dtype, pd.CategoricalDtype)
+        assert compact["MlbamId"].dtype == "Int32"
+        assert compact["HR"].dtype == np.float32
+
+    def test_input_unchanged(self):
+        frame = _frame("steamer", ["A", "B"])
+        compact_projections(frame)
+        assert frame["Name"].dtype == object
+
+
+class TestConcatProjections:
+    def test_unions_categories(self):
+        frames = [compact_projections(_frame("steamer", ["B", "A"])), compact_projections(_frame("zipsdc", ["C"]))]
+        combined = concat_projections(frames)
+        assert isinstance(combined["Name"].dtype, pd.CategoricalDtype)
+        assert list(combined["Name"].cat.categories) == ["A", "B", "C"]
+        assert list(combined["Name"]) == ["B", "A", "C"]
+
+    def test_mixed_with_plain_strings(self):
+        combined = concat_projections([compact_projections(_frame("steamer", ["A"])), _frame("mean", ["A"])])
+        assert isinstance(combined["ProjectionSource"].dtype, pd.CategoricalDtype)
+        assert list(combined["ProjectionSource"]) == ["steamer", "mean"]
+
+    def test_plain_frames(self):
+        combined = concat_projections([_frame("steamer", ["A"]), _frame("zipsdc", ["B"])])
+        assert combined["Name"].dtype == object
+        assert list(combined.index) == [0, 1]
+
+
+class TestStringHelpers:
+    def test_fill_missing_adds_category(self):
+        series = pd.Series(["1B", None], dtype="category")
+        assert list(fill_missing(series, "--")) == ["1B", "--"]
+
+    def test_map_strings_merges_categories(self):
+        series = pd.Series(["SP/1B", "1B", None, "OF"], dtype="category")
+        mapped = map_strings(series, lambda p: p.replace("SP/", ""))
+        assert isinstance(mapped.dtype, pd.CategoricalDtype)
+        assert list(mapped.cat.categories) == ["1B", "OF"]
+        assert mapped.tolist()[:2] == ["1B", "1B"]
+        assert pd.isna(mapped[2])
+
+    def test_map_strings_plain(self):
+        mapped = map_strings(pd.Series(["SP/1B", None]), lambda p: p.replace("SP/", ""))
+        assert mapped[0] == "1B"
+        assert pd.isna(mapped[1])
+
+    def test_as_strings_matches_astype_str(self):
+        series = pd.Series(["A", np.nan, "B"])
+        assert list(as_strings(series.astype("category"))) == list(series.astype(str))
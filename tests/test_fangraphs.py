@@ -0,0 +1,73 @@
+import json
+
+import pandas as pd
+
+from fantasybaseball.fangraphs import decode_projections
+from fantasybaseball.model import ProjectionSource, ProjectionSourceName, StatCategory
+
+BAT_PAYLOAD = [
+    {
+        "PlayerName": "Mike Trout",
+        "minpos": "OF",
+        "playerids": "10155",
+        "xMLBAMID": 545361,
+        "teamid": 1,
+        "Team": "LAA",
+        "HR": 35.0,
+        "H": 130,
+        ".": "",
+        "UnusedField": 12.5,
+    },
+    {
+        "PlayerName": "Some Prospect",
+        "minpos": "SS",
+        "playerids": "sa3014567",
+        "xMLBAMID": None,
+        "teamid": 2,
+        "Team": None,
+        "HR": 4.0,
+        "H": None,
+        ".": "",
+        "UnusedField": 1.0,
+    },
+]
+
+
+class TestDecodeProjections:
+    def _decode(self, payload=BAT_PAYLOAD):
+        source = ProjectionSource(ProjectionSourceName.STEAMER)
+        return decode_projections(json.dumps(payload).encode(), StatCategory.BATTING, source)
+
+    def test_renames_and_drops_unused_fields(self):
+        projections = self._decode()
+
+        assert projections["Name"].tolist() == ["Mike Trout", "Some Prospect"]
+        assert projections["Position"].tolist() == ["OF", "SS"]
+        for column in ["PlayerName", "minpos", "teamid", ".", "UnusedField"]:
+            assert column not in projections
+
+    def test_id_columns_are_nullable_integers(self):
+        projections = self._decode()
+
+        assert projections["MlbamId"].dtype == "Int64"
+        assert projections["FangraphsId"].dtype == "Int64"
+        assert projections["MlbamId"].iloc[0] == 545361
+        assert projections["FangraphsId"].iloc[0] == 10155
+        # Prospect IDs that aren't numeric become nulls
+        assert pd.isna(projections["FangraphsId"].iloc[1])
+        assert pd.isna(projections["MlbamId"].iloc[1])
+
+    def test_stats_are_float64(self):
+        projections = self._decode()
+
+        assert projections["HR"].dtype == "float64"
+        assert projections["H"].dtype == "float64"
+        assert pd.isna(projections["H"].iloc[1])
+
+    def test_projection_source_added(self):
+        projections = self._decode()
+
+        assert (projections["ProjectionSource"] == "steamer").all()
+
+    def test_empty_payload(self):
+        assert self._decode([]).empty
@@ -0,0 +1,163 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fantasybaseball.colstore import read_frame
+from fantasybaseball.history import MISSING_KEY, HistoryStore, history_keys
+
+
+def _snapshot(points, sources=("steamer", "zips")):
+    """Three batters per source; ``points`` is a list of each player's points."""
+    frames = list()
+    for source in sources:
+        frames.append(
+            pd.DataFrame(
+                {
+                    "ProjectionSource": source,
+                    "Name": ["Mike Trout", "Shohei Ohtani", "Prospect"],
+                    "MlbamId": pd.array([545361, 660271, None], dtype="Int64"),
+                    "FangraphsId": pd.array([10155, 19755, 31000], dtype="Int64"),
+                    "Team": ["LAA", "LAD", "LAD"],
+                    "Position": ["OF", "UTIL", "SS"],
+                    "HR": [35.0, 44.0, 5.0],
+                    "Points": points,
+                    "PAR": np.asarray(points) - 100.0,
+                    "AuctionValue": np.asarray(points) / 10.0,
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+class TestHistoryKeys:
+    def test_mlbam_then_fangraphs(self):
+        projections = pd.DataFrame(
+            {"MlbamId": pd.array([1, None, None], dtype="Int64"), "FangraphsId": ["7", "8", "sa9"]}
+        )
+
+        assert history_keys(projections).tolist() == [1, -8, MISSING_KEY]
+
+    def test_filled_ids_are_missing(self):
+        # Two prospects without IDs, as filled in by augmentation
+        projections = pd.DataFrame({"MlbamId": [-1, -1, 3, -1], "FangraphsId": [-1, -1, -1, 9]})
+
+        assert history_keys(projections).tolist() == [MISSING_KEY, MISSING_KEY, 3, -9]
+
+
+class TestHistoryStore:
+    def test_partitions_sorted_by_player_id(self, tmp_path):
+        store = HistoryStore(tmp_path)
+
+        partitions = store.append(_snapshot([300.0, 400.0, 50.0]), "bat", "thedoo", "2026-03-01")
+
+        assert [p.source for p in partitions] == ["steamer", "zips"]
+        assert partitions[0].path == tmp_path / "snapshots" / "2026" / "2026-03-01" / "steamer" / "thedoo_bat"
+        frame = read_frame(partitions[0].path)
+        assert frame["PlayerId"].tolist() == [-31000, 545361, 660271]
+        assert "ProjectionSource" not in frame
+        assert store.dates("thedoo") == ["2026-03-01"]
+        assert store.dates("raw") == []
+
+    def test_player_history_across_snapshots(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        for day, points in [("2026-03-01", 300.0), ("2026-03-02", 310.0), ("2026-03-03", 320.0)]:
+            store.append(_snapshot([points, 400.0, 50.0]), "bat", "thedoo", day)
+
+        history = store.player_history(545361, "thedoo")
+
+        assert len(history) == 6
+        assert history["Date"].tolist() == ["2026-03-01"] * 2 + ["2026-03-02"] * 2 + ["2026-03-03"] * 2
+        assert history["Points"].tolist() == [300.0, 300.0, 310.0, 310.0, 320.0, 320.0]
+        assert history["AuctionValue"].tolist() == pytest.approx([30.0, 30.0, 31.0, 31.0, 32.0, 32.0])
+        by_name = store.player_history("Mike Trout", "thedoo", sources=["zips"], start="2026-03-02")
+        assert by_name["Points"].tolist() == [310.0, 320.0]
+        assert set(by_name["ProjectionSource"]) == {"zips"}
+
+    def test_other_columns_read_from_partitions(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        store.append(_snapshot([300.0, 400.0, 50.0]), "bat", "thedoo", "2026-03-01")
+
+        history = store.player_history(-31000, "thedoo", columns=["HR", "Points"])
+
+        assert history["HR"].tolist() == [5.0, 5.0]
+        assert history["Points"].tolist() == [50.0, 50.0]
+
+    def test_reappending_a_date_replaces_it(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        store.append(_snapshot([300.0, 400.0, 50.0]), "bat", "thedoo", "2026-03-01")
+        store.append(_snapshot([350.0, 400.0, 50.0], sources=["zips"]), "bat", "thedoo", "2026-03-01")
+
+        history = store.player_history(545361, "thedoo")
+
+        assert history[["ProjectionSource", "Points"]].values.tolist() == [["steamer", 300.0], ["zips", 350.0]]
+
+    def test_segments_are_merged(self, tmp_path):
+        store = HistoryStore(tmp_path, max_segments=2)
+        for day in range(1, 6):
+            store.append(_snapshot([300.0 + day, 400.0, 50.0]), "bat", "thedoo", f"2026-03-0{day}")
+        store.append(_snapshot([999.0, 400.0, 50.0], sources=["steamer"]), "bat", "thedoo", "2026-03-02")
+
+        series_dir = tmp_path / "series" / "2026" / "thedoo_bat"
+        assert len(list(series_dir.iterdir())) <= 2
+        history = HistoryStore(tmp_path).player_history(545361, "thedoo", sources=["steamer"])
+        assert history["Points"].tolist() == [301.0, 999.0, 303.0, 304.0, 305.0]
+
+    def test_unknown_player(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        store.append(_snapshot([300.0, 400.0, 50.0]), "bat", "thedoo", "2026-03-01")
+
+        with pytest.raises(KeyError):
+            store.player_history("Nobody", "thedoo")
+        assert store.player_history(1, "thedoo").empty
+
+    def test_players_without_ids(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        snapshot = _snapshot([300.0, 400.0, 50.0], sources=["steamer"])
+        snapshot = pd.concat([snapshot, snapshot.iloc[[2]].assign(Name="Other Prospect", PAR=-40.0)])
+        snapshot[["MlbamId", "FangraphsId"]] = snapshot[["MlbamId", "FangraphsId"]].fillna(-1)
+        snapshot.loc[snapshot["Name"].str.contains("Prospect"), ["MlbamId", "FangraphsId"]] = -1
+        store.append(snapshot, "bat", "thedoo", "2026-03-01")
+        store.append(snapshot.assign(Points=snapshot["Points"] + 5.0), "bat", "thedoo", "2026-03-02")
+
+        assert store.player_history(-1, "thedoo").empty
+        with pytest.raises(ValueError, match="no MLBAM or Fangraphs ID"):
+            store.player_history("Prospect", "thedoo")
+        assert set(store.movers("thedoo", start="2026-03-01")["Name"]) == {"Mike Trout", "Shohei Ohtani"}
+
+    def test_movers(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        store.append(_snapshot([300.0, 400.0, 50.0]), "bat", "thedoo", "2026-03-01")
+        store.append(_snapshot([300.0, 410.0, 50.0]), "bat", "thedoo", "2026-03-05")
+        store.append(_snapshot([250.0, 420.0, 50.0]), "bat", "thedoo", "2026-03-08")
+
+        movers = store.movers("thedoo", sources=["steamer"], limit=2)
+
+        assert movers["Name"].tolist() == ["Mike Trout", "Shohei Ohtani"]
+        assert movers["Before"].tolist() == [300.0, 400.0]
+        assert movers["After"].tolist() == [250.0, 420.0]
+        assert movers["Change"].tolist() == [-50.0, 20.0]
+        recent = store.movers("thedoo", start="2026-03-05", sources=["steamer"], limit=1)
+        assert recent["Change"].tolist() == [-50.0]
+        with pytest.raises(ValueError):
+            store.movers("raw")
+
+    def test_raw_defaults_to_playing_time(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        for day, pa in [("2026-03-01", 600.0), ("2026-03-08", 550.0)]:
+            snapshot = _snapshot([300.0, 400.0, 50.0]).drop(columns=["Points", "PAR", "AuctionValue"])
+            store.append(snapshot.assign(PA=[pa, 650.0, 100.0] * 2), "bat", date=day)
+
+        history = store.player_history("Mike Trout")
+        movers = store.movers(sources=["steamer"], limit=1)
+
+        assert history["PA"].tolist() == [600.0, 600.0, 550.0, 550.0]
+        assert movers[["Name", "Change"]].values.tolist() == [["Mike Trout", -50.0]]
+
+    def test_columns_missing_from_dataset(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        store.append(_snapshot([300.0, 400.0, 50.0]).drop(columns=["Points", "PAR", "AuctionValue"]), "bat")
+
+        with pytest.raises(ValueError, match="Points"):
+            store.player_history(545361, columns=["Points"])
+        with pytest.raises(ValueError, match="Points"):
+            store.movers(column="Points")
@@ -0,0 +1,84 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from fantasybaseball.lineup import ANY_POSITION, SlotAssignment, assign_slots, slot_types
+from fantasybaseball.model import Position
+from fantasybaseball.positions import position_mask
+
+
+def _best_feasible_total(values, masks, accepts, capacities):
+    """Brute force: the highest total value of any set of players that can fill distinct slots."""
+    slots = [t for t, capacity in enumerate(capacities) for _ in range(capacity)]
+    best = 0.0
+    for size in range(1, min(len(values), len(slots)) + 1):
+        for players in itertools.combinations(range(len(values)), size):
+            for chosen in itertools.permutations(slots, size):
+                if all(masks[p] & accepts[t] for p, t in zip(players, chosen)):
+                    best = max(best, sum(values[p] for p in players))
+                    break
+    return best
+
+
+class TestSlotTypes:
+    def test_bench_accepts_anyone(self):
+        names, accepts, capacities = slot_types({"C": 1, "UTIL": 1, "bench": 3}, teams=2)
+
+        assert names == ["C", "UTIL", "bench"]
+        assert accepts == [Position.C.bit, Position.UTIL.bit, ANY_POSITION]
+        assert capacities == [2, 2, 6]
+
+    def test_exclude_bench(self):
+        names, _, _ = slot_types({"C": 1, "bench": 3}, include_bench=False)
+
+        assert names == ["C"]
+
+
+class TestSlotAssignment:
+    def test_shifts_multi_position_player_to_make_room(self):
+        _, accepts, capacities = slot_types({"C": 1, "1B": 1})
+        assignment = SlotAssignment(accepts, capacities)
+
+        assert assignment.offer("catcher-first", position_mask("C/1B"))
+        assert assignment.offer("catcher", position_mask("C"))
+        assert not assignment.offer("first", position_mask("1B"))
+        assert assignment.full
+        assert assignment.assignments() == {"catcher": 0, "catcher-first": 1}
+
+    def test_flex_slot(self):
+        _, accepts, capacities = slot_types({"SS": 1, "MI": 1})
+        assignment = SlotAssignment(accepts, capacities)
+
+        assert assignment.offer("ss1", position_mask("SS"))
+        assert assignment.offer("ss2", position_mask("SS"))
+        assert not assignment.offer("2b", position_mask("2B"))
+
+    def test_rejects_players_without_eligibility(self):
+        _, accepts, capacities = slot_types({"C": 1})
+
+        assert not SlotAssignment(accepts, capacities).offer("pitcher", position_mask("P"))
+
+
+class TestAssignSlots:
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        _, accepts, capacities = slot_types({"C": 1, "1B": 1, "SS": 1, "CI": 1, "UTIL": 1})
+        positions = ["C", "1B", "3B", "SS", "C/1B", "1B/3B", "SS/3B", "OF", "P"]
+        for _ in range(20):
+            values = rng.uniform(0, 100, 8)
+            masks = [position_mask(p) for p in rng.choice(positions, 8)]
+
+            slots = assign_slots(values, masks, accepts, capacities)
+
+            kept = np.flatnonzero(slots >= 0)
+            assert all(masks[p] & accepts[slots[p]] for p in kept)
+            assert (np.bincount(slots[kept], minlength=len(capacities)) <= capacities).all()
+            assert values[kept].sum() == pytest.approx(_best_feasible_total(values, masks, accepts, capacities))
+
+    def test_skips_missing_values(self):
+        _, accepts, capacities = slot_types({"OF": 2})
+
+        slots = assign_slots([np.nan, 10.0, 5.0], [position_mask("OF")] * 3, accepts, capacities)
+
+        assert slots.tolist() == [-1, 0, 0]
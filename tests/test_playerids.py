@@ -0,0 +1,116 @@
+import pandas as pd
+import pytest
+
+from fantasybaseball.playerids import load_player_id_map, merge_with_league_export
+
+PLAYER_ID_MAP_CSV = """IDPLAYER,PLAYERNAME,TEAM,IDFANGRAPHS,MLBID,ESPNID,YAHOOID,FANTRAXID,ALLPOS
+troutmi01,Mike Trout,LAA,10155,545361,30836,8967,*02yc4*,CF
+prospect01,Some Prospect,SEA,sa3014567,,,,,SS
+"""
+
+
+class TestLoadPlayerIdMap:
+    def test_keeps_id_and_name_columns_with_final_dtypes(self, tmp_path):
+        csv_path = tmp_path / "player_id_map.csv"
+        csv_path.write_text(PLAYER_ID_MAP_CSV)
+        player_map = load_player_id_map(csv_path, cache_dir=tmp_path / "cache")
+
+        assert list(player_map.columns) == ["Name", "MlbamId", "FangraphsId", "FantraxId", "EspnId", "YahooId"]
+        assert player_map["MlbamId"].dtype == "Int64"
+        assert player_map["FangraphsId"].dtype == "Int64"
+        assert player_map["FangraphsId"].iloc[0] == 10155
+        assert pd.isna(player_map["FangraphsId"].iloc[1])
+        assert player_map["FantraxId"].iloc[0] == "*02yc4*"
+
+    def test_cached_map_matches_parsed_map(self, tmp_path):
+        csv_path = tmp_path / "player_id_map.csv"
+        csv_path.write_text(PLAYER_ID_MAP_CSV)
+        parsed = load_player_id_map(csv_path, cache_dir=tmp_path / "cache")
+        cached = load_player_id_map(csv_path, cache_dir=tmp_path / "cache")
+
+        assert len(list((tmp_path / "cache" / "player_id_map").iterdir())) == 1
+        pd.testing.assert_frame_equal(parsed, cached)
+
+    def test_cache_invalidated_when_csv_changes(self, tmp_path):
+        csv_path = tmp_path / "player_id_map.csv"
+        csv_path.write_text(PLAYER_ID_MAP_CSV)
+        load_player_id_map(csv_path, cache_dir=tmp_path / "cache")
+
+        csv_path.write_text(PLAYER_ID_MAP_CSV.replace("Mike Trout", "Michael Trout"))
+        player_map = load_player_id_map(csv_path, cache_dir=tmp_path / "cache")
+
+        assert player_map["Name"].iloc[0] == "Michael Trout"
+
+
+class TestMergeWithLeagueExport:
+    @pytest.fixture
+    def projections(self):
+        return pd.DataFrame(
+            {
+                "ProjectionSource": ["steamer"] * 4,
+                "Name": ["Mlbam Match", "Fangraphs Match", "No Match", "Second Fangraphs Match"],
+                "MlbamId": pd.array([1, None, 3, None], dtype="Int64"),
+                "FangraphsId": pd.array([101, 102, 103, None], dtype="Int64"),
+                "HR": [30.0, 20.0, 10.0, 5.0],
+            },
+            # A non-default index must not shift fallback matches onto other rows
+            index=[10, 11, 12, 13],
+        )
+
+    @pytest.fixture
+    def league_export(self):
+        return pd.DataFrame(
+            {
+                "ID": ["*a*", "*b*", "*c*"],
+                "Status": ["Team A", "Team B", "FA"],
+                "Age": [30, 25, 22],
+                "Salary": [40.0, 12.0, 0.0],
+                "Contract": [2025, 2026, None],
+                "MlbamId": pd.array([1, None, None], dtype="Int64"),
+                "FangraphsId": ["101", "102", None],
+                "FantraxId": ["*a*", "*b*", "*c*"],
+            }
+        )
+
+    def test_mlbam_match(self, projections, league_export):
+        merged = merge_with_league_export(projections, league_export)
+
+        assert merged.loc[0, "Status"] == "Team A"
+        assert merged.loc[0, "FantraxId"] == "*a*"
+
+    def test_fangraphs_fallback_applied_to_right_row(self, projections, league_export):
+        merged = merge_with_league_export(projections, league_export)
+
+        assert merged.loc[1, "Name"] == "Fangraphs Match"
+        assert merged.loc[1, "Status"] == "Team B"
+        assert merged.loc[1, "Salary"] == 12.0
+        assert merged.loc[1, "FantraxId"] == "*b*"
+        assert pd.isna(merged.loc[2, "Status"])
+        assert pd.isna(merged.loc[3, "Status"])
+
+    def test_preserves_rows_and_order(self, projections, league_export):
+        # Duplicate export rows must not duplicate projections
+        league_export = pd.concat([league_export, league_export], ignore_index=True)
+        merged = merge_with_league_export(projections, league_export)
+
+        assert merged["Name"].tolist() == projections["Name"].tolist()
+        assert merged["HR"].tolist() == projections["HR"].tolist()
+
+    def test_fangraphs_id_filled_from_export(self, league_export):
+        projections = pd.DataFrame(
+            {
+                "ProjectionSource": ["steamer"],
+                "MlbamId": pd.array([1], dtype="Int64"),
+                "FangraphsId": pd.array([None], dtype="Int64"),
+            }
+        )
+        merged = merge_with_league_export(projections, league_export)
+
+        assert merged["FangraphsId"].dtype == "Int64"
+        assert merged.loc[0, "FangraphsId"] == 101
+
+    def test_export_without_mlbam_ids(self, projections, league_export):
+        league_export["MlbamId"] = pd.array([None, None, None], dtype="Int64")
+        merged = merge_with_league_export(projections, league_export)
+
+        assert merged["Status"].tolist()[:2] == ["Team A", "Team B"]
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fantasybaseball.model import StatCategory
+from fantasybaseball.points import calculate_points, calculate_points_matrix
+
+
+@pytest.fixture
+def bat_projections():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({"Name": [f"Player {i}" for i in range(20)]})
+    for stat in ["G", "AB", "H", "2B", "3B", "HR", "R", "RBI", "BB", "SO", "SB"]:
+        frame[stat] = rng.uniform(0, 100, 20)
+    frame.loc[3, "HR"] = np.nan
+    return frame
+
+
+class TestCalculatePointsMatrix:
+    SCORINGS = {
+        "a": {"bat": {"HR": 4, "R": 1, "RBI": 1, "SO": -1}},
+        "b": {"bat": {"1B": 1, "2B": 2, "3B": 3, "HR": 4, "BB": 1}},
+        "c": {"bat": {"SB": 2}},
+    }
+
+    @pytest.mark.parametrize("use_stat_proxies", [True, False])
+    def test_matches_per_league_scoring(self, bat_projections, use_stat_proxies):
+        points = calculate_points_matrix(bat_projections, StatCategory.BATTING, self.SCORINGS, use_stat_proxies)
+        for key, scoring in self.SCORINGS.items():
+            expected = calculate_points(bat_projections, StatCategory.BATTING, scoring, use_stat_proxies)
+            np.testing.assert_allclose(points[key], expected)
+
+    def test_one_column_per_league(self, bat_projections):
+        points = calculate_points_matrix(bat_projections, StatCategory.BATTING, self.SCORINGS, True)
+        assert list(points.columns) == ["a", "b", "c"]
+        assert points.index.equals(bat_projections.index)
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fantasybaseball.model import Position
+from fantasybaseball.positions import (
+    PositionLookup,
+    eligibility_masks,
+    position_mask,
+    replace_pitcher_position,
+    replace_positions,
+)
+
+
+@pytest.fixture
+def league_export():
+    return pd.DataFrame(
+        {
+            "Position": ["1B,3B", "SS", None, "SP,RP", "RP"],
+            "MlbamId": pd.array([1, None, 3, 4, None], dtype="Int64"),
+            "FangraphsId": pd.array([101, 102, 103, 104, 105], dtype="Int64"),
+        }
+    )
+
+
+class TestReplacePositions:
+    def test_mlbam_then_fangraphs_then_projection(self, league_export):
+        projections = pd.DataFrame(
+            {
+                "MlbamId": pd.array([1, None, 3, 9], dtype="Int64"),
+                "FangraphsId": pd.array([101, 102, 103, 109], dtype="Int64"),
+                "Position": ["1B", "2B", "C", "OF"],
+            }
+        )
+        result = replace_positions(projections, league_export)
+
+        # Comma-separated export positions become slash-separated
+        assert result["Position"].tolist() == ["1B/3B", "SS", "C", "OF"]
+
+    def test_lookup_reused_across_frames(self, league_export):
+        lookup = PositionLookup(league_export)
+        first = pd.DataFrame({"MlbamId": pd.array([1], dtype="Int64"), "FangraphsId": [101], "Position": ["1B"]})
+        second = pd.DataFrame({"MlbamId": pd.array([None], dtype="Int64"), "FangraphsId": [102], "Position": ["2B"]})
+
+        assert replace_positions(first, lookup)["Position"].tolist() == ["1B/3B"]
+        assert replace_positions(second, lookup)["Position"].tolist() == ["SS"]
+
+
+class TestReplacePitcherPosition:
+    @pytest.fixture
+    def pitchers(self):
+        return pd.DataFrame(
+            {
+                "MlbamId": pd.array([4, None, 7], dtype="Int64"),
+                "FangraphsId": pd.array([104, 105, 107], dtype="Int64"),
+                "GS": [0.0, 30.0, 12.0],
+            }
+        )
+
+    def test_games_started_heuristic(self, pitchers):
+        result = replace_pitcher_position(pitchers, {"positions": {"SP": 5, "RP": 2}})
+
+        assert result["Position"].tolist() == ["RP", "SP", "SP"]
+
+    def test_league_positions_override_heuristic(self, pitchers, league_export):
+        lookup = PositionLookup(league_export)
+        result = replace_pitcher_position(pitchers, {"positions": {"SP": 5, "RP": 2}}, lookup)
+
+        assert result["Position"].tolist() == ["SP/RP", "RP", "SP"]
+        assert result["Eligibility"].tolist() == [Position.SP.bit | Position.RP.bit, Position.RP.bit, Position.SP.bit]
+
+    def test_generic_pitcher_slots(self, pitchers, league_export):
+        result = replace_pitcher_position(pitchers, {"positions": {"P": 9}}, PositionLookup(league_export))
+
+        assert (result["Position"] == "P").all()
+        assert (result["Eligibility"] == Position.P.bit).all()
+
+
+class TestEligibility:
+    def test_bits_are_distinct(self):
+        bits = [position.bit for position in Position]
+        assert len(set(bits)) == len(bits)
+        assert all(bit & (bit - 1) == 0 for bit in bits)
+
+    def test_exact_tokens(self):
+        assert position_mask("SP") == Position.SP.bit
+        assert position_mask("OF") & Position.C.bit == 0
+        assert position_mask("CF") & Position.C.bit == 0
+
+    def test_flex_expansion(self):
+        mask = position_mask("1B/SS")
+        for position in [Position.FiB, Position.SS, Position.CI, Position.MI, Position.UTIL]:
+            assert mask & position.bit
+        assert not mask & Position.ThB.bit
+        assert position_mask("SP/RP") & Position.UTIL.bit == 0
+        assert position_mask("DH") == Position.DH.bit | Position.UTIL.bit
+
+    def test_comma_separated_and_unknown_tokens(self):
+        assert position_mask("2B,XX") == position_mask("2B")
+
+    def test_masks_per_row(self):
+        masks = eligibility_masks(pd.Series(["C", None, "C", "RP"], dtype="category"))
+        assert masks.dtype == np.int32
+        assert masks.tolist() == [position_mask("C"), 0, position_mask("C"), Position.RP.bit]
+
+    def test_replace_positions_sets_eligibility(self, league_export):
+        projections = pd.DataFrame(
+            {"MlbamId": pd.array([1], dtype="Int64"), "FangraphsId": [101], "Position": ["OF"]}
+        )
+        result = replace_positions(projections, league_export)
+        assert result["Eligibility"].tolist() == [position_mask("1B/3B")]
@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fantasybaseball import powerrankings
+from fantasybaseball.config import RosterConfig
+from fantasybaseball.powerrankings import (
+    generate_power_rankings,
+    get_optimal_lineups,
+    get_rankings_by_type,
+    get_top_n_by_team,
+    load_projections,
+    parse_currency,
+)
+
+
+def _write_projections(path, sources=("steamer", "zips")):
+    rows = list()
+    for s, source in enumerate(sources):
+        for i in range(12):
+            rows.append(
+                {
+                    "ProjectionSource": source,
+                    "Name": f"Player {i}",
+                    "MlbamId": i,
+                    "Position": "OF",
+                    "Status": ["Team A", "Team B", "FA"][i % 3],
+                    "Salary": f"${i:,.2f}",
+                    "Points": 100.0 * (12 - i) + s * 10 * i,
+                    "PAR": 50.0 - i,
+                    "PlayerValue": f"${1000 * i:,.2f}",
+                    "AuctionValue": "$-5.00",
+                    "ContractValue": "",
+                    "HR": i,
+                }
+            )
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return path
+
+
+class TestParseCurrency:
+    def test_strings(self):
+        result = parse_currency(pd.Series(["$1,234.50", "$-3.00", "", None, "$0.00"]))
+        np.testing.assert_array_equal(result.to_numpy(), [1234.5, -3.0, np.nan, np.nan, 0.0])
+
+    def test_numbers_pass_through(self):
+        assert parse_currency(pd.Series([1, 2])).tolist() == [1.0, 2.0]
+
+
+class TestLoadProjections:
+    def test_needed_columns_and_dtypes(self, tmp_path):
+        path = _write_projections(tmp_path / "bat.csv")
+
+        projections = load_projections(path, cache_dir=tmp_path, use_cache=False)
+
+        assert "HR" not in projections
+        assert projections["Salary"].dtype == np.float64
+        assert projections["PlayerValue"].iloc[3] == 3000.0
+        assert isinstance(projections["ProjectionSource"].dtype, pd.CategoricalDtype)
+
+    def test_cached_between_calls(self, tmp_path):
+        path = _write_projections(tmp_path / "bat.csv")
+
+        parsed = load_projections(path, cache_dir=tmp_path)
+        assert len(list((tmp_path / "rankings").iterdir())) == 1
+        cached = load_projections(path, cache_dir=tmp_path)
+
+        pd.testing.assert_frame_equal(cached, parsed)
+
+    def test_new_cache_version_reparses(self, tmp_path, monkeypatch):
+        path = _write_projections(tmp_path / "bat.csv")
+        load_projections(path, cache_dir=tmp_path)
+
+        monkeypatch.setattr(powerrankings, "RANKINGS_CACHE_VERSION", powerrankings.RANKINGS_CACHE_VERSION + 1)
+        load_projections(path, cache_dir=tmp_path)
+
+        assert len(list((tmp_path / "rankings").iterdir())) == 2
+
+
+class TestRankings:
+    def test_top_n_per_source_and_team(self, tmp_path):
+        projections = load_projections(_write_projections(tmp_path / "bat.csv"), use_cache=False)
+
+        top = get_top_n_by_team(projections, 2)
+
+        assert top.groupby(["ProjectionSource", "Status"], observed=True).size().tolist() == [2, 2, 2, 2]
+        assert "FA" not in set(top["Status"])
+
+    def test_all_sources_match_single_source_rankings(self, tmp_path):
+        bat = _write_projections(tmp_path / "bat.csv")
+        pit = _write_projections(tmp_path / "pit.csv")
+
+        rankings = generate_power_rankings(bat, pit, None, 3, 3, cache_dir=tmp_path)
+        zips = generate_power_rankings(bat, pit, "zips", 3, 3, cache_dir=tmp_path)
+
+        assert rankings["combined"].index.names == ["ProjectionSource", "Rank"]
+        for ranking_type, df in zips.items():
+            pd.testing.assert_frame_equal(df, rankings[ranking_type].loc["zips"])
+        assert zips["batter"].index.tolist() == [1, 2]
+        assert zips["batter"]["Player Count"].tolist() == [3, 3]
+
+    def test_single_source_frame(self):
+        players = pd.DataFrame(
+            {
+                "Status": ["A", "A", "B"],
+                "Points": [10.0, 20.0, 50.0],
+                "Salary": [1.0, 2.0, 3.0],
+                "AuctionValue": [1.0, 1.0, 1.0],
+                "ContractValue": [0.0, 0.0, 0.0],
+            }
+        )
+
+        rankings = get_rankings_by_type(players)
+
+        assert rankings["Team"].tolist() == ["B", "A"]
+        assert rankings.loc[2, "Points Avg"] == pytest.approx(15.0)
+
+
+class TestOptimalLineups:
+    roster_positions = {"C": 1, "1B": 1, "CI": 1, "UTIL": 1, "bench": 5}
+
+    def _players(self):
+        return pd.DataFrame(
+            {
+                "ProjectionSource": "steamer",
+                "Name": [f"Player {i}" for i in range(8)],
+                # Team A is stacked at catcher; Team B fills every slot
+                "Status": ["Team A"] * 4 + ["Team B"] * 4,
+                "Position": ["C", "C", "C", "C/1B", "C", "1B", "3B", "OF"],
+                "Points": [300.0, 290.0, 280.0, 100.0, 200.0, 200.0, 200.0, 200.0],
+            }
+        )
+
+    def test_lineups_fill_legal_slots(self):
+        lineups = get_optimal_lineups(self._players(), self.roster_positions)
+
+        team_a = lineups[lineups["Status"] == "Team A"].set_index("Name")["Slot"].to_dict()
+        # The C/1B plays first base so two more catchers can start at C and UTIL
+        assert team_a == {"Player 0": "C", "Player 1": "UTIL", "Player 3": "1B"}
+        team_b = lineups[lineups["Status"] == "Team B"].set_index("Name")["Slot"]
+        assert sorted(team_b) == ["1B", "C", "CI", "UTIL"]
+
+    def test_dh_starts_at_util(self):
+        players = self._players()
+        players.loc[7, "Position"] = "DH"
+
+        lineups = get_optimal_lineups(players, self.roster_positions)
+
+        team_b = lineups[lineups["Status"] == "Team B"].set_index("Name")["Slot"]
+        assert team_b["Player 7"] == "UTIL"
+
+    def test_stacked_team_ranks_below_balanced_team(self):
+        players = self._players()
+
+        top_n = get_rankings_by_type(get_top_n_by_team(players, 4))
+        lineups = get_rankings_by_type(get_optimal_lineups(players, self.roster_positions))
+
+        assert top_n.loc[("steamer", 1), "Team"] == "Team A"
+        assert lineups.loc[("steamer", 1), "Team"] == "Team B"
+        assert lineups.loc[("steamer", 1), "Points Total"] == 800.0
+
+    def test_generate_with_league_roster(self, tmp_path):
+        bat = _write_projections(tmp_path / "bat.csv")
+        pit = _write_projections(tmp_path / "pit.csv")
+        roster = RosterConfig(teams=2, positions={"OF": 3, "UTIL": 1, "bench": 10})
+
+        rankings = generate_power_rankings(bat, pit, "zips", cache_dir=tmp_path, league_roster=roster)
+
+        assert rankings["batter"]["Player Count"].tolist() == [4, 4]
+        assert rankings["combined"]["Player Count"].tolist() == [8, 8]
@@ -0,0 +1,55 @@
+import json
+
+from fantasybaseball.profiling import NULL_PROFILER, Profiler
+
+
+class TestProfiler:
+    def test_records_stages(self):
+        profiler = Profiler()
+        with profiler.stage("points") as stage:
+            data = [0] * 100_000
+            stage.rows = len(data)
+        with profiler.stage("valuation"):
+            pass
+        profiler.close()
+
+        assert [r.name for r in profiler.records] == ["points", "valuation"]
+        points = profiler.records[0]
+        assert points.rows == 100_000
+        assert points.wall >= 0.0
+        assert points.peak_bytes >= 100_000 * 8
+        assert profiler.records[1].start >= points.start + points.wall
+
+    def test_without_memory_tracing(self):
+        profiler = Profiler(trace_memory=False)
+        with profiler.stage("fetch"):
+            pass
+
+        assert profiler.records[0].peak_bytes is None
+
+    def test_chrome_trace(self, tmp_path):
+        profiler = Profiler(trace_memory=False)
+        with profiler.stage("fetch") as stage:
+            stage.rows = 10
+        path = tmp_path / "trace.json"
+        profiler.write_trace(path)
+
+        trace = json.loads(path.read_text())
+        event = trace["traceEvents"][0]
+        assert event["name"] == "fetch"
+        assert event["ph"] == "X"
+        assert event["args"]["rows"] == 10
+        assert trace["stages"][0]["rows"] == 10
+
+    def test_table_lists_stages(self):
+        profiler = Profiler(trace_memory=False)
+        with profiler.stage("consensus") as stage:
+            stage.rows = 1234
+        table = profiler.format_table()
+
+        assert "consensus" in table
+        assert "1,234" in table
+
+    def test_null_profiler_is_a_no_op(self):
+        with NULL_PROFILER.stage("points") as stage:
+            stage.rows = 5
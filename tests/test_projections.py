@@ -0,0 +1,174 @@
+import pandas as pd
+
+from fantasybaseball import cache
+from fantasybaseball.cache import StageCache
+from fantasybaseball.config import load_league_config
+from fantasybaseball.dtypes import compact_projections
+from fantasybaseball.profiling import Profiler
+from fantasybaseball.model import StatCategory
+from fantasybaseball.projections import (
+    augment_league_projections,
+    augment_projections,
+    write_league_projections,
+    write_projections_file,
+)
+
+
+class TestIncrementalAugmentProjections:
+    def _run(self, make_projections, league_yaml, stage_cache, power_factor=None):
+        profiler = Profiler(trace_memory=False)
+        bat, pit = augment_projections(
+            make_projections(True),
+            make_projections(False),
+            load_league_config(league_yaml),
+            power_factor=power_factor,
+            profiler=profiler,
+            stage_cache=stage_cache,
+        )
+        return bat, pit, [r.name for r in profiler.records]
+
+    def test_cached_run_matches_uncached(self, tmp_path, league_yaml, make_projections):
+        bat, pit, _ = self._run(make_projections, league_yaml, None)
+        cached_bat, cached_pit, stages = self._run(make_projections, league_yaml, StageCache(tmp_path))
+        rerun_bat, rerun_pit, rerun_stages = self._run(make_projections, league_yaml, StageCache(tmp_path))
+
+        pd.testing.assert_frame_equal(bat, cached_bat)
+        pd.testing.assert_frame_equal(bat, rerun_bat)
+        pd.testing.assert_frame_equal(pit, rerun_pit)
+        assert stages == ["consensus", "player_ids", "points", "replacement", "valuation", "formatting"]
+        assert rerun_stages == ["formatting (cached)"]
+
+    def test_only_downstream_stages_rerun(self, tmp_path, league_yaml, make_projections):
+        stage_cache = StageCache(tmp_path)
+        self._run(make_projections, league_yaml, stage_cache)
+
+        _, _, stages = self._run(make_projections, league_yaml, stage_cache, power_factor=1.5)
+        assert stages == ["replacement (cached)", "valuation", "formatting"]
+
+        league_yaml["roster"]["teams"] = 3
+        _, _, stages = self._run(make_projections, league_yaml, stage_cache)
+        assert stages == ["points (cached)", "replacement", "valuation", "formatting"]
+
+    def test_changed_projections_rerun_everything(self, tmp_path, league_yaml, make_projections):
+        stage_cache = StageCache(tmp_path)
+        self._run(make_projections, league_yaml, stage_cache)
+
+        pit = make_projections(False)
+        pit.loc[0, "SO"] += 1
+        profiler = Profiler(trace_memory=False)
+        augment_projections(
+            make_projections(True), pit, load_league_config(league_yaml), profiler=profiler, stage_cache=stage_cache
+        )
+        assert profiler.records[0].name == "consensus"
+
+    def test_new_cache_version_reruns_everything(self, tmp_path, league_yaml, monkeypatch, make_projections):
+        stage_cache = StageCache(tmp_path)
+        self._run(make_projections, league_yaml, stage_cache)
+
+        monkeypatch.setattr(cache, "STAGE_CACHE_VERSION", cache.STAGE_CACHE_VERSION + 1)
+        _, _, stages = self._run(make_projections, league_yaml, stage_cache)
+        assert stages[0] == "consensus"
+
+    def test_changed_league_export_reruns_from_player_ids(self, tmp_path, league_yaml, make_projections):
+        player_id_map = tmp_path / "player_id_map.csv"
+        player_id_map.write_text("PLAYERNAME,MLBID,IDFANGRAPHS,FANTRAXID,ESPNID,YAHOOID\nPlayer 0,1000,1,*a*,,\n")
+        league_export = pd.DataFrame(
+            {"ID": ["*a*"], "Position": ["C"], "Status": ["Team A"], "Age": [30], "Salary": [10.0], "Contract": [1]}
+        )
+        stage_cache = StageCache(tmp_path)
+
+        def run(export):
+            profiler = Profiler(trace_memory=False)
+            bat, _ = augment_projections(
+                make_projections(True),
+                make_projections(False),
+                load_league_config(league_yaml),
+                export,
+                player_id_map_path=player_id_map,
+                cache_dir=tmp_path,
+                profiler=profiler,
+                stage_cache=stage_cache,
+            )
+            return bat, [r.name for r in profiler.records]
+
+        run(league_export)
+        league_export.loc[0, "Salary"] = 20.0
+        bat, stages = run(league_export)
+
+        assert stages[:2] == ["consensus (cached)", "player_ids"]
+        assert bat.loc[bat["Name"] == "Player 0", "Salary"].eq(20.0).all()
+
+
+class TestAugmentLeagueProjections:
+    def test_matches_separate_runs(self, league_yaml, make_projections):
+        other_yaml = dict(league_yaml, name="other", scoring={"bat": {"H": 1, "BB": 1}, "pit": {"IP": 1, "W": 5}})
+        leagues = [(load_league_config(league_yaml), None), (load_league_config(other_yaml), None)]
+
+        augmented = augment_league_projections(make_projections(True), make_projections(False), leagues)
+
+        assert len(augmented) == 2
+        for (league, _), (bat, pit) in zip(leagues, augmented):
+            expected_bat, expected_pit = augment_projections(make_projections(True), make_projections(False), league)
+            pd.testing.assert_frame_equal(bat, expected_bat)
+            pd.testing.assert_frame_equal(pit, expected_pit)
+
+    def test_unscored_league(self, league_yaml, make_projections):
+        leagues = [(load_league_config(league_yaml), None), (None, None)]
+
+        augmented = augment_league_projections(make_projections(True), make_projections(False), leagues)
+
+        assert "Points" in augmented[0][0]
+        assert "Points" not in augmented[1][0]
+
+
+class TestWriteLeagueProjections:
+    def test_matches_serial_run(self, tmp_path, league_yaml, make_projections):
+        player_id_map = tmp_path / "player_id_map.csv"
+        player_id_map.write_text("PLAYERNAME,MLBID,IDFANGRAPHS,FANTRAXID,ESPNID,YAHOOID\nPlayer 0,1000,1,*a*,,\n")
+        league_export = pd.DataFrame(
+            {"ID": ["*a*"], "Position": ["C"], "Status": ["Team A"], "Age": [30], "Salary": [10.0], "Contract": [1]}
+        )
+        other_yaml = dict(league_yaml, name="other", scoring={"bat": {"H": 1, "BB": 1}, "pit": {"IP": 1, "W": 5}})
+        leagues = [(load_league_config(league_yaml), league_export), (load_league_config(other_yaml), None)]
+        options = {"player_id_map_path": player_id_map, "cache_dir": tmp_path}
+        (tmp_path / "serial").mkdir()
+        (tmp_path / "pool").mkdir()
+
+        expected = augment_league_projections(make_projections(True), make_projections(False), leagues, **options)
+        augmented, file_paths = write_league_projections(
+            make_projections(True), make_projections(False), leagues, tmp_path / "pool", max_workers=2, **options
+        )
+
+        for (league, _), (bat, pit), (expected_bat, expected_pit), paths in zip(
+            leagues, augmented, expected, [file_paths[:2], file_paths[2:]]
+        ):
+            pd.testing.assert_frame_equal(bat, expected_bat.reset_index(drop=True), check_dtype=False)
+            pd.testing.assert_frame_equal(pit, expected_pit.reset_index(drop=True), check_dtype=False)
+            serial_paths = [
+                write_projections_file(expected_bat, StatCategory.BATTING, tmp_path / "serial", league.name),
+                write_projections_file(expected_pit, StatCategory.PITCHING, tmp_path / "serial", league.name),
+            ]
+            for path, serial_path in zip(paths, serial_paths):
+                assert path.name == serial_path.name
+                assert path.read_text() == serial_path.read_text()
+        assert augmented[0][0].loc[augmented[0][0]["Name"] == "Player 0", "Salary"].eq(10.0).all()
+
+
+class TestCompactAugmentProjections:
+    def test_matches_default_dtypes(self, league_yaml, make_projections):
+        league = load_league_config(league_yaml)
+        expected = augment_projections(make_projections(True), make_projections(False), league)
+        compact = augment_projections(
+            compact_projections(make_projections(True)), compact_projections(make_projections(False)), league
+        )
+
+        for frame, expected_frame in zip(compact, expected):
+            assert isinstance(frame["ProjectionSource"].dtype, pd.CategoricalDtype)
+            assert isinstance(frame["Name"].dtype, pd.CategoricalDtype)
+            pd.testing.assert_frame_equal(
+                frame.reset_index(drop=True),
+                expected_frame.reset_index(drop=True),
+                check_dtype=False,
+                check_categorical=False,
+                atol=0.01,
+            )
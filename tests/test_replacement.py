@@ -1,7 +1,17 @@
+import math
+
+import numpy as np
+import pandas as pd
 import pytest
 
 from fantasybaseball.model import Position
-from fantasybaseball.replacement import _calculate_replacement_level_ranks
+from fantasybaseball.positions import add_eligibility
+from fantasybaseball.replacement import (
+    _calculate_assigned_replacement_level_points,
+    _calculate_replacement_level_points,
+    _calculate_replacement_level_ranks,
+    calculate_points_above_replacement,
+)
 
 
 class TestCalculateReplacementLevelRanks:
@@ -85,3 +95,142 @@ class TestCalculateReplacementLevelRanks:
         assert Position.UTIL not in result
         # Verify P exists (non-flex)
         assert Position.P in result
+
+
+def _naive_replacement_level_points(projections, replacement_level_ranks, replacement_players=5):
+    expected = dict()
+    for source in projections["ProjectionSource"].unique():
+        expected[source] = dict()
+        for position, rank in replacement_level_ranks.items():
+            tokens = projections["Position"].fillna("").str.split("/")
+            eligible = tokens.map(lambda t: position.value in t)
+            points = projections.loc[(projections["ProjectionSource"] == source) & eligible, "Points"].dropna()
+            if not points.empty:
+                top = points.nlargest(math.ceil(rank + replacement_players - 1))
+                expected[source][position.value] = top.nsmallest(replacement_players).mean()
+    return expected
+
+
+class TestCalculateReplacementLevelPoints:
+    def test_matches_naive_windows(self):
+        rng = np.random.default_rng(0)
+        projections = pd.DataFrame(
+            {
+                "ProjectionSource": rng.choice(["steamer", "zipsdc", "oopsy"], 400),
+                "Position": rng.choice(["C", "1B", "1B/3B", "SS/2B", "OF", "C/1B", None], 400),
+                "Points": rng.normal(300, 80, 400),
+            }
+        )
+        projections.loc[::17, "Points"] = np.nan
+        ranks = {Position.C: 12, Position.FiB: 20.5, Position.ThB: 3, Position.OF: 200, Position.SS: 1}
+
+        result = _calculate_replacement_level_points(projections, ranks)
+
+        expected = _naive_replacement_level_points(projections, ranks)
+        assert result.keys() == expected.keys()
+        for source in expected:
+            assert result[source] == pytest.approx(expected[source])
+
+    def test_exact_position_tokens(self):
+        """'P' doesn't match 'SP'/'RP', and 'C' doesn't match 'CF'."""
+        projections = pd.DataFrame(
+            {
+                "ProjectionSource": "steamer",
+                "Position": ["SP", "RP", "P", "CF", "C"],
+                "Points": [500.0, 400.0, 100.0, 300.0, 50.0],
+            }
+        )
+
+        result = _calculate_replacement_level_points(projections, {Position.P: 1, Position.C: 1}, 1)
+
+        assert result == {"steamer": {"P": 100.0, "C": 50.0}}
+
+
+class TestCalculatePointsAboveReplacement:
+    def test_best_position_and_fallback(self):
+        roster = {"teams": 1, "positions": {"C": 1, "1B": 1}}
+        projections = pd.DataFrame(
+            {
+                "ProjectionSource": "steamer",
+                "Position": ["C", "C", "1B", "1B", "C/1B", "DH"],
+                "Points": [100.0, 80.0, 200.0, 150.0, 120.0, 90.0],
+            },
+            index=[10, 11, 12, 13, 14, 15],
+        )
+
+        par = calculate_points_above_replacement(projections, roster, include_bench=False)
+
+        # Replacement windows include the top five: C = mean(100, 80, 120), 1B = mean(200, 150, 120)
+        replacement_c, replacement_1b = 100.0, 470.0 / 3
+        assert list(par.index) == [10, 11, 12, 13, 14, 15]
+        assert par[14] == pytest.approx(120.0 - replacement_c)
+        assert par[12] == pytest.approx(200.0 - replacement_1b)
+        # DH has no replacement level, so it falls back to the source's highest
+        assert par[15] == pytest.approx(90.0 - replacement_1b)
+
+
+class TestCalculateAssignedReplacementLevelPoints:
+    roster = {"teams": 1, "positions": {"C": 1, "1B": 1, "P": 2, "bench": 2}}
+
+    def _projections(self):
+        return add_eligibility(
+            pd.DataFrame(
+                {
+                    "ProjectionSource": "steamer",
+                    "Position": ["C/1B", "C", "1B", "1B", "C"],
+                    "Points": [200.0, 150.0, 100.0, 90.0, 80.0],
+                }
+            )
+        )
+
+    def test_multi_position_player_fills_one_slot(self):
+        projections = self._projections()
+
+        result = _calculate_assigned_replacement_level_points(
+            projections, self.roster, projections["Points"], include_bench=False, replacement_players=1
+        )
+
+        # C/1B moves to first base to make room for the catcher, so the best players left are the next 1B and C
+        assert result == {"steamer": {"C": 80.0, "1B": 100.0}}
+
+    def test_bench_is_split_by_side(self):
+        projections = self._projections()
+
+        # Batters fill two of the four starting slots, so they get half the bench
+        result = _calculate_assigned_replacement_level_points(
+            projections, self.roster, projections["Points"], include_bench=True, replacement_players=1
+        )
+
+        assert result == {"steamer": {"C": 80.0, "1B": 90.0}}
+
+    def test_pads_with_last_assigned_players(self):
+        projections = self._projections()
+
+        result = _calculate_assigned_replacement_level_points(
+            projections, self.roster, projections["Points"], include_bench=False, replacement_players=3
+        )
+
+        assert result["steamer"]["C"] == pytest.approx((150.0 + 80.0 + 200.0) / 3)
+
+    def test_points_above_replacement(self):
+        projections = self._projections()
+
+        par = calculate_points_above_replacement(
+            projections, self.roster, include_bench=False, replacement_mode="assignment"
+        )
+
+        # Pools are smaller than five players, so each level is the mean of the whole pool
+        replacement_c, replacement_1b = 430.0 / 3, 130.0
+        assert par.tolist() == pytest.approx(
+            [
+                200.0 - replacement_1b,
+                150.0 - replacement_c,
+                100.0 - replacement_1b,
+                90.0 - replacement_1b,
+                80.0 - replacement_c,
+            ]
+        )
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            calculate_points_above_replacement(self._projections(), self.roster, replacement_mode="greedy")
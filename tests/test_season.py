@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fantasybaseball.season import load_schedule, round_robin_schedule, simulate_seasons, team_distributions
+
+TEAMS = ["A", "B", "C", "D"]
+
+
+def _distributions(means, talent=0.0, noise=10.0):
+    return pd.DataFrame(
+        {"Mean": means, "Talent": talent, "Noise": noise}, index=pd.Index(TEAMS[: len(means)], name="Team")
+    )
+
+
+class TestRoundRobinSchedule:
+    def test_every_team_plays_once_a_week(self):
+        schedule = round_robin_schedule(TEAMS, 6)
+
+        for _, week in schedule.groupby("Week"):
+            assert sorted(week["Home"].tolist() + week["Away"].tolist()) == TEAMS
+        pairs = {frozenset(p) for p in zip(schedule["Home"], schedule["Away"])}
+        assert len(pairs) == 6
+
+    def test_odd_team_count_gets_byes(self):
+        schedule = round_robin_schedule(TEAMS[:3], 3)
+
+        assert schedule.groupby("Week").size().tolist() == [1, 1, 1]
+
+
+class TestLoadSchedule:
+    def test_missing_columns(self, tmp_path):
+        path = tmp_path / "schedule.csv"
+        pd.DataFrame({"Week": [1], "Home": ["A"]}).to_csv(path, index=False)
+
+        with pytest.raises(ValueError, match="Away"):
+            load_schedule(path)
+
+
+class TestTeamDistributions:
+    def test_means_and_spread_across_sources(self):
+        bat = pd.DataFrame(
+            {
+                "ProjectionSource": ["steamer", "zips"] * 2,
+                "Status": ["A", "A", "B", "B"],
+                "Points": [100.0, 120.0, 80.0, 80.0],
+            }
+        )
+        pit = bat.iloc[:0]
+
+        distributions = team_distributions(bat, pit, weeks=10, num_batters=1, weekly_cv=0.1)
+
+        assert distributions.loc["A", "Mean"] == pytest.approx(11.0)
+        assert distributions.loc["A", "Talent"] == pytest.approx(np.std([100.0, 120.0], ddof=1) / 10)
+        assert distributions.loc["B", "Talent"] == 0.0
+        assert distributions.loc["B", "Noise"] == pytest.approx(0.8)
+
+
+class TestSimulateSeasons:
+    def test_dominant_team(self):
+        schedule = round_robin_schedule(TEAMS, 6)
+
+        summary = simulate_seasons(_distributions([500.0, 100.0, 100.0, 100.0]), schedule, 2000, playoff_teams=2)
+
+        best = summary.set_index("Team").loc["A"]
+        assert best["ExpectedWins"] == 6.0
+        assert best["Seed1"] == 1.0
+        assert summary["ExpectedWins"].sum() == pytest.approx(len(schedule))
+        assert summary[["Seed1", "Seed2"]].sum().tolist() == pytest.approx([1.0, 1.0])
+        assert summary["PlayoffOdds"].sum() == pytest.approx(2.0)
+
+    def test_even_teams_split_wins(self):
+        schedule = round_robin_schedule(TEAMS, 6)
+
+        summary = simulate_seasons(_distributions([100.0] * 4, talent=5.0), schedule, 20_000, chunk_size=3000)
+
+        np.testing.assert_allclose(summary["ExpectedWins"], 3.0, atol=0.1)
+        np.testing.assert_allclose(summary["PlayoffOdds"], 1.0)
+
+    def test_process_pool_matches_serial(self):
+        schedule = round_robin_schedule(TEAMS, 6)
+        distributions = _distributions([110.0, 100.0, 95.0, 90.0], talent=3.0)
+
+        serial = simulate_seasons(distributions, schedule, 4000, chunk_size=1000)
+        pooled = simulate_seasons(distributions, schedule, 4000, chunk_size=1000, max_workers=2)
+
+        pd.testing.assert_frame_equal(serial, pooled)
+
+    def test_unknown_schedule_team(self):
+        schedule = pd.DataFrame({"Week": [1], "Home": ["A"], "Away": ["Z"]})
+
+        with pytest.raises(ValueError, match="Z"):
+            simulate_seasons(_distributions([100.0, 100.0]), schedule, 10)
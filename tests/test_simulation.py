@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from fantasybaseball.config import load_league_config
+from fantasybaseball.projections import augment_projections
+from fantasybaseball.simulation import _percentiles, simulate_projections
+
+
+@pytest.fixture
+def league(league_yaml):
+    return load_league_config(league_yaml)
+
+
+@pytest.fixture
+def augmented(league, make_projections):
+    bat_projections = make_projections(True)
+    # Simulation keeps one position per player
+    bat_projections["Position"] = bat_projections.groupby("MlbamId")["Position"].transform("first")
+    return augment_projections(bat_projections, make_projections(False), league)
+
+
+class TestSimulateProjections:
+    def test_players_without_ids(self, league, make_projections):
+        bat_projections = make_projections(True)
+        bat_projections["Position"] = bat_projections.groupby("MlbamId")["Position"].transform("first")
+        # Prospects with neither ID; augmentation fills their IDs with -1
+        without_ids = bat_projections["Name"].isin([f"Player {i}" for i in range(3, 8)])
+        bat_projections.loc[without_ids, ["MlbamId", "FangraphsId"]] = None
+        augmented = augment_projections(bat_projections, make_projections(False), league)
+
+        bat, _ = simulate_projections(*augmented, league, samples=20)
+
+        assert len(bat) == 30
+        assert sorted(bat.loc[bat["MlbamId"] == -1, "Name"]) == [f"Player {i}" for i in range(3, 8)]
+
+    def test_single_source_matches_point_estimates(self, league, augmented):
+        """With one source there's no spread, so every sample is the pipeline's point estimate."""
+        simulations = simulate_projections(*augmented, league, samples=50, sources=["steamer"])
+
+        for simulation, projections in zip(simulations, augmented):
+            expected = projections[projections["ProjectionSource"] == "steamer"].set_index("MlbamId")
+            simulation = simulation.set_index("MlbamId").loc[expected.index]
+            for column, expected_column in [("Points", "Points"), ("PAR", "PAR"), ("Value", "PlayerValue")]:
+                np.testing.assert_allclose(simulation[f"{column}_P10"], expected[expected_column], atol=0.02)
+                np.testing.assert_allclose(simulation[f"{column}_P90"], expected[expected_column], atol=0.02)
+
+    @pytest.mark.parametrize("variance", ["source", "stat"])
+    def test_percentiles_ordered(self, league, augmented, variance, projection_sources):
+        bat, pit = simulate_projections(*augmented, league, samples=200, variance=variance, sources=projection_sources)
+
+        assert len(bat) == 30 and len(pit) == 30
+        for frame in (bat, pit):
+            for column in ["Points", "PAR", "Value"]:
+                assert (frame[f"{column}_P10"] <= frame[f"{column}_P50"]).all()
+                assert (frame[f"{column}_P50"] <= frame[f"{column}_P90"]).all()
+            assert (frame[f"Points_P10"] < frame[f"Points_P90"]).any()
+        assert bat["Value_P50"].is_monotonic_decreasing
+
+    def test_chunks_and_seed(self, league, augmented, projection_sources):
+        options = dict(samples=300, chunk_size=100, sources=projection_sources, seed=1)
+        first = simulate_projections(*augmented, league, **options)
+        second = simulate_projections(*augmented, league, **options)
+        for a, b in zip(first, second):
+            assert a.equals(b)
+
+    def test_invalid_variance(self, league, augmented):
+        with pytest.raises(ValueError):
+            simulate_projections(*augmented, league, samples=10, variance="bogus")
+
+
+def test_percentiles_match_numpy():
+    samples = np.random.default_rng(0).normal(size=(101, 7)).astype(np.float32)
+    np.testing.assert_allclose(_percentiles(samples), np.percentile(samples, [10, 50, 90], axis=0).T, rtol=1e-6)
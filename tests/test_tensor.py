@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fantasybaseball.aggregation import add_mean_projection
+from fantasybaseball.model import StatCategory
+from fantasybaseball.points import calculate_points
+from fantasybaseball.replacement import calculate_points_above_replacement
+from fantasybaseball.tensor import ProjectionTensor
+
+SCORING = {"bat": {"HR": 4, "R": 1, "RBI": 1, "SO": -1, "TB": 1}}
+ROSTER = {"teams": 2, "positions": {"C": 1, "1B": 1, "SS": 1, "OF": 2, "UTIL": 1, "bench": 2}}
+
+
+@pytest.fixture
+def projections(make_projections):
+    projections = make_projections(True)
+    # The tensor keeps one set of attributes per player
+    projections["Position"] = projections.groupby("MlbamId")["Position"].transform("first")
+    # One source is missing a player, and another has a missing stat
+    projections = projections.drop(index=3).reset_index(drop=True)
+    projections.loc[10, "HR"] = np.nan
+    return projections
+
+
+@pytest.fixture
+def tensor(projections):
+    return ProjectionTensor.from_long(projections)
+
+
+class TestProjectionTensor:
+    def test_shape(self, tensor):
+        assert tensor.shape == (30, 5, 11)
+        assert tensor.present.sum() == 149
+
+    def test_duplicate_player_and_source_rejected(self, projections):
+        duplicated = pd.concat([projections, projections.iloc[[0]]], ignore_index=True)
+
+        with pytest.raises(ValueError, match=projections.loc[0, "Name"]):
+            ProjectionTensor.from_long(duplicated)
+
+    def test_round_trip(self, projections, tensor):
+        long = tensor.to_long()
+        expected = projections.sort_values(["ProjectionSource", "MlbamId"]).reset_index(drop=True)
+        result = long.sort_values(["ProjectionSource", "MlbamId"]).reset_index(drop=True)
+        pd.testing.assert_frame_equal(result[expected.columns], expected, check_dtype=False)
+
+    def test_mean_matches_add_mean_projection(self, projections, tensor):
+        expected = add_mean_projection(projections, name="mean")
+        expected = expected[expected["ProjectionSource"] == "mean"].sort_values("MlbamId")
+        mean = tensor.with_mean("mean").to_long()
+        result = mean[mean["ProjectionSource"] == "mean"].sort_values("MlbamId")
+        np.testing.assert_allclose(result[tensor.stats].to_numpy(), expected[tensor.stats].to_numpy())
+
+    def test_weighted_mean(self, tensor):
+        weights = {tensor.sources[0]: 2.0}
+        expected = (2 * tensor.values[:, 0] + tensor.values[:, 1:].sum(axis=1)) / 6
+        valid = ~np.isnan(tensor.values).any(axis=1)
+        np.testing.assert_allclose(tensor.mean(weights=weights)[valid], expected[valid])
+
+    def test_spread(self, tensor):
+        spread = tensor.spread()
+        hr = tensor.stats.index("HR")
+        assert spread[0, hr] == pytest.approx(np.nanstd(tensor.values[0, :, hr], ddof=1))
+
+    def test_points_and_par_match_long_format(self, tensor):
+        points = tensor.points(StatCategory.BATTING, SCORING, use_stat_proxies=True)
+        par = tensor.points_above_replacement(points, ROSTER)
+
+        long = tensor.to_long()
+        expected_points = calculate_points(long, StatCategory.BATTING, SCORING, use_stat_proxies=True)
+        long["Points"] = expected_points
+        expected_par = calculate_points_above_replacement(long, ROSTER)
+
+        result = tensor.to_long({"Points": points, "PAR": par})
+        np.testing.assert_allclose(result["Points"], expected_points)
+        np.testing.assert_allclose(result["PAR"], expected_par)
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fantasybaseball.lineup import assign_slots, slot_types
+from fantasybaseball.trades import TeamArrays, TradeEvaluator
+
+ROSTER = {"positions": {"C": 1, "1B": 1, "2B": 1, "SS": 1, "CI": 1, "MI": 1, "OF": 2, "UTIL": 1, "P": 3, "bench": 3}}
+POSITIONS = ["C", "1B", "2B", "SS", "3B", "OF", "1B/OF", "2B/SS", "C/1B", "P", "P", "OF"]
+
+
+def _players(teams=2, per_team=12, seed=0):
+    rng = np.random.default_rng(seed)
+    count = teams * per_team
+    return pd.DataFrame(
+        {
+            "Name": [f"Player {i}" for i in range(count)],
+            "Position": rng.choice(POSITIONS, count),
+            "Points": rng.uniform(100.0, 600.0, count).round(1),
+            "ContractValue": rng.uniform(-10.0, 30.0, count).round(1),
+            "Status": np.repeat([f"Team {t + 1}" for t in range(teams)], per_team),
+        }
+    )
+
+
+def _lineup_points(points, eligibility):
+    _, accepts, capacities = slot_types(ROSTER["positions"], include_bench=False)
+    return points[assign_slots(points, eligibility, accepts, capacities) >= 0].sum()
+
+
+def _traded_points(evaluator, team, gives, partner, gets):
+    own, other = evaluator.teams[team], evaluator.teams[partner]
+    keep = np.setdiff1d(np.arange(len(own)), gives)
+    points = np.concatenate([own.points[keep], other.points[list(gets)]])
+    eligibility = np.concatenate([own.eligibility[keep], other.eligibility[list(gets)]])
+    return _lineup_points(points, eligibility)
+
+
+class TestTeamArrays:
+    def test_sorted_by_points(self):
+        players = pd.DataFrame({"Name": ["a", "b"], "Position": ["C", "P"], "Points": [1.0, 2.0]})
+
+        arrays = TeamArrays.from_players(players)
+
+        assert arrays.names.tolist() == ["b", "a"]
+        assert np.isnan(arrays.contract_value).all()
+
+
+class TestTradeEvaluator:
+    def test_baseline_matches_assignment(self):
+        evaluator = TradeEvaluator(_players(), ROSTER)
+
+        for team, arrays in evaluator.teams.items():
+            assert evaluator.baseline[team] == pytest.approx(_lineup_points(arrays.points, arrays.eligibility))
+
+    def test_free_agents_are_not_on_teams(self):
+        players = _players()
+        players.loc[0, "Status"] = "FA"
+
+        evaluator = TradeEvaluator(players, ROSTER)
+
+        assert sorted(evaluator.teams) == ["Team 1", "Team 2"]
+        assert len(evaluator.teams["Team 1"]) == 11
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_points_change_matches_assignment(self, seed):
+        evaluator = TradeEvaluator(_players(seed=seed), ROSTER, chunk_size=7)
+
+        trades = evaluator.enumerate_trades("Team 1", "Team 2", sizes=[(1, 1), (2, 1), (1, 2), (2, 2)])
+
+        rng = np.random.default_rng(seed)
+        names = {team: list(arrays.names) for team, arrays in evaluator.teams.items()}
+        for i in rng.choice(len(trades), 50, replace=False):
+            trade = trades.iloc[i]
+            gives = [names["Team 1"].index(n) for n in trade["Gives"].split(" + ")]
+            gets = [names["Team 2"].index(n) for n in trade["Gets"].split(" + ")]
+            expected = _traded_points(evaluator, "Team 1", gives, "Team 2", gets) - evaluator.baseline["Team 1"]
+            partner = _traded_points(evaluator, "Team 2", gets, "Team 1", gives) - evaluator.baseline["Team 2"]
+            assert trade["PointsChange"] == pytest.approx(expected, abs=0.01)
+            assert trade["PartnerPointsChange"] == pytest.approx(partner, abs=0.01)
+
+    def test_enumerates_every_trade_sorted_by_worst_side(self):
+        evaluator = TradeEvaluator(_players(), ROSTER)
+
+        trades = evaluator.enumerate_trades("Team 1", "Team 2")
+
+        assert len(trades) == 12 * 12 + 66 * 12 * 2 + 66 * 66
+        worst_side = np.minimum(trades["PointsChange"], trades["PartnerPointsChange"])
+        assert (np.diff(worst_side) <= 0).all()
+
+    def test_contract_value_change(self):
+        players = _players()
+        evaluator = TradeEvaluator(players, ROSTER)
+        a, b = evaluator.teams["Team 1"], evaluator.teams["Team 2"]
+
+        trades = evaluator.evaluate("Team 1", "Team 2", [(0, 1), (2,)], [(3,), (0, 4)])
+
+        assert trades["Gives"].tolist() == [f"{a.names[0]} + {a.names[1]}", a.names[2]]
+        expected = [
+            b.contract_value[3] - a.contract_value[[0, 1]].sum(),
+            b.contract_value[[0, 4]].sum() - a.contract_value[2],
+        ]
+        assert trades["ContractValueChange"].tolist() == pytest.approx(expected, abs=0.01)
+        assert (trades["PartnerContractValueChange"] == -trades["ContractValueChange"]).all()
+
+    def test_unusable_player_changes_nothing(self):
+        players = _players()
+        players.loc[players["Status"] == "Team 2", "Position"] = "X"
+        evaluator = TradeEvaluator(players, ROSTER)
+
+        trades = evaluator.evaluate("Team 1", "Team 2", [()], [(0,)])
+
+        assert trades.loc[0, "PointsChange"] == 0.0
@@ -2,7 +2,11 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from fantasybaseball.valuation import calculate_auction_values, calculate_available_budget
+from fantasybaseball.valuation import (
+    calculate_auction_value_grid,
+    calculate_auction_values,
+    calculate_available_budget,
+)
 
 
 class TestCalculateAuctionValues:
@@ -151,6 +155,52 @@ class TestCalculateAuctionValues:
         assert pit_default.values == pytest.approx(pit_explicit.values)
 
 
+class TestCalculateAuctionValueGrid:
+    @pytest.fixture
+    def sample_data(self):
+        bat = pd.DataFrame(
+            {
+                "ProjectionSource": ["steamer", "zipsdc", "steamer", "zipsdc"],
+                "PAR": [50.0, 45.0, -10.0, np.nan],
+            },
+            index=[5, 6, 7, 8],
+        )
+        pit = pd.DataFrame({"ProjectionSource": ["zipsdc", "steamer"], "PAR": [40.0, 20.0]})
+        roster = {"teams": 10, "positions": {"C": 1, "P": 1, "bench": 1}}
+        salary = {"cap": 260, "minimum": 1, "minors_pct": 0.1}
+        return bat, pit, roster, salary
+
+    def test_each_setting_matches_single_run(self, sample_data):
+        bat, pit, roster, salary = sample_data
+        bat_mask = pd.Series([False, True, True, True], index=bat.index)
+
+        bat_grid, pit_grid = calculate_auction_value_grid(
+            bat, pit, roster, salary, [1.0, 1.5, 2.0], [200, 260], [0.0, 0.2], bat_pool_mask=bat_mask
+        )
+
+        assert bat_grid.shape == (4, 12)
+        assert list(bat_grid.index) == [5, 6, 7, 8]
+        for power_factor, cap, minors_pct in bat_grid.columns:
+            setting = dict(salary, cap=cap, minors_pct=minors_pct)
+            bat_values, pit_values = calculate_auction_values(
+                bat, pit, roster, setting, power_factor, bat_pool_mask=bat_mask
+            )
+            pd.testing.assert_series_equal(
+                bat_grid[(power_factor, cap, minors_pct)], bat_values, check_names=False
+            )
+            pd.testing.assert_series_equal(
+                pit_grid[(power_factor, cap, minors_pct)], pit_values, check_names=False
+            )
+
+    def test_defaults_to_league_settings(self, sample_data):
+        bat, pit, roster, salary = sample_data
+        bat_grid, _ = calculate_auction_value_grid(bat, pit, roster, salary)
+        bat_values, _ = calculate_auction_values(bat, pit, roster, salary)
+
+        assert list(bat_grid.columns) == [(1.0, 260, 0.1)]
+        pd.testing.assert_series_equal(bat_grid.iloc[:, 0], bat_values, check_names=False)
+
+
 class TestCalculateAvailableBudget:
     def test_basic_budget_calculation(self):
         league_export = pd.DataFrame({